@@ -8,20 +8,47 @@ This module provides:
 - Screen-aware question/answer handling
 """
 import asyncio
+import contextlib
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
+import re
 import threading
 import time
+import weakref
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, cast
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Any, Tuple, cast
 from dataclasses import dataclass, asdict
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from .config import Config
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 from .knowledge_base import KnowledgeBase
 from .transcription import TranscriptionService
 from .summarization import SummarizationService
+from .response_cache import ResponseCache
 
 # Import ProfileManager for resume context
 try:
@@ -50,10 +77,311 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Keyword tables shared by the per-entry heuristics and the batched rescoring pass
+_POSITIVE_WORDS = ("good", "great", "excellent", "perfect", "love", "like")
+_NEGATIVE_WORDS = ("bad", "terrible", "hate", "problem", "issue", "confused")
+_IMPORTANT_KEYWORDS = ("decision", "action", "todo", "deadline", "important", "critical")
+_SENTIMENT_LABELS = {-1: "negative", 0: "neutral", 1: "positive"}
+
+# Interview levels that get the senior system prompt and token budget
+_SENIOR_LEVELS = frozenset(("IC6", "IC7", "E5", "E6", "E7"))
+
+# (context key, value) pairs that request an expert-level answer
+_EXPERT_TRIGGERS = (
+    ("type", "senior_engineer_response"),
+    ("expertise_level", "senior"),
+    ("response_style", "experienced_professional"),
+    ("context", "senior_engineer_interview"),
+)
+
+# Greetings/small talk that route a prompt to the casual system prompt (single scan, no lower() copy)
+_CASUAL_RE = re.compile(
+    r"\b(?:how are you|hello|hi|good (?:morning|afternoon)|how you doing)\b", re.IGNORECASE
+)
+
+# Persisted resume text, shared across sessions
+_RESUME_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'user_resume.txt')
+
+# Minimum seconds between partial overlay refreshes while a response streams
+_PARTIAL_UPDATE_INTERVAL = 0.25
+
+
+# Static tail of the generic interview prompt built by _build_interview_prompt
+_INTERVIEW_RESPONSE_RULES = (
+    "1. Demonstrates senior technical expertise\n"
+    "2. Uses specific examples from your experience\n"
+    "3. Shows leadership and impact\n"
+    "4. Addresses scalability and architecture concerns\n"
+    "5. Is confident but not arrogant\n"
+    "6. Stays under 400 words (2 minutes speaking time)\n"
+)
+
+# System prompt templates for _generate_ai_response, rendered via _render_prompt
+_PROFILE_SECTION_RESUME_TMPL = """
+YOUR ACTUAL PROFESSIONAL BACKGROUND (from your resume):
+{resume}
+
+Based on the above resume information, you are answering interview questions as yourself with these exact experiences and achievements.
+"""
+
+_PROFILE_SECTION_PROFILE_TMPL = """
+YOUR PROFESSIONAL IDENTITY:
+- Name: {name}
+- Current Role: {current_role}
+- Experience: {experience_years} years in the industry
+- Current Company: {company}
+- Industry: {industry}
+
+YOUR TECHNICAL EXPERTISE:
+- Core Technologies: {core_skills}
+- Additional Skills: {additional_skills}
+
+YOUR KEY PROJECTS & ACCOMPLISHMENTS:
+{projects}
+
+YOUR ACHIEVEMENTS:
+{achievements}
+
+RESUME HIGHLIGHTS:
+{resume_summary}
+"""
+
+_PROFILE_SECTION_GENERIC = """
+YOUR PROFESSIONAL IDENTITY:
+- You are a Senior Software Engineer with 8+ years of experience
+- Currently working at a major tech company in a senior IC role
+- Strong background in full-stack development and system architecture
+- Proven track record of technical leadership and mentoring
+
+YOUR EXPERTISE:
+- Full-stack development (React, Node.js, Python, Java)
+- System design and architecture
+- Cloud platforms (AWS/Azure/GCP)
+- Database design and optimization
+- DevOps and CI/CD practices
+"""
+
+_SYSTEM_PROMPT_PERSONALIZED_TMPL = """
+You are answering an interview question as the specific person described below. This is a SENIOR ENGINEER ({interview_level}) level interview.
+
+{profile_section}
+
+CRITICAL INSTRUCTIONS:
+- You ARE this person - respond in first person as them
+- Use your exact background, experience, and achievements listed above
+- Reference your specific companies, projects, and technologies
+- Include real metrics and accomplishments from your career
+- Sound authentic and human - like this senior engineer would actually speak
+- Never mention AI, assistance, or that you're generating a response
+- Demonstrate {interview_level} level thinking: architectural decisions, trade-offs, business impact
+- Show depth appropriate for senior engineering roles (8+ years experience)
+
+FOR DIFFERENT QUESTION TYPES:
+
+SYSTEM DESIGN: Show architectural thinking, scalability considerations, real-world trade-offs. Reference actual systems you've built from your experience. Discuss CAP theorem, consistency patterns, distributed systems challenges based on your background.
+
+CODING: Demonstrate proficiency with your actual tech stack listed above. Discuss real problems you've solved. Show understanding of production concerns, performance optimization, code quality at scale.
+
+BEHAVIORAL: Use specific examples from your years of experience. Show leadership, collaboration, problem-solving. Reference actual challenges and how you overcame them. Demonstrate mentoring and strategic thinking.
+
+PRODUCT/BUSINESS: Connect technical decisions to business outcomes. Show understanding of stakeholder needs. Reference measurable impact you've delivered. Discuss trade-offs between technical debt and feature velocity.
+
+TECHNICAL DEPTH: If asked about specific technologies in your background, demonstrate deep understanding appropriate for {interview_level} level including architecture patterns, performance considerations, and production experience.
+
+Answer AS this person based on their actual senior-level experience detailed above.
+"""
+
+_SYSTEM_PROMPT_SENIOR_TMPL = """
+You are a SENIOR SOFTWARE ENGINEER (IC6/IC7/E5/E6/E7 level) with 10+ years of experience across the full technology stack. You've built systems at massive scale, led engineering teams, architected complex distributed systems, and have deep practical knowledge.
+
+THIS IS A SENIOR-LEVEL TECHNICAL INTERVIEW - DEMONSTRATE EXPERT-LEVEL THINKING:
+
+CORE EXPERTISE AREAS:
+• **Distributed Systems**: Microservices, event-driven architecture, CAP theorem, eventual consistency
+• **Scalability**: Systems handling 100M+ requests/day, auto-scaling, load balancing strategies  
+• **Database Design**: ACID properties, sharding strategies, replication, database optimization
+• **System Architecture**: Design patterns, architectural trade-offs, technical debt management
+• **Performance**: Profiling, optimization, caching strategies, CDN usage
+• **Security**: Authentication/authorization, OWASP top 10, secure coding practices
+• **DevOps**: CI/CD pipelines, infrastructure as code, monitoring, observability
+• **Leadership**: Technical mentoring, code reviews, architectural decision making
+
+RESPONSE REQUIREMENTS:
+✅ **Technical Depth**: Go beyond surface-level answers. Explain WHY and HOW, not just WHAT
+✅ **Real-World Experience**: Reference specific scenarios like "At scale, I've seen..."
+✅ **Trade-offs Discussion**: Always mention pros/cons and alternative approaches
+✅ **Business Impact**: Connect technical decisions to business outcomes
+✅ **Code Examples**: When relevant, provide code snippets or pseudocode
+✅ **Architecture Details**: Include diagrams concepts, data flow, system boundaries
+✅ **Scalability Considerations**: Discuss bottlenecks, horizontal vs vertical scaling
+✅ **Comprehensive Coverage**: Address multiple aspects of the question
+
+INTERVIEW LEVEL: {interview_level}
+OPTIMIZATION: {optimization}
+
+Context: {context_type}
+Platform: {platform}
+
+FOR JAVA QUESTIONS SPECIFICALLY:
+- JVM internals (heap, stack, garbage collection algorithms)
+- Spring Boot ecosystem and best practices
+- Concurrency and multithreading (ExecutorService, CompletableFuture)
+- Performance tuning and JVM optimization
+- Enterprise patterns (dependency injection, AOP, transactions)
+- Integration with databases, messaging systems, cloud services
+
+Respond with the depth and sophistication expected at IC6/IC7 level.
+"""
+
+_SYSTEM_PROMPT_CASUAL_TMPL = """
+You are a Senior Software Engineer with 20+ years of experience across the full technology stack. You've built systems at scale, led engineering teams, and have deep practical knowledge.
+
+IMPORTANT INSTRUCTIONS:
+- Respond as if you're in an interview or professional meeting
+- Share specific experiences and lessons learned over 20 years
+- Mention real technologies, frameworks, and patterns you've used
+- Give practical, actionable advice based on experience
+- Include trade-offs and nuances - avoid generic answers
+- Sound confident but humble, like a senior engineer sharing knowledge
+- Reference actual challenges you've solved
+- Mention specific numbers/metrics when relevant (e.g., "systems handling 10M+ requests")
+
+PERSONALIZATION CONTEXT:
+- If user resume data is available, tailor responses to match their background
+- Reference their actual work experience, skills, and projects when relevant
+- Frame answers as if these are YOUR experiences from the resume
+- Make behavioral answers specific to their career progression
+- For technical questions, reference technologies they've actually used
+
+Context: {context_type}
+Platform: {platform}
+User Resume Data: {resume_context}
+
+Technical expertise areas:
+- Full-stack development (Frontend: React, Angular, Vue | Backend: Node.js, Python, Java, Go)
+- Database design (SQL: PostgreSQL, MySQL | NoSQL: MongoDB, Redis, Cassandra)
+- Cloud platforms (AWS, Azure, GCP) and DevOps (Docker, Kubernetes, CI/CD)
+- System architecture (Microservices, API design, Event-driven architecture)
+- Performance optimization and scaling
+- Team leadership and engineering culture
+
+RESPONSE GUIDELINES:
+1. For behavioral questions: Use experiences from the resume if available
+2. For technical questions: Reference technologies from their skill set
+3. For coding questions: Mention languages/frameworks they know
+4. For system design: Build on their actual project experience
+5. Always sound like you're speaking from personal experience
+
+Respond as this experienced engineer would in a real conversation.
+"""
+
+_SYSTEM_PROMPT_DEFAULT_TMPL = """
+You are a Senior Software Engineer with 20+ years of practical experience. 
+Context: {context_type}
+Platform: {platform}
+
+Provide helpful, experienced advice based on 20 years in the industry. Be practical and specific.
+"""
+
+# (max_tokens, temperature) per response mode in _generate_ai_response
+_GEN_PARAMS = {
+    "senior": (800, 0.3),        # precise technical answers; 1200 tokens when comprehensive
+    "personalized": (1000, 0.4),
+    "casual": (150, 0.8),        # brief, natural small talk
+    "expert": (600, 0.7),
+    "default": (400, 0.7),
+}
+
+_PROMPT_TEMPLATES = {
+    "resume": _PROFILE_SECTION_RESUME_TMPL,
+    "profile": _PROFILE_SECTION_PROFILE_TMPL,
+    "personalized": _SYSTEM_PROMPT_PERSONALIZED_TMPL,
+    "senior": _SYSTEM_PROMPT_SENIOR_TMPL,
+    "casual": _SYSTEM_PROMPT_CASUAL_TMPL,
+    "default": _SYSTEM_PROMPT_DEFAULT_TMPL,
+}
+
+
+def _prompt_fields(**fields: Any) -> Tuple[Tuple[str, str], ...]:
+    """Normalise template fields into a hashable, order-independent cache key."""
+    return tuple(sorted((name, str(value)) for name, value in fields.items()))
+
+
+@lru_cache(maxsize=64)
+def _render_prompt(branch: str, fields: Tuple[Tuple[str, str], ...]) -> str:
+    """Render a prompt template once per distinct set of field values."""
+    return _PROMPT_TEMPLATES[branch].format_map(dict(fields))
+
+# Token budgets for resume text embedded in prompts (previously 8000/4000 character slices)
+_RESUME_PROMPT_TOKENS = 2000
+_RESUME_PROFILE_TOKENS = 1000
+
+
+@lru_cache(maxsize=8)
+def _encoding_for_model(model: str):
+    """Return the tiktoken encoding for ``model`` (None when tiktoken is unusable)."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            return None
+    except Exception:
+        # Encoder files could not be loaded (e.g. offline); fall back to chars
+        return None
+
+
+@lru_cache(maxsize=16)
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut ``text`` to at most ``max_tokens`` tokens of the configured model.
+
+    Falls back to a four-characters-per-token slice when no encoder is available.
+    """
+    encoding = _encoding_for_model(Config.OPENAI_MODEL)
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _dumps_indented(value: Any) -> str:
+    """Serialize prompt context as 2-space indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles these
+    return json.dumps(value, indent=2)
+
+
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time as ISO-8601, reusing the string within the same second."""
+    global _iso_cache
+    second = int(time.time())
+    cached = _iso_cache
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).isoformat())
+        _iso_cache = cached
+    return cached[1]
+
 
 @dataclass
 class ConversationEntry:
     """Single conversation entry with full context."""
+    # Sessions accumulate thousands of entries; slots drop the per-instance __dict__
+    __slots__ = (
+        "timestamp", "meeting_id", "speaker", "content",
+        "type", "context", "sentiment", "importance",
+    )
+
     timestamp: str
     meeting_id: str
     speaker: str
@@ -78,6 +406,7 @@ class MeetingSession:
     decisions: List[str]
     screen_sharing: bool
     topics_discussed: List[str]
+    ai_response_count: int = 0  # conversations spoken by the assistant, kept by add_conversation
 
 
 class ConversationMemory:
@@ -119,7 +448,10 @@ class ConversationMemory:
     def add_conversation(self, session_id: str, entry: ConversationEntry):
         """Add conversation entry to session."""
         if session_id in self.sessions:
-            self.sessions[session_id].conversations.append(entry)
+            session = self.sessions[session_id]
+            session.conversations.append(entry)
+            if entry.speaker == "ai_assistant":
+                session.ai_response_count += 1
 
             # Add to knowledge base for long-term memory when available
             if self.kb:
@@ -149,6 +481,51 @@ class ConversationMemory:
             "action_items": session.action_items
         }
     
+    def rescore_session(self, session_id: str) -> Dict[str, Any]:
+        """Recompute sentiment/importance for every entry of a session in one batched pass.
+
+        Contents are lowered once into a flat list and each keyword is tested
+        against the whole column, so the cost is only paid when analytics are
+        requested rather than on every conversation entry.
+        """
+        session = self.sessions.get(session_id)
+        if session is None or not session.conversations:
+            return {}
+
+        contents = [c.content.lower() for c in session.conversations]
+        count = len(contents)
+
+        if NUMPY_AVAILABLE:
+            def _hits(keywords):
+                total = np.zeros(count, dtype=np.int8)
+                for keyword in keywords:
+                    total += np.fromiter((keyword in text for text in contents), dtype=np.int8, count=count)
+                return total
+
+            sentiment = np.sign(_hits(_POSITIVE_WORDS) - _hits(_NEGATIVE_WORDS)).astype(np.int8)
+            importance = np.minimum(10, 5 + 2 * _hits(_IMPORTANT_KEYWORDS)).astype(np.int8)
+            sentiment_codes = sentiment.tolist()
+            importance_scores = importance.tolist()
+        else:
+            sentiment_codes = []
+            importance_scores = []
+            for text in contents:
+                positive = sum(1 for word in _POSITIVE_WORDS if word in text)
+                negative = sum(1 for word in _NEGATIVE_WORDS if word in text)
+                sentiment_codes.append((positive > negative) - (positive < negative))
+                hits = sum(1 for keyword in _IMPORTANT_KEYWORDS if keyword in text)
+                importance_scores.append(min(10, 5 + 2 * hits))
+
+        for entry, code, score in zip(session.conversations, sentiment_codes, importance_scores):
+            entry.sentiment = _SENTIMENT_LABELS[code]
+            entry.importance = int(score)
+
+        return {
+            "entries": count,
+            "sentiment": {label: sentiment_codes.count(code) for code, label in _SENTIMENT_LABELS.items()},
+            "average_importance": sum(importance_scores) / count,
+        }
+
     def search_conversation_history(self, query: str, limit: int = 5) -> List[Dict]:
         """Search all conversation history."""
         if not self.kb:
@@ -161,6 +538,13 @@ class AIAssistant:
     
     def __init__(self):
         self.mock_mode = False
+        # One sync client per assistant so every call shares its HTTP connection pool;
+        # async clients are created per event loop (see ``async_openai``)
+        self.openai_client: Optional[OpenAI] = None
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_clients_lock = threading.Lock()
         if not Config.OPENAI_API_KEY:
             # Enter mock mode so the app can still start locally
             self.mock_mode = True
@@ -168,6 +552,12 @@ class AIAssistant:
         else:
             self.openai_client = OpenAI(api_key=Config.OPENAI_API_KEY)
         self.memory = ConversationMemory()
+        self.response_cache = ResponseCache(
+            max_entries=Config.RESPONSE_CACHE_SIZE,
+            similarity_threshold=Config.RESPONSE_CACHE_SIMILARITY,
+            cache_dir=Config.RESPONSE_CACHE_DIR,
+            max_rows=Config.RESPONSE_CACHE_ROWS,
+        )
         self.transcription = TranscriptionService()
         self.summarization = SummarizationService()
         
@@ -210,10 +600,46 @@ class AIAssistant:
         self.interaction_mode = "private"  # private, public, silent
         self.is_screen_sharing = False
         
+        # Resume text held in memory; the file on disk is only consulted once
+        self.resume_context = ""
+        self._resume_checked = False
+        self._resume_len = 0
+        
+        # Digest of the last resume written to disk, used to skip no-op saves
+        self._last_resume_hash: Optional[bytes] = None
+        
+        # Profile snapshot version; derived prompt snippets are memoized per version
+        self._profile_version = 0
+        self._last_profile_context: Optional[Dict[str, Any]] = None
+        self._profile_snippet_cache: Tuple[int, str] = (-1, "")
+        
+        # get_user_profile_context result, keyed on (_profile_ctx_version, ProfileManager.version)
+        self._profile_ctx_version = 0
+        self._profile_ctx_cache: Tuple[Optional[Tuple[int, Any]], Optional[Dict[str, Any]]] = (None, None)
+        
         # Interview level configuration
         self.interview_level = "IC6"  # Default to IC6 level
         self.target_company = None  # Will be set based on context
     
+    @property
+    def async_openai(self) -> Optional[AsyncOpenAI]:
+        """AsyncOpenAI client bound to the running event loop.
+
+        httpx connection pools belong to the loop that opened them, and the
+        assistant is called from several loops (the service loop, per-thread
+        recording loops, short-lived loops in profile_manager), so each loop
+        gets its own client; it is dropped when the loop is garbage collected.
+        """
+        if self.openai_client is None:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+                self._async_clients[loop] = client
+            return client
+
     def _detect_interview_level(self, profile: Dict[str, Any]) -> str:
         """Auto-detect appropriate interview level based on profile data."""
         try:
@@ -226,7 +652,6 @@ class AIAssistant:
             years = 0
             if isinstance(experience_years, str) and experience_years:
                 # Extract numbers from experience years string
-                import re
                 numbers = re.findall(r'\d+', experience_years)
                 if numbers:
                     years = int(numbers[0])
@@ -349,7 +774,7 @@ class AIAssistant:
             
             # Create AI conversation entry
             ai_entry = ConversationEntry(
-                timestamp=datetime.now().isoformat(),
+                timestamp=_now_iso(),
                 meeting_id=session_id,
                 speaker="ai_assistant",
                 content=ai_response,
@@ -376,7 +801,7 @@ class AIAssistant:
             prompt = f"""
             Based on this conversation and context, should the AI ask any clarifying questions?
             
-            Context: {json.dumps(context, indent=2)}
+            Context: {_dumps_indented(context)}
             Recent Message: "{transcript}"
             
             If yes, provide 1-2 brief, relevant questions. If no, respond with "NO_QUESTIONS".
@@ -398,7 +823,7 @@ class AIAssistant:
                 
                 # Create AI question entry
                 question_entry = ConversationEntry(
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=_now_iso(),
                     meeting_id=session_id,
                     speaker="ai_assistant",
                     content=questions,
@@ -463,7 +888,7 @@ class AIAssistant:
         "{transcript}"
         
         SESSION CONTEXT:
-        {json.dumps(context, indent=2)}
+        {_dumps_indented(context)}
         
         RELEVANT HISTORY:
         {[doc['content'][:200] + "..." for doc in relevant_docs[:3]]}
@@ -569,19 +994,16 @@ class AIAssistant:
         return {
             "screen_sharing": self.is_screen_sharing,
             "interaction_mode": self.interaction_mode,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "pending_questions": len(self.pending_questions)
         }
     
     def _analyze_sentiment(self, text: str) -> str:
         """Analyze sentiment of conversation."""
         # Simple sentiment analysis
-        positive_words = ["good", "great", "excellent", "perfect", "love", "like"]
-        negative_words = ["bad", "terrible", "hate", "problem", "issue", "confused"]
-        
         text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        positive_count = sum(1 for word in _POSITIVE_WORDS if word in text_lower)
+        negative_count = sum(1 for word in _NEGATIVE_WORDS if word in text_lower)
         
         if positive_count > negative_count:
             return "positive"
@@ -593,12 +1015,10 @@ class AIAssistant:
     def _calculate_importance(self, text: str) -> int:
         """Calculate importance score (1-10)."""
         # Simple importance calculation
-        important_keywords = ["decision", "action", "todo", "deadline", "important", "critical"]
-        
         text_lower = text.lower()
         importance = 5  # Base importance
         
-        for keyword in important_keywords:
+        for keyword in _IMPORTANT_KEYWORDS:
             if keyword in text_lower:
                 importance += 2
                 
@@ -613,14 +1033,37 @@ class AIAssistant:
         else:
             logger.warning(f"⚠️ Invalid interview level: {level}. Using default IC6")
             self.interview_level = "IC6"
+        self._invalidate_profile_context()
     
     def set_target_company(self, company: str):
         """Set target company for company-specific interview preparation."""
         self.target_company = company
+        self._invalidate_profile_context()
         logger.info(f"🏢 Target company set to: {company}")
     
     def get_user_profile_context(self) -> Dict[str, Any]:
-        """Get user profile context for personalized responses."""
+        """Get user profile context for personalized responses.
+
+        The context is rebuilt only after a mutator bumps ``_profile_ctx_version``
+        or the ProfileManager saves a new profile version.
+        """
+        key = (self._profile_ctx_version, getattr(self.profile_manager, "version", None))
+        cached_key, cached_context = self._profile_ctx_cache
+        if cached_context is not None and cached_key == key:
+            return cached_context
+        
+        context = self._build_user_profile_context()
+        # Don't pin the degraded context produced when the profile could not be read
+        if context.get("has_profile") or not self.profile_manager:
+            self._profile_ctx_cache = (key, context)
+        return context
+    
+    def _invalidate_profile_context(self):
+        """Force the next get_user_profile_context call to rebuild."""
+        self._profile_ctx_version += 1
+    
+    def _build_user_profile_context(self) -> Dict[str, Any]:
+        """Assemble the profile context dict from the ProfileManager data."""
         if not self.profile_manager:
             return {
                 "has_profile": False,
@@ -646,13 +1089,20 @@ class AIAssistant:
                     "company": profile.get("personal", {}).get("currentCompany", ""),
                     "industry": profile.get("personal", {}).get("industry", "")
                 },
-                "skills": profile.get("skills", {}).get("selected", []),
+                "skills": list(profile.get("skills", {}).get("selected", [])),
                 "key_projects": profile.get("experience", {}).get("keyProjects", ""),
                 "achievements": profile.get("experience", {}).get("achievements", ""),
                 "resume_analyzed": profile.get("resume", {}).get("analyzed", False),
-                "resume_info": profile.get("resume", {}).get("extractedInfo", {})
+                "resume_info": dict(profile.get("resume", {}).get("extractedInfo", {}))
             }
             
+            # Hand back the previous snapshot when nothing changed so memoized
+            # snippets keyed on it stay valid; otherwise start a new version
+            if context == self._last_profile_context:
+                return self._last_profile_context
+            self._profile_version += 1
+            self._last_profile_context = context
+            
             return context
             
         except Exception as e:
@@ -682,7 +1132,7 @@ class AIAssistant:
             self.memory.start_session(session_id, {"participants": []})
 
         entry = ConversationEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=_now_iso(),
             meeting_id=session_id,
             speaker=segment.speaker_id,
             content=segment.transcript,
@@ -741,44 +1191,58 @@ class AIAssistant:
         
         return None
     
-    async def _generate_interview_response(self, question: str) -> str:
-        """Generate AI response for interview question with full context."""
+    async def _generate_interview_response(
+        self, question: str, on_partial: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Generate AI response for interview question with full context.
+
+        When ``on_partial`` is given the completion is streamed and the callback
+        receives the text generated so far as tokens arrive.
+        """
         
+        loop = asyncio.get_running_loop()
+        embedding_task: Optional["asyncio.Future[Optional[List[float]]]"] = None
         try:
-            # Get user profile context
-            profile_context = self.get_user_profile_context()
-            
-            # Build enhanced prompt with interview context
-            prompt = self._build_interview_prompt(question, profile_context)
-            
-            # Generate response with interview-specific settings
-            if self.mock_mode:
+            # Identical (or, with embeddings, near-identical) questions reuse the cached answer
+            scope, cache_key = self._interview_cache_keys(question)
+            ai_response = self.response_cache.get(cache_key)
+            if ai_response is None and Config.RESPONSE_CACHE_SEMANTIC and not self.mock_mode:
+                embedding_task = asyncio.ensure_future(self._embed_question(question))
+                # Only wait on the embedding when there is something to compare it with;
+                # otherwise it runs alongside the completion and is stored for later questions
+                if self.response_cache.has_embeddings(scope):
+                    ai_response = self.response_cache.get_similar(await embedding_task, scope)
+
+            if ai_response is not None:
+                logger.info("♻️ Reusing cached interview response")
+            elif self.mock_mode:
                 ai_response = f"(mock interview answer) For the question: '{question[:80]}', articulate key trade-offs, provide a concise design, and highlight prior experience."
             else:
-                response = self.openai_client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
-                    messages=[
-                        {"role": "system", "content": self._get_system_prompt()},
+                # Get user profile context
+                profile_context = await loop.run_in_executor(None, self.get_user_profile_context)
+                
+                # Build enhanced prompt (company KB lookups) while the system prompt is assembled
+                prompt, system_prompt = await asyncio.gather(
+                    self._build_interview_prompt(question, profile_context),
+                    loop.run_in_executor(None, self._get_system_prompt),
+                )
+                
+                # Generate response with interview-specific settings
+                ai_response = await self._complete_chat(
+                    self.async_openai,
+                    [
+                        {"role": "system", "content": system_prompt},
                         {"role": "user", "content": prompt}
                     ],
                     max_tokens=2000,
                     temperature=0.7,
+                    on_partial=on_partial,
                 )
-                ai_response = (response.choices[0].message.content or "").strip()
+                if ai_response:
+                    embedding = await embedding_task if embedding_task is not None else None
+                    self.response_cache.put(cache_key, ai_response, embedding=embedding, scope=scope)
             
-            # Store conversation entry
-            entry = ConversationEntry(
-                timestamp=datetime.now().isoformat(),
-                meeting_id="interview_session",
-                speaker="ai_assistant",
-                content=ai_response,
-                type="ai_answer",
-                context={"question": question, "interview_level": self.interview_level},
-                sentiment="helpful",
-                importance=8
-            )
-            
-            self.memory.add_conversation("interview_session", entry)
+            await loop.run_in_executor(None, partial(self._record_interview_answer, question, ai_response))
             
             logger.info(f"🤖 Generated {len(ai_response)} character response for interview")
             return ai_response
@@ -786,66 +1250,198 @@ class AIAssistant:
         except Exception as e:
             logger.error(f"❌ Error generating interview response: {e}")
             return f"I'd be happy to discuss {question.lower()}. Could you provide a bit more context about what specific aspect you'd like me to focus on?"
+        finally:
+            # The embedding is only needed when an answer was stored
+            if embedding_task is not None and not embedding_task.done():
+                embedding_task.cancel()
     
-    def _build_interview_prompt(self, question: str, profile_context: Dict) -> str:
+    async def generate_interview_responses_batch(self, questions: List[str]) -> List[str]:
+        """Answer several interview questions with a single chat completion.
+
+        Cached questions are answered locally; the remaining ones are sent in
+        one JSON-mode request. If the batched reply cannot be parsed, each
+        outstanding question falls back to ``_generate_interview_response``.
+        """
+        loop = asyncio.get_running_loop()
+        answers: List[Optional[str]] = []
+        pending: List[int] = []
+        for index, question in enumerate(questions):
+            answers.append(self.response_cache.get(self._interview_cache_keys(question)[1]))
+            if answers[-1] is None:
+                pending.append(index)
+
+        if pending and not self.mock_mode and self.async_openai is not None:
+            batch = [questions[i] for i in pending]
+            background = ""
+            if self.has_resume_context():
+                background = f"RESUME/BACKGROUND:\n{_truncate_tokens(self.resume_context, _RESUME_PROMPT_TOKENS)}\n\n"
+            user_content = (
+                f"{background}Answer each interview question below as the candidate, "
+                f"at {self.interview_level} level and under 400 words per answer.\n"
+                'Return a JSON object of the form {"answers": ["...", ...]} with exactly one '
+                "answer per question, in the same order.\n\n"
+                + json.dumps({"questions": batch})
+            )
+            try:
+                response = await self.async_openai.chat.completions.create(
+                    model=Config.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": self._get_system_prompt()},
+                        {"role": "user", "content": user_content}
+                    ],
+                    max_tokens=min(2000 * len(batch), 8000),
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                )
+                batch_answers = json.loads(response.choices[0].message.content or "{}").get("answers", [])
+                if len(batch_answers) != len(batch):
+                    raise ValueError(f"expected {len(batch)} answers, got {len(batch_answers)}")
+                for index, answer in zip(pending, batch_answers):
+                    answer = str(answer).strip()
+                    scope, cache_key = self._interview_cache_keys(questions[index])
+                    self.response_cache.put(cache_key, answer, scope=scope)
+                    await loop.run_in_executor(
+                        None, partial(self._record_interview_answer, questions[index], answer)
+                    )
+                    answers[index] = answer
+                logger.info(f"🤖 Generated {len(batch)} interview responses in one request")
+            except Exception as e:
+                logger.warning(f"Batched interview generation failed, answering individually: {e}")
+
+        for index, question in enumerate(questions):
+            if answers[index] is None:
+                answers[index] = await self._generate_interview_response(question)
+            elif index not in pending:
+                await loop.run_in_executor(
+                    None, partial(self._record_interview_answer, question, answers[index])
+                )
+
+        return [answer or "" for answer in answers]
+    
+    def _interview_cache_keys(self, question: str) -> Tuple[bytes, bytes]:
+        """Return (scope, key) for caching an interview answer.
+
+        The scope changes with the level, target company, resume, saved profile
+        and company knowledge base, so edits to any of them miss the cache.
+        """
+        profile = self.profile_manager
+        scope = ResponseCache.make_key(
+            self.interview_level, self.target_company or "", self.get_resume_context(),
+            getattr(profile, "version", None),
+            (getattr(profile, "profile_data", None) or {}).get("lastUpdated", ""),
+            getattr(self.company_kb, "version", None),
+        )
+        return scope, ResponseCache.make_key(scope, question.strip().lower())
+    
+    def _record_interview_answer(self, question: str, ai_response: str):
+        """Store an interview answer in conversation memory."""
+        entry = ConversationEntry(
+            timestamp=_now_iso(),
+            meeting_id="interview_session",
+            speaker="ai_assistant",
+            content=ai_response,
+            type="ai_answer",
+            context={"question": question, "interview_level": self.interview_level},
+            sentiment="helpful",
+            importance=8
+        )
+        
+        self.memory.add_conversation("interview_session", entry)
+    
+    async def _embed_question(self, question: str) -> Optional[List[float]]:
+        """Embed a question for the semantic response cache (None when unavailable)."""
+        if self.async_openai is None:
+            return None
+        try:
+            response = await self.async_openai.embeddings.create(
+                input=question,
+                model=Config.EMBEDDING_MODEL
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Question embedding failed, semantic cache skipped: {e}")
+            return None
+    
+    def _profile_snippet(self, profile_context: Dict[str, Any]) -> str:
+        """Return the candidate-background lines for the interview prompt.
+
+        The snippet is memoized per profile version, so successive questions
+        against an unchanged profile skip the slicing and joining.
+        """
+        cacheable = profile_context is self._last_profile_context
+        cached_version, cached_snippet = self._profile_snippet_cache
+        if cacheable and cached_version == self._profile_version:
+            return cached_snippet
+        
+        lines = []
+        personal = profile_context.get("personal", {})
+        if personal.get("current_role"):
+            lines.append(f"- Current Role: {personal['current_role']}\n")
+        if personal.get("experience_years"):
+            lines.append(f"- Experience: {personal['experience_years']} years\n")
+        if personal.get("company"):
+            lines.append(f"- Current Company: {personal['company']}\n")
+        
+        skills = profile_context.get("skills", [])
+        if skills:
+            lines.append(f"- Key Skills: {', '.join(skills[:5])}\n")
+        
+        if profile_context.get("key_projects"):
+            lines.append(f"- Key Projects: {profile_context['key_projects'][:200]}...\n")
+        
+        snippet = "".join(lines)
+        if cacheable:
+            self._profile_snippet_cache = (self._profile_version, snippet)
+        return snippet
+    
+    async def _build_interview_prompt(self, question: str, profile_context: Dict) -> str:
         """Build interview-specific prompt with context."""
         
-        # First check if we have company-specific knowledge
+        # Run the company KB lookups concurrently rather than one after the other
+        tips: Optional[Dict[str, List[str]]] = None
         if self.company_kb and self.target_company:
-            company_prompt = self.company_kb.generate_company_specific_response(
-                self.target_company, question, profile_context
+            loop = asyncio.get_running_loop()
+            company_prompt, tips = await asyncio.gather(
+                loop.run_in_executor(None, partial(
+                    self.company_kb.generate_company_specific_response,
+                    self.target_company, question, profile_context
+                )),
+                loop.run_in_executor(
+                    None, partial(self.company_kb.get_interview_tips, self.target_company, "senior")
+                ),
             )
+            # First check if we have company-specific knowledge
             if company_prompt:
                 return company_prompt
         
         # Fallback to generic interview prompt
-        prompt = f"INTERVIEW QUESTION: {question}\n\n"
+        parts = [f"INTERVIEW QUESTION: {question}\n\n"]
         
         # Add resume context if available
         if self.has_resume_context():
-            prompt += "ANSWER AS THE CANDIDATE with this background:\n"
-            prompt += f"RESUME/BACKGROUND:\n{self.get_resume_context()[:8000]}\n\n"  # Increased to 8000 chars
+            parts.append("ANSWER AS THE CANDIDATE with this background:\n")
+            parts.append(f"RESUME/BACKGROUND:\n{_truncate_tokens(self.resume_context, _RESUME_PROMPT_TOKENS)}\n\n")
         elif profile_context.get("has_profile"):
-            prompt += "ANSWER AS THE CANDIDATE with the following background:\n"
-            personal = profile_context.get("personal", {})
-            
-            if personal.get("current_role"):
-                prompt += f"- Current Role: {personal['current_role']}\n"
-            if personal.get("experience_years"):
-                prompt += f"- Experience: {personal['experience_years']} years\n"
-            if personal.get("company"):
-                prompt += f"- Current Company: {personal['company']}\n"
-            
-            skills = profile_context.get("skills", [])
-            if skills:
-                prompt += f"- Key Skills: {', '.join(skills[:5])}\n"
-            
-            if profile_context.get("key_projects"):
-                prompt += f"- Key Projects: {profile_context['key_projects'][:200]}...\n"
+            parts.append("ANSWER AS THE CANDIDATE with the following background:\n")
+            parts.append(self._profile_snippet(profile_context))
         
-        prompt += f"\nProvide a {self.interview_level} level response that:\n"
-        prompt += "1. Demonstrates senior technical expertise\n"
-        prompt += "2. Uses specific examples from your experience\n"
-        prompt += "3. Shows leadership and impact\n"
-        prompt += "4. Addresses scalability and architecture concerns\n"
-        prompt += "5. Is confident but not arrogant\n"
-        prompt += "6. Stays under 400 words (2 minutes speaking time)\n"
+        parts.append(f"\nProvide a {self.interview_level} level response that:\n")
+        parts.append(_INTERVIEW_RESPONSE_RULES)
         
         if self.target_company:
-            prompt += f"7. Is tailored for {self.target_company}'s interview style\n"
+            parts.append(f"7. Is tailored for {self.target_company}'s interview style\n")
             
             # Add company-specific tips if available
-            if self.company_kb:
-                tips = self.company_kb.get_interview_tips(self.target_company, "senior")
-                if tips:
-                    prompt += "8. Consider these company-specific points:\n"
-                    for category, tip_list in tips.items():
-                        if category == "behavioral" and "behavioral" in question.lower():
-                            prompt += f"   - {tip_list[0]}\n"
-                        elif category == "technical" and any(word in question.lower() for word in ["design", "implement", "code", "architecture"]):
-                            prompt += f"   - {tip_list[0]}\n"
-        
-        return prompt
+            if tips:
+                parts.append("8. Consider these company-specific points:\n")
+                question_lower = question.lower()
+                for category, tip_list in tips.items():
+                    if category == "behavioral" and "behavioral" in question_lower:
+                        parts.append(f"   - {tip_list[0]}\n")
+                    elif category == "technical" and any(word in question_lower for word in ["design", "implement", "code", "architecture"]):
+                        parts.append(f"   - {tip_list[0]}\n")
+        
+        return "".join(parts)
     
     def set_interaction_mode(self, mode: str):
         """Set interaction mode: private, public, or silent."""
@@ -866,14 +1462,12 @@ class AIAssistant:
             
         session = self.memory.sessions[session_id]
         
-        # Generate AI summary
-        conversations_text = "\n".join([
-            f"{c.speaker}: {c.content}" for c in session.conversations
-        ])
+        # Generate AI summary, streaming the transcript lines instead of joining them
+        conversation_lines = (f"{c.speaker}: {c.content}" for c in session.conversations)
         
         from .summarization import summarize_transcript as _summarize_transcript
         summary = _summarize_transcript({
-            "text": conversations_text,
+            "text": conversation_lines,
             "segments": []
         })
         
@@ -881,35 +1475,38 @@ class AIAssistant:
             "session_info": asdict(session),
             "ai_summary": summary,
             "total_interactions": len(session.conversations),
-            "ai_responses": len([c for c in session.conversations if c.speaker == "ai_assistant"]),
+            "ai_responses": session.ai_response_count,
             "key_topics": session.topics_discussed,
             "action_items": session.action_items
         }
     
-    async def _generate_ai_response(self, prompt: str, context: Dict[str, Any]) -> str:
-        """Generate AI response using OpenAI."""
+    async def _generate_ai_response(
+        self,
+        prompt: str,
+        context: Dict[str, Any],
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Generate AI response using OpenAI, streaming partial text to ``on_partial`` if set."""
         try:
             logger.info(f"🔍 Received context: {context}")
-            client = OpenAI(api_key=Config.OPENAI_API_KEY)
+            client = self.async_openai
+            if client is None:
+                raise RuntimeError("OpenAI client not configured (OPENAI_API_KEY missing)")
             
             # Check for senior-level interview requirements
             interview_level = context.get('interview_level', '')
             requirements = context.get('requirements', {})
-            is_senior_interview = 'IC6' in interview_level or 'IC7' in interview_level or 'E5' in interview_level or 'E6' in interview_level or 'E7' in interview_level
+            is_senior_interview = interview_level in _SENIOR_LEVELS
             
             # Detect if this is an expert/senior engineer response
-            is_expert_response = (
-                context.get('type') == 'senior_engineer_response' or 
-                context.get('expertise_level') == 'senior' or
-                context.get('response_style') == 'experienced_professional' or
-                context.get('context') == 'senior_engineer_interview' or
-                is_senior_interview
+            is_expert_response = is_senior_interview or any(
+                context.get(key) == value for key, value in _EXPERT_TRIGGERS
             )
             
             # Detect casual conversation vs technical questions
-            casual_patterns = ['how are you', 'hello', 'hi', 'good morning', 'good afternoon', 'how you doing']
-            is_casual = any(pattern in prompt.lower() for pattern in casual_patterns)
+            is_casual = _CASUAL_RE.search(prompt) is not None
             
+            time_line = ""
             # Check if this is a personalized interview response
             if context.get('type') == 'personalized_interview_response':
                 logger.info(f"🎯 Using personalized interview response mode")
@@ -918,13 +1515,11 @@ class AIAssistant:
                 
                 # Start with resume context if available (most specific)
                 if self.has_resume_context():
-                    logger.info(f"📄 Using resume context: {len(self.get_resume_context())} characters")
-                    profile_section = f"""
-YOUR ACTUAL PROFESSIONAL BACKGROUND (from your resume):
-{self.get_resume_context()[:4000]}
-
-Based on the above resume information, you are answering interview questions as yourself with these exact experiences and achievements.
-"""
+                    logger.info(f"📄 Using resume context: {self._resume_len} characters")
+                    profile_section = _render_prompt(
+                        "resume",
+                        _prompt_fields(resume=_truncate_tokens(self.resume_context, _RESUME_PROFILE_TOKENS))
+                    )
                 # Fallback to ProfileManager data
                 elif profile_context.get("has_profile"):
                     logger.info(f"👤 Using ProfileManager data as fallback")
@@ -934,221 +1529,78 @@ Based on the above resume information, you are answering interview questions as
                     achievements = profile_context.get("achievements", "")
                     resume_info = profile_context.get("resume_info", {})
                     
-                    profile_section = f"""
-YOUR PROFESSIONAL IDENTITY:
-- Name: {personal.get("name", "Senior Engineer")}
-- Current Role: {personal.get("current_role", "Senior Software Engineer")}
-- Experience: {personal.get("experience_years", "8+")} years in the industry
-- Current Company: {personal.get("company", "Tech Company")}
-- Industry: {personal.get("industry", "Technology")}
-
-YOUR TECHNICAL EXPERTISE:
-- Core Technologies: {", ".join(skills[:8]) if skills else "Full-stack development, system design, cloud platforms"}
-- Additional Skills: {", ".join(skills[8:]) if len(skills) > 8 else "Various modern frameworks and tools"}
-
-YOUR KEY PROJECTS & ACCOMPLISHMENTS:
-{projects if projects else "Led multiple high-impact engineering projects with measurable business outcomes"}
-
-YOUR ACHIEVEMENTS:
-{achievements if achievements else "Consistently delivered technical solutions that scaled and performed at enterprise level"}
-
-RESUME HIGHLIGHTS:
-{resume_info.get('summary', 'Proven track record of technical leadership and system architecture') if resume_info else 'Strong technical background with leadership experience'}
-"""
+                    profile_section = _render_prompt("profile", _prompt_fields(
+                        name=personal.get("name", "Senior Engineer"),
+                        current_role=personal.get("current_role", "Senior Software Engineer"),
+                        experience_years=personal.get("experience_years", "8+"),
+                        company=personal.get("company", "Tech Company"),
+                        industry=personal.get("industry", "Technology"),
+                        core_skills=", ".join(skills[:8]) if skills else "Full-stack development, system design, cloud platforms",
+                        additional_skills=", ".join(skills[8:]) if len(skills) > 8 else "Various modern frameworks and tools",
+                        projects=projects if projects else "Led multiple high-impact engineering projects with measurable business outcomes",
+                        achievements=achievements if achievements else "Consistently delivered technical solutions that scaled and performed at enterprise level",
+                        resume_summary=resume_info.get('summary', 'Proven track record of technical leadership and system architecture') if resume_info else 'Strong technical background with leadership experience',
+                    ))
                 else:
                     logger.info(f"⚠️ No profile data available, using generic template")
-                    profile_section = """
-YOUR PROFESSIONAL IDENTITY:
-- You are a Senior Software Engineer with 8+ years of experience
-- Currently working at a major tech company in a senior IC role
-- Strong background in full-stack development and system architecture
-- Proven track record of technical leadership and mentoring
-
-YOUR EXPERTISE:
-- Full-stack development (React, Node.js, Python, Java)
-- System design and architecture
-- Cloud platforms (AWS/Azure/GCP)
-- Database design and optimization
-- DevOps and CI/CD practices
-"""
-
-                system_prompt = f"""
-You are answering an interview question as the specific person described below. This is a SENIOR ENGINEER ({interview_level}) level interview.
-
-{profile_section}
-
-CRITICAL INSTRUCTIONS:
-- You ARE this person - respond in first person as them
-- Use your exact background, experience, and achievements listed above
-- Reference your specific companies, projects, and technologies
-- Include real metrics and accomplishments from your career
-- Sound authentic and human - like this senior engineer would actually speak
-- Never mention AI, assistance, or that you're generating a response
-- Demonstrate {interview_level} level thinking: architectural decisions, trade-offs, business impact
-- Show depth appropriate for senior engineering roles (8+ years experience)
-
-FOR DIFFERENT QUESTION TYPES:
-
-SYSTEM DESIGN: Show architectural thinking, scalability considerations, real-world trade-offs. Reference actual systems you've built from your experience. Discuss CAP theorem, consistency patterns, distributed systems challenges based on your background.
-
-CODING: Demonstrate proficiency with your actual tech stack listed above. Discuss real problems you've solved. Show understanding of production concerns, performance optimization, code quality at scale.
+                    profile_section = _PROFILE_SECTION_GENERIC
 
-BEHAVIORAL: Use specific examples from your years of experience. Show leadership, collaboration, problem-solving. Reference actual challenges and how you overcame them. Demonstrate mentoring and strategic thinking.
-
-PRODUCT/BUSINESS: Connect technical decisions to business outcomes. Show understanding of stakeholder needs. Reference measurable impact you've delivered. Discuss trade-offs between technical debt and feature velocity.
-
-TECHNICAL DEPTH: If asked about specific technologies in your background, demonstrate deep understanding appropriate for {interview_level} level including architecture patterns, performance considerations, and production experience.
-
-Answer AS this person based on their actual senior-level experience detailed above.
-"""
+                system_prompt = _render_prompt("personalized", _prompt_fields(
+                    interview_level=interview_level,
+                    profile_section=profile_section,
+                ))
             elif is_senior_interview or is_expert_response:
-                system_prompt = f"""
-You are a SENIOR SOFTWARE ENGINEER (IC6/IC7/E5/E6/E7 level) with 10+ years of experience across the full technology stack. You've built systems at massive scale, led engineering teams, architected complex distributed systems, and have deep practical knowledge.
-
-THIS IS A SENIOR-LEVEL TECHNICAL INTERVIEW - DEMONSTRATE EXPERT-LEVEL THINKING:
-
-CORE EXPERTISE AREAS:
-• **Distributed Systems**: Microservices, event-driven architecture, CAP theorem, eventual consistency
-• **Scalability**: Systems handling 100M+ requests/day, auto-scaling, load balancing strategies  
-• **Database Design**: ACID properties, sharding strategies, replication, database optimization
-• **System Architecture**: Design patterns, architectural trade-offs, technical debt management
-• **Performance**: Profiling, optimization, caching strategies, CDN usage
-• **Security**: Authentication/authorization, OWASP top 10, secure coding practices
-• **DevOps**: CI/CD pipelines, infrastructure as code, monitoring, observability
-• **Leadership**: Technical mentoring, code reviews, architectural decision making
-
-RESPONSE REQUIREMENTS:
-✅ **Technical Depth**: Go beyond surface-level answers. Explain WHY and HOW, not just WHAT
-✅ **Real-World Experience**: Reference specific scenarios like "At scale, I've seen..."
-✅ **Trade-offs Discussion**: Always mention pros/cons and alternative approaches
-✅ **Business Impact**: Connect technical decisions to business outcomes
-✅ **Code Examples**: When relevant, provide code snippets or pseudocode
-✅ **Architecture Details**: Include diagrams concepts, data flow, system boundaries
-✅ **Scalability Considerations**: Discuss bottlenecks, horizontal vs vertical scaling
-✅ **Comprehensive Coverage**: Address multiple aspects of the question
-
-INTERVIEW LEVEL: {interview_level}
-OPTIMIZATION: {context.get('optimization', 'comprehensive_technical')}
-
-Context: {context.get('type', 'senior_technical_interview')}
-Platform: {context.get('platform', 'video_meeting')}
-
-FOR JAVA QUESTIONS SPECIFICALLY:
-- JVM internals (heap, stack, garbage collection algorithms)
-- Spring Boot ecosystem and best practices
-- Concurrency and multithreading (ExecutorService, CompletableFuture)
-- Performance tuning and JVM optimization
-- Enterprise patterns (dependency injection, AOP, transactions)
-- Integration with databases, messaging systems, cloud services
-
-Respond with the depth and sophistication expected at IC6/IC7 level.
-"""
+                system_prompt = _render_prompt("senior", _prompt_fields(
+                    interview_level=interview_level,
+                    optimization=context.get('optimization', 'comprehensive_technical'),
+                    context_type=context.get('type', 'senior_technical_interview'),
+                    platform=context.get('platform', 'video_meeting'),
+                ))
             elif is_casual:
-                system_prompt = f"""
-You are a Senior Software Engineer with 20+ years of experience across the full technology stack. You've built systems at scale, led engineering teams, and have deep practical knowledge.
-
-IMPORTANT INSTRUCTIONS:
-- Respond as if you're in an interview or professional meeting
-- Share specific experiences and lessons learned over 20 years
-- Mention real technologies, frameworks, and patterns you've used
-- Give practical, actionable advice based on experience
-- Include trade-offs and nuances - avoid generic answers
-- Sound confident but humble, like a senior engineer sharing knowledge
-- Reference actual challenges you've solved
-- Mention specific numbers/metrics when relevant (e.g., "systems handling 10M+ requests")
-
-PERSONALIZATION CONTEXT:
-- If user resume data is available, tailor responses to match their background
-- Reference their actual work experience, skills, and projects when relevant
-- Frame answers as if these are YOUR experiences from the resume
-- Make behavioral answers specific to their career progression
-- For technical questions, reference technologies they've actually used
-
-Context: {context.get('type', 'technical_interview')}
-Platform: {context.get('platform', 'video_meeting')}
-Time: {context.get('timestamp', 'now')}
-User Resume Data: {context.get('resume_context', 'No resume data available')}
-
-Technical expertise areas:
-- Full-stack development (Frontend: React, Angular, Vue | Backend: Node.js, Python, Java, Go)
-- Database design (SQL: PostgreSQL, MySQL | NoSQL: MongoDB, Redis, Cassandra)
-- Cloud platforms (AWS, Azure, GCP) and DevOps (Docker, Kubernetes, CI/CD)
-- System architecture (Microservices, API design, Event-driven architecture)
-- Performance optimization and scaling
-- Team leadership and engineering culture
-
-RESPONSE GUIDELINES:
-1. For behavioral questions: Use experiences from the resume if available
-2. For technical questions: Reference technologies from their skill set
-3. For coding questions: Mention languages/frameworks they know
-4. For system design: Build on their actual project experience
-5. Always sound like you're speaking from personal experience
-
-Respond as this experienced engineer would in a real conversation.
-"""
-            elif is_casual:
-                system_prompt = f"""
-You are a Senior Software Engineer with 20+ years of experience in a professional meeting/interview. 
-You should respond naturally and professionally to casual conversation while staying helpful.
-
-Context: {context.get('type', 'meeting')} on {context.get('platform', 'video call')}
-Time: {context.get('timestamp', 'now')}
-
-For casual greetings like "how are you":
-- Respond naturally and professionally
-- Keep it brief (1-2 sentences)
-- Transition to being helpful for the meeting
-- Be warm but professional
-
-For technical questions:
-- Provide helpful, detailed technical advice from 20+ years experience
-- Be encouraging and practical
-"""
+                system_prompt = _render_prompt("casual", _prompt_fields(
+                    context_type=context.get('type', 'technical_interview'),
+                    platform=context.get('platform', 'video_meeting'),
+                    resume_context=context.get('resume_context', 'No resume data available'),
+                ))
+                # The timestamp changes per call, so it is appended after the cached render
+                time_line = f"Time: {context.get('timestamp', 'now')}\n"
             else:
-                system_prompt = f"""
-You are a Senior Software Engineer with 20+ years of practical experience. 
-Context: {context.get('type', 'technical_discussion')}
-Platform: {context.get('platform', 'meeting')}
-Time: {context.get('timestamp', 'now')}
-
-Provide helpful, experienced advice based on 20 years in the industry. Be practical and specific.
-"""
+                system_prompt = _render_prompt("default", _prompt_fields(
+                    context_type=context.get('type', 'technical_discussion'),
+                    platform=context.get('platform', 'meeting'),
+                ))
+                time_line = f"Time: {context.get('timestamp', 'now')}\n"
             
-            # Set appropriate token limits based on interview level and requirements
+            # Pick the response mode once, then look up its token limit and temperature
             if is_senior_interview:
-                # Senior-level interviews need comprehensive responses
-                max_tokens = 1200 if requirements.get('response_length') == 'comprehensive' else 800
+                mode = "senior"
             elif context.get('type') == 'personalized_interview_response':
-                max_tokens = 1000  # Increased for personalized responses
+                mode = "personalized"
             elif is_casual:
-                max_tokens = 150   # Keep casual responses brief
+                mode = "casual"
             elif is_expert_response:
-                max_tokens = 600   # Increased for expert responses
+                mode = "expert"
             else:
-                max_tokens = 400   # Default
-            
-            # Adjust temperature for more precise technical answers at senior level
+                mode = "default"
+            max_tokens, temperature = _GEN_PARAMS[mode]
             if is_senior_interview:
-                temperature = context.get('temperature', 0.3)  # Lower for technical precision
-            elif context.get('type') == 'personalized_interview_response':
-                temperature = 0.4  # Slightly lower for consistency
-            elif is_casual:
-                temperature = 0.8  # Higher for natural conversation
-            else:
-                temperature = 0.7  # Default
-            
-            response = client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
+                # Senior-level interviews need comprehensive responses and allow a caller override
+                if requirements.get('response_length') == 'comprehensive':
+                    max_tokens = 1200
+                temperature = context.get('temperature', temperature)
+            
+            # Not cached: these answers are sampled and fixed prompts recur all meeting long
+            return await self._complete_chat(
+                client,
+                [
+                    {"role": "system", "content": system_prompt + time_line},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                on_partial=on_partial,
             )
             
-            return (response.choices[0].message.content or "").strip()
-            
         except Exception as e:
             logger.error(f"Error generating AI response: {e}")
             if 'how are you' in prompt.lower():
@@ -1160,24 +1612,68 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
             
             return "I'm here to help! What would you like to know?"
     
+    @staticmethod
+    async def _complete_chat(
+        client: Any,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Run a chat completion, streaming partial text to ``on_partial`` when given."""
+        if on_partial is None:
+            response = await client.chat.completions.create(
+                model=Config.OPENAI_MODEL,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            return (response.choices[0].message.content or "").strip()
+        
+        stream = await client.chat.completions.create(
+            model=Config.OPENAI_MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        buffer = io.StringIO()
+        last_update = 0.0
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            buffer.write(delta)
+            now = time.monotonic()
+            if now - last_update >= _PARTIAL_UPDATE_INTERVAL:
+                last_update = now
+                try:
+                    on_partial(buffer.getvalue())
+                except Exception as e:
+                    logger.debug(f"Partial response callback failed: {e}")
+        return buffer.getvalue().strip()
+    
     async def show_private_assistance(self, message: str, session_id: str):
         """Show private AI assistance during coding sessions."""
         try:
-            # Generate AI response to the assistance prompt
+            from .private_overlay import show_ai_response
+            
+            # Generate AI response to the assistance prompt, updating the overlay as it streams
             response = await self._generate_ai_response(message, {
                 "type": "coding_assistance",
                 "session_id": session_id,
-                "timestamp": datetime.now().isoformat()
-            })
+                "timestamp": _now_iso()
+            }, on_partial=lambda partial: show_ai_response(f"🤖 Coding Assistant: {partial}"))
             
-            # Show via private overlay
-            from .private_overlay import show_ai_response
+            # Show the final response via private overlay
             show_ai_response(f"🤖 Coding Assistant: {response}")
             
             # Record in conversation memory
             if session_id in self.memory.sessions:
                 entry = ConversationEntry(
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=_now_iso(),
                     meeting_id=session_id,
                     speaker="ai_assistant",
                     content=response,
@@ -1203,14 +1699,16 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
             simulated_transcript = "User is asking for help during the meeting"
             
             if simulated_transcript and len(simulated_transcript.strip()) > 0:
-                # Generate AI response
+                from .private_overlay import show_ai_response
+                
+                # Generate AI response, updating the overlay as it streams
                 response = await self._generate_ai_response(
                     simulated_transcript, 
-                    {"type": "meeting", "session_id": session_id}
+                    {"type": "meeting", "session_id": session_id},
+                    on_partial=lambda partial: show_ai_response(f"🤖 Meeting Assistant: {partial}")
                 )
                 
                 # Show private response
-                from .private_overlay import show_ai_response
                 show_ai_response(f"🤖 Meeting Assistant: {response}")
                 
                 logger.info(f"Processed real-time audio for session: {session_id}")
@@ -1235,6 +1733,8 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
                 logger.info(f"✅ Target company set to: {company}")
             else:
                 logger.warning(f"⚠️ Unsupported company: {company}")
+        
+        self._invalidate_profile_context()
     
     def get_interview_configuration(self) -> Dict[str, Any]:
         """Get current interview configuration."""
@@ -1306,6 +1806,9 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
         """Set resume context for personalized responses."""
         try:
             self.resume_context = resume_text.strip()
+            self._resume_len = len(self.resume_context)
+            self._resume_checked = True
+            self._invalidate_profile_context()
             
             # Save to file for persistence
             self._save_resume_to_file(self.resume_context)
@@ -1317,14 +1820,32 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
             return False
     
     def _save_resume_to_file(self, resume_text: str):
-        """Save resume to file for persistence across sessions."""
+        """Save resume to file for persistence across sessions.
+
+        Unchanged text is not rewritten; new text goes to a temporary file that
+        atomically replaces the previous copy.
+        """
         try:
-            import os
-            resume_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'user_resume.txt')
-            os.makedirs(os.path.dirname(resume_file), exist_ok=True)
-            
-            with open(resume_file, 'w', encoding='utf-8') as f:
-                f.write(resume_text)
+            data = resume_text.encode('utf-8')
+            digest = hashlib.blake2b(data, digest_size=8).digest()
+            if digest == self._last_resume_hash:
+                logger.debug("Resume unchanged; skipping save")
+                return
+            
+            os.makedirs(os.path.dirname(_RESUME_FILE), exist_ok=True)
+            tmp_file = _RESUME_FILE + '.tmp'
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, _RESUME_FILE)
+            except OSError:
+                # Don't leave a half-written temp file behind for the next save
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_file)
+                raise
+            self._last_resume_hash = digest
             
             logger.info("Resume saved to file for persistence")
         except Exception as e:
@@ -1333,17 +1854,27 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
     def _load_resume_from_file(self):
         """Load resume from file if exists."""
         try:
-            import os
-            resume_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'user_resume.txt')
-            
-            if os.path.exists(resume_file):
-                with open(resume_file, 'r', encoding='utf-8') as f:
-                    resume_text = f.read().strip()
-                
-                if resume_text:
-                    self.resume_context = resume_text
-                    logger.info(f"✅ Resume loaded from file ({len(resume_text)} characters)")
-                    return True
+            if not os.path.exists(_RESUME_FILE):
+                return False
+            
+            with open(_RESUME_FILE, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    data = mapped[:]
+            
+            resume_text = data.decode('utf-8').strip()
+            if resume_text:
+                self.resume_context = resume_text
+                self._resume_len = len(resume_text)
+                self._invalidate_profile_context()
+                self._last_resume_hash = hashlib.blake2b(
+                    resume_text.encode('utf-8'), digest_size=8
+                ).digest()
+                logger.info(f"✅ Resume loaded from file ({len(resume_text)} characters)")
+                return True
             
             return False
         except Exception as e:
@@ -1352,34 +1883,38 @@ Provide helpful, experienced advice based on 20 years in the industry. Be practi
     
     def has_resume_context(self) -> bool:
         """Check if resume context is available."""
-        # Try to load from file if not in memory
-        if not hasattr(self, 'resume_context') or not self.resume_context:
-            self._load_resume_from_file()
+        # Look for a persisted resume only once; later calls use the in-memory state
+        if not self._resume_checked:
+            self._resume_checked = True
+            if not self.resume_context:
+                self._load_resume_from_file()
         
-        return hasattr(self, 'resume_context') and bool(self.resume_context)
+        return bool(self.resume_context)
     
     def get_resume_length(self) -> int:
         """Get the length of the stored resume."""
-        if self.has_resume_context():
-            return len(self.resume_context)
-        return 0
+        if not self._resume_checked:
+            self.has_resume_context()
+        return self._resume_len
     
     def get_resume_context(self) -> str:
         """Get the stored resume context."""
-        if self.has_resume_context():
-            return self.resume_context
-        return ''
+        if not self._resume_checked:
+            self.has_resume_context()
+        return self.resume_context
     
     def clear_resume_context(self):
         """Clear the stored resume context."""
         self.resume_context = ""
+        self._resume_len = 0
+        self._resume_checked = True
+        self._last_resume_hash = None
+        self._invalidate_profile_context()
         
         # Also remove the file
         try:
-            import os
-            resume_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'user_resume.txt')
-            if os.path.exists(resume_file):
-                os.remove(resume_file)
+            if os.path.exists(_RESUME_FILE):
+                os.remove(_RESUME_FILE)
                 logger.info("Resume file deleted")
         except Exception as e:
             logger.warning(f"Could not delete resume file: {e}")
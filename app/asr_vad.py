@@ -8,8 +8,13 @@ implementation is intentionally lightweight and pluggable – the diarizer can b
 replaced with a pyannote pipeline in the future.
 """
 
-from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+import difflib
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
 
 try:  # pragma: no cover - optional dependency
     import webrtcvad
@@ -21,22 +26,84 @@ try:  # pragma: no cover - model loading is expensive and not exercised in tests
 except Exception:  # pragma: no cover
     WhisperModel = None  # type: ignore
 
+try:  # pragma: no cover - only in faster-whisper >= 1.1
+    from faster_whisper import BatchedInferencePipeline
+except Exception:  # pragma: no cover
+    BatchedInferencePipeline = None  # type: ignore
+
+try:  # pragma: no cover - installed alongside faster-whisper
+    import ctranslate2
+except Exception:  # pragma: no cover
+    ctranslate2 = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz.fuzz import partial_ratio_alignment
+except Exception:  # pragma: no cover
+    partial_ratio_alignment = None  # type: ignore
+
 SAMPLE_RATE = 16000
 FRAME_MS = 20
 FRAME_BYTES = int(SAMPLE_RATE * FRAME_MS / 1000) * 2  # 16‑bit audio
+MIN_SPEECH_MS = 200  # shorter VAD segments are not sent to the model
+MIN_SPEECH_ENERGY = 100  # mean absolute int16 amplitude treated as silence
+
+WHISPER_BATCH_SIZE = 8  # VAD chunks decoded together by the batched pipeline
+
+# Whisper weights are loaded once and shared by every StreamingASR instance
+_WHISPER = None
+_WHISPER_LOCK = threading.Lock()
+
+
+def _load_whisper():  # pragma: no cover - heavy
+    """Build the model: int8_float16 on CUDA, int8 with half the cores on CPU."""
+    if ctranslate2 is not None and ctranslate2.get_cuda_device_count() > 0:
+        model = WhisperModel("tiny", device="cuda", compute_type="int8_float16")
+    else:
+        model = WhisperModel(
+            "tiny", device="cpu", compute_type="int8",
+            cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+        )
+    if BatchedInferencePipeline is not None:
+        return BatchedInferencePipeline(model=model)
+    return model
+
+
+def _get_whisper():  # pragma: no cover - heavy
+    """Return the shared Whisper model (batched when supported), loading it on first use."""
+    global _WHISPER
+    if _WHISPER is None and WhisperModel is not None:
+        with _WHISPER_LOCK:
+            if _WHISPER is None:
+                _WHISPER = _load_whisper()
+    return _WHISPER
+
+
+def frame_energy(frame: bytes) -> float:
+    """Mean absolute amplitude of ``frame`` read as int16 PCM (0.0 when empty)."""
+    # drop a trailing odd byte rather than failing on it
+    samples = np.frombuffer(frame, dtype=np.int16, count=len(frame) // 2)
+    if samples.size == 0:
+        return 0.0
+    return float(np.abs(samples, dtype=np.int32).mean())
 
 
 class RuleBasedDiarizer:
-    """Very small diarizer stub using energy threshold."""
+    """Very small diarizer stub using energy threshold.
+
+    ``threshold`` is compared against the mean absolute amplitude of the
+    frame read as signed 16-bit PCM samples (0–32768), so the default of 500
+    corresponds to roughly -36 dBFS.
+    """
 
     def __init__(self, threshold: int = 500):
         self.threshold = threshold
 
-    def label(self, frame: bytes) -> str:
-        if not frame:
+    def label(self, frame: bytes, energy: Optional[float] = None) -> str:
+        if len(frame) < 2:
             return "other"
         # simple energy check
-        energy = sum(abs(b - 128) for b in frame) / len(frame)
+        if energy is None:
+            energy = frame_energy(frame)
         return "other" if energy > self.threshold else "user"
 
 
@@ -46,12 +113,16 @@ class ReadBackAligner:
 
     answer: str
     cursor: int = 0
+    _answer_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._answer_lower = self.answer.lower()
 
     def update(self, spoken: str, window: int = 10) -> int:
-        """Fuzzy match the last ``window`` words and advance cursor."""
-        import difflib
+        """Fuzzy match the last ``window`` words and advance cursor.
 
-        answer_lower = self.answer.lower()
+        Only the part of the answer after the cursor is searched.
+        """
         words = spoken.strip().split()
         if not words:
             return self.cursor
@@ -60,58 +131,86 @@ class ReadBackAligner:
         segment = " ".join(window_words).lower()
 
         # Exact match first
-        idx = answer_lower.find(segment)
+        idx = self._answer_lower.find(segment, self.cursor)
         if idx != -1:
             self.cursor = idx + len(segment)
             return self.cursor
 
         # Fall back to fuzzy match
-        matcher = difflib.SequenceMatcher(None, answer_lower, segment)
-        match = matcher.find_longest_match(0, len(answer_lower), 0, len(segment))
-        self.cursor = match.a + match.size
+        remaining = self._answer_lower[self.cursor:]
+        if partial_ratio_alignment is not None:
+            alignment = partial_ratio_alignment(segment, remaining)
+            if alignment is not None:
+                self.cursor += alignment.dest_end
+            return self.cursor
+
+        matcher = difflib.SequenceMatcher(None, remaining, segment)
+        match = matcher.find_longest_match(0, len(remaining), 0, len(segment))
+        self.cursor += match.a + match.size
         return self.cursor
 
 
 class StreamingASR:
     """Combine VAD, diarization and whisper into a streaming interface."""
 
-    def __init__(self):
+    def __init__(self, energy_min: float = MIN_SPEECH_ENERGY):
         self.vad = webrtcvad.Vad(2) if webrtcvad else None
-        self.buffer = b""
+        self.energy_min = energy_min
+        self.buffer = bytearray()
         self.diarizer = RuleBasedDiarizer()
         self.model = None  # lazy load
 
     # ------------------------------------------------------------------
     def _ensure_model(self):  # pragma: no cover - heavy
-        if self.model is None and WhisperModel is not None:
-            self.model = WhisperModel("tiny", device="cpu", compute_type="int8")
+        if self.model is None:
+            self.model = _get_whisper()
 
     def _frames(self, chunk: bytes) -> Iterable[bytes]:
-        self.buffer += chunk
-        while len(self.buffer) >= FRAME_BYTES:
-            frame = self.buffer[:FRAME_BYTES]
-            self.buffer = self.buffer[FRAME_BYTES:]
-            yield frame
+        self.buffer.extend(chunk)
+        offset = 0
+        try:
+            # Slice frames out of a view and trim the consumed prefix once at the end
+            with memoryview(self.buffer) as view:
+                while len(view) - offset >= FRAME_BYTES:
+                    frame = view[offset:offset + FRAME_BYTES].tobytes()
+                    offset += FRAME_BYTES
+                    yield frame
+        finally:
+            del self.buffer[:offset]
 
     def transcribe_stream(self, chunk: bytes) -> Iterable[Tuple[str, str]]:
         """Yield ``(speaker, text)`` pairs for speech in ``chunk``."""
-        speech_frames: List[bytes] = []
+        # Speech frames are appended to one growing segment buffer
+        segment = bytearray()
         for frame in self._frames(chunk):
             is_speech = self.vad.is_speech(frame, SAMPLE_RATE) if self.vad else True
             if is_speech:
-                speech_frames.append(frame)
-            elif speech_frames:
-                yield from self._flush_frames(speech_frames)
-                speech_frames = []
-        if speech_frames:
-            yield from self._flush_frames(speech_frames)
-
-    def _flush_frames(self, frames: List[bytes]) -> Iterable[Tuple[str, str]]:
-        speaker = self.diarizer.label(b"".join(frames))
+                segment.extend(frame)
+            elif segment:
+                yield from self._flush_frames(bytes(segment))
+                segment.clear()
+        if segment:
+            yield from self._flush_frames(bytes(segment))
+
+    def _flush_frames(self, audio: bytes) -> Iterable[Tuple[str, str]]:
+        energy = frame_energy(audio)
+        speaker = self.diarizer.label(audio, energy)
+        # Short or quiet segments that slipped past VAD are not worth a model call
+        if len(audio) // FRAME_BYTES * FRAME_MS < MIN_SPEECH_MS or energy < self.energy_min:
+            yield speaker, ""
+            return
         self._ensure_model()  # pragma: no cover
         if self.model is None:  # pragma: no cover
             text = ""  # model unavailable
         else:  # pragma: no cover
-            segments, _ = self.model.transcribe(b"".join(frames), language="en")
+            # faster-whisper takes float32 samples in [-1, 1]; scale in place after one cast
+            samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32)
+            samples *= 1.0 / 32768.0
+            if BatchedInferencePipeline is not None and isinstance(self.model, BatchedInferencePipeline):
+                # The batched pipeline relies on its VAD pass to cut the batch windows
+                segments, _ = self.model.transcribe(samples, language="en", batch_size=WHISPER_BATCH_SIZE)
+            else:
+                # webrtcvad already isolated the speech; skip Whisper's own VAD
+                segments, _ = self.model.transcribe(samples, language="en", vad_filter=False)
             text = " ".join(s.text for s in segments)
         yield speaker, text.strip()
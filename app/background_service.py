@@ -9,11 +9,39 @@ This service runs in the background and can automatically:
 """
 
 import asyncio
+import concurrent.futures
+import os
+import re
+import subprocess
 import time
 import threading
 from datetime import datetime, timedelta
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable, Set
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+    AUDIO_AVAILABLE = True
+except (ImportError, OSError):  # OSError: PortAudio library missing
+    AUDIO_AVAILABLE = False
+    sd = None
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    psutil = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object
 
 from .config import Config
 from . import capture, transcription, summarization, screen_record, knowledge_base
@@ -22,6 +50,40 @@ from .private_overlay import initialize_overlay_system
 
 logger = logging.getLogger(__name__)
 
+# Process snapshots are shared by the meeting and coding monitors for this long
+_PROCESS_CACHE_TTL = 4.0
+
+# Meeting poll interval: starts fast and backs off while no meeting app is running
+_MEETING_POLL_MIN = 5.0
+_MEETING_POLL_MAX = 30.0
+
+# How long stop() waits for session workers to release the audio device and screen
+_STOP_JOIN_TIMEOUT = 10.0
+
+# Minimum seconds between file-event driven assistance prompts
+_CODING_ASSIST_DEBOUNCE = 10.0
+
+_MEETING_APPS = ('zoom', 'teams', 'meet', 'webex', 'skype', 'discord')
+_CODING_APPS = ('code', 'pycharm', 'intellij', 'sublime', 'atom', 'vim', 'vscode')
+
+
+def _app_pattern(apps) -> "re.Pattern[str]":
+    """Compile ``apps`` into one pattern that reports every (overlapping) keyword hit."""
+    # Zero-width lookahead so e.g. "vscode" yields both "vscode" and "code"; only
+    # keywords that are prefixes of one another would shadow each other
+    alternatives = '|'.join(map(re.escape, sorted(apps, key=len, reverse=True)))
+    return re.compile(f'(?=({alternatives}))')
+
+
+_MEETING_RE = _app_pattern(_MEETING_APPS)
+_CODING_RE = _app_pattern(_CODING_APPS)
+
+
+def _active_apps(apps, pattern: "re.Pattern[str]", process_text: str) -> List[str]:
+    """Return the ``apps`` (in their given order) found in the newline-joined process names."""
+    found = set(pattern.findall(process_text))
+    return [app for app in apps if app in found]
+
 
 class MentorService:
     """Background service that runs continuously with AI assistance."""
@@ -32,7 +94,41 @@ class MentorService:
         self.last_activity: Optional[datetime] = None
         self.ai_assistant = AIAssistant()
         self.active_sessions: Dict[str, Any] = {}
+        self._proc_cache: Tuple[float, List[str], str] = (0.0, [], '')
+        self._meeting_backoff = _MEETING_POLL_MIN
+        # Session workers (audio capture, screen recording) share one bounded pool,
+        # created on first use and dropped by stop() so the service can be restarted
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._futures: Set["concurrent.futures.Future[Any]"] = set()
+        # Cancel events of every worker still running, whether or not its session is current
+        self._cancel_events: Set[threading.Event] = set()
+        self._lock = threading.Lock()
         
+    def _submit(self, fn: Callable[[], Any]) -> "concurrent.futures.Future[Any]":
+        """Run ``fn`` on the session pool, creating the pool if needed."""
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="mentor-session")
+        future = self._pool.submit(fn)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget_future)
+        return future
+    
+    def _forget_future(self, future: "concurrent.futures.Future[Any]") -> None:
+        with self._lock:
+            self._futures.discard(future)
+    
+    def _cancel_event(self, session: Optional[Dict[str, Any]]) -> threading.Event:
+        """Return the session's cancel event (a fresh one without a session), tracked for stop()."""
+        cancel = session.setdefault('cancel', threading.Event()) if session is not None else threading.Event()
+        with self._lock:
+            self._cancel_events.add(cancel)
+        return cancel
+    
+    def _release_cancel_event(self, cancel: threading.Event) -> None:
+        with self._lock:
+            self._cancel_events.discard(cancel)
+    
     async def start(self):
         """Start the background service with AI assistant."""
         logger.info("🤖 AI Mentor Assistant starting in background mode...")
@@ -54,13 +150,18 @@ class MentorService:
     
     async def monitor_meetings(self):
         """Monitor for meeting applications and auto-record with AI assistance."""
-        meeting_apps = ['zoom', 'teams', 'meet', 'webex', 'skype', 'discord']
-        
+        loop = asyncio.get_running_loop()
         while self.running:
             try:
+                tick_started = loop.time()
                 # Check for meeting applications
-                running_processes = self._get_running_processes()
-                active_meeting_apps = [app for app in meeting_apps if any(app in proc for proc in running_processes)]
+                active_meeting_apps = _active_apps(_MEETING_APPS, _MEETING_RE, self._running_process_text())
+                
+                # Poll every 5s around meetings; double the wait (up to 30s) while idle
+                if active_meeting_apps:
+                    self._meeting_backoff = _MEETING_POLL_MIN
+                else:
+                    self._meeting_backoff = min(_MEETING_POLL_MAX, self._meeting_backoff * 2)
                 
                 if active_meeting_apps and not self.current_session:
                     # Start meeting session with AI assistant
@@ -89,8 +190,9 @@ class MentorService:
                 elif not active_meeting_apps and self.current_session and self.current_session.get('type') == 'meeting':
                     # End meeting session
                     await self._end_meeting_session()
-                    
-                await asyncio.sleep(5)  # Check every 5 seconds
+                
+                # Sleep relative to the tick start so the work above doesn't add drift
+                await asyncio.sleep(max(0.0, tick_started + self._meeting_backoff - loop.time()))
                 
             except Exception as e:
                 logger.error(f"Error monitoring meetings: {e}")
@@ -98,12 +200,9 @@ class MentorService:
     
     async def monitor_coding_activity(self):
         """Monitor for coding activity and auto-record screen with AI assistance."""
-        coding_apps = ['code', 'pycharm', 'intellij', 'sublime', 'atom', 'vim', 'vscode']
-        
         while self.running:
             try:
-                running_processes = self._get_running_processes()
-                active_coding_apps = [app for app in coding_apps if any(app in proc for proc in running_processes)]
+                active_coding_apps = _active_apps(_CODING_APPS, _CODING_RE, self._running_process_text())
                 
                 if active_coding_apps and (not self.current_session or self.current_session.get('type') != 'coding'):
                     # Start coding session
@@ -147,46 +246,91 @@ class MentorService:
             # Set AI to private meeting mode
             self.ai_assistant.set_interaction_mode("private")
             
+            session = self.current_session
+            cancel = self._cancel_event(session)
+            
             # Start audio recording with AI processing
             def record_with_ai():
+                # One event loop serves every chunk processed on this thread
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
                 try:
-                    # Capture audio in chunks for real-time processing
-                    import sounddevice as sd
-                    import numpy as np
+                    if not AUDIO_AVAILABLE:
+                        logger.error("sounddevice not available; meeting audio will not be captured")
+                        return
                     
-                    sample_rate = Config.SAMPLE_RATE
+                    # Capture audio in chunks for real-time processing. The chunks only feed
+                    # transcription, so record at the ASR rate (Whisper's native 16 kHz)
+                    # rather than the archival rate when the device supports it
+                    sample_rate = Config.TRANSCRIBE_SAMPLE_RATE
+                    try:
+                        sd.check_input_settings(samplerate=sample_rate, channels=1, dtype='int16')
+                    except Exception:
+                        sample_rate = Config.SAMPLE_RATE
                     chunk_duration = 5  # Process every 5 seconds
                     chunk_size = int(sample_rate * chunk_duration)
                     
-                    while self.current_session and self.current_session['id'] == session_id:
-                        try:
-                            # Record audio chunk
-                            audio_chunk = sd.rec(chunk_size, samplerate=sample_rate, channels=1, dtype=np.float32)
-                            sd.wait()
-                            
-                            # Convert to bytes for processing
-                            audio_bytes = (audio_chunk * 32767).astype(np.int16).tobytes()
-                            
-                            # Process with AI in background
-                            loop = asyncio.new_event_loop()
-                            loop.run_until_complete(
-                                self.ai_assistant.process_real_time_audio(audio_bytes, session_id)
-                            )
-                            loop.close()
-                            
-                        except Exception as e:
-                            logger.error(f"Error in real-time audio processing: {e}")
-                            time.sleep(1)
+                    # One capture stream feeds a ring buffer of int16 samples; positions
+                    # are running sample counts, so ``written - consumed`` is the backlog
+                    ring = np.zeros(sample_rate * 10, dtype=np.int16)
+                    capacity = len(ring)
+                    state = {'written': 0}
+                    ready = threading.Condition()
+                    
+                    def on_audio(indata, frames, time_info, status):
+                        if status:
+                            logger.debug(f"Audio input status: {status}")
+                        samples = indata[:, 0]
+                        with ready:
+                            start = state['written'] % capacity
+                            first = min(frames, capacity - start)
+                            ring[start:start + first] = samples[:first]
+                            ring[:frames - first] = samples[first:]
+                            state['written'] += frames
+                            ready.notify()
+                    
+                    consumed = 0
+                    with sd.InputStream(samplerate=sample_rate, channels=1, dtype='int16',
+                                        blocksize=int(sample_rate * 0.02), callback=on_audio):
+                        while (not cancel.is_set() and self.current_session
+                               and self.current_session['id'] == session_id):
+                            try:
+                                with ready:
+                                    if not ready.wait_for(lambda: state['written'] - consumed >= chunk_size,
+                                                          timeout=1.0):
+                                        continue
+                                    backlog = state['written'] - consumed
+                                    if backlog > capacity:
+                                        logger.warning(f"Audio processing fell behind; dropped {backlog - capacity} samples")
+                                        consumed = state['written'] - capacity
+                                    start = consumed % capacity
+                                    end = start + chunk_size
+                                    if end <= capacity:
+                                        audio_bytes = ring[start:end].tobytes()
+                                    else:
+                                        # Copy both wrapped halves straight into one bytes object
+                                        audio_bytes = b"".join((memoryview(ring[start:]), memoryview(ring[:end - capacity])))
+                                    consumed += chunk_size
+                                
+                                # Process with AI in background
+                                loop.run_until_complete(
+                                    self.ai_assistant.process_real_time_audio(audio_bytes, session_id)
+                                )
+                                
+                            except Exception as e:
+                                logger.error(f"Error in real-time audio processing: {e}")
+                                time.sleep(1)
                             
                 except Exception as e:
                     logger.error(f"Error setting up audio recording: {e}")
+                finally:
+                    loop.close()
+                    self._release_cancel_event(cancel)
             
-            # Start recording thread
-            recording_thread = threading.Thread(target=record_with_ai, daemon=True)
-            recording_thread.start()
-            session = self.current_session
+            # Run the capture loop on the shared session pool
+            recording_future = self._submit(record_with_ai)
             if session is not None:
-                session['recording_thread'] = recording_thread
+                session['recording_future'] = recording_future
             
         except Exception as e:
             logger.error(f"Error starting meeting recording: {e}")
@@ -197,61 +341,22 @@ class MentorService:
             # Set AI to private coding mode
             self.ai_assistant.set_interaction_mode("private")
             
-            # Monitor coding activity and provide AI assistance
-            def monitor_coding():
-                try:
-                    import time
-                    import os
-                    from datetime import datetime, timedelta
-                    
-                    last_file_check = datetime.now()
-                    
-                    while self.current_session and self.current_session['id'] == session_id:
-                        try:
-                            current_time = datetime.now()
-                            
-                            # Check for new file creation or modifications every 10 seconds
-                            if current_time - last_file_check > timedelta(seconds=10):
-                                # Simulate detecting file operations (new file, save, etc.)
-                                # In a real implementation, this would monitor file system events
-                                
-                                # Provide contextual AI assistance
-                                assistance_prompts = [
-                                    "New Python file detected. Need help with project structure?",
-                                    "File saved. Would you like code review suggestions?",
-                                    "Working on a new feature? I can suggest best practices.",
-                                    "Need help with error handling or testing patterns?"
-                                ]
-                                
-                                # Randomly provide assistance (simulating intelligent detection)
-                                import random
-                                if random.random() < 0.3:  # 30% chance of assistance
-                                    prompt = random.choice(assistance_prompts)
-                                    
-                                    # Send AI assistance through overlay
-                                    loop = asyncio.new_event_loop()
-                                    loop.run_until_complete(
-                                        self.ai_assistant.show_private_assistance(prompt, session_id)
-                                    )
-                                    loop.close()
-                                
-                                last_file_check = current_time
-                            
-                            time.sleep(2)  # Check every 2 seconds for responsiveness
-                            
-                        except Exception as e:
-                            logger.error(f"Error in coding monitoring loop: {e}")
-                            time.sleep(5)
-                            
-                except Exception as e:
-                    logger.error(f"Error setting up coding monitoring: {e}")
+            if not Config.CODING_WORKSPACE_DIR:
+                logger.info("💡 CODING_WORKSPACE_DIR not set; file-change assistance is off for this session")
+                return
+            if not WATCHDOG_AVAILABLE:
+                logger.warning("⚠️ watchdog not installed; coding assistance disabled for this session")
+                return
             
-            # Start monitoring thread
-            monitoring_thread = threading.Thread(target=monitor_coding, daemon=True)
-            monitoring_thread.start()
+            # Offer assistance only when files in the workspace actually change
+            handler = _CodingActivityHandler(self, session_id, asyncio.get_running_loop())
+            observer = Observer()
+            observer.schedule(handler, Config.CODING_WORKSPACE_DIR, recursive=True)
+            observer.daemon = True
+            observer.start()
             session = self.current_session
             if session is not None:
-                session['monitoring_thread'] = monitoring_thread
+                session['file_observer'] = observer
             
             logger.info(f"🤖 Coding AI assistant started for session: {session_id}")
             
@@ -268,24 +373,36 @@ class MentorService:
             'start_time': datetime.now()
         }
         
+        session = self.current_session
+        cancel = self._cancel_event(session)
         try:
-            # Start screen recording in background
+            # Start screen recording in background until the session or service ends
             def record_screen():
-                video_path = screen_record.record_screen(session_id)
-                session = self.current_session
-                if session is not None:
-                    session['video_path'] = video_path
-            
-            screen_thread = threading.Thread(target=record_screen)
-            screen_thread.daemon = True
-            screen_thread.start()
+                try:
+                    video_path = screen_record.record_screen(session_id, stop_event=cancel)
+                finally:
+                    self._release_cancel_event(cancel)
+                session['video_path'] = video_path
             
-            self.current_session['screen_thread'] = screen_thread
+            session['screen_future'] = self._submit(record_screen)
             logger.info(f"🖥️ Started coding session recording: {session_id}")
             
         except Exception as e:
+            self._release_cancel_event(cancel)
             logger.error(f"Failed to start coding recording: {e}")
     
+    async def _finish_screen_recording(self, session: Dict[str, Any]) -> None:
+        """Stop the session's screen recorder and wait until it has written ``video_path``."""
+        if 'cancel' in session:
+            session['cancel'].set()
+        screen_future = session.pop('screen_future', None)
+        if screen_future is None:
+            return
+        try:
+            await asyncio.wrap_future(screen_future)
+        except Exception as e:
+            logger.error(f"Screen recording failed: {e}")
+    
     async def stop_coding_recording(self):
         """Stop coding recording and process."""
         if not self.current_session:
@@ -295,6 +412,7 @@ class MentorService:
         logger.info(f"⏹️ Stopping coding recording: {session_id}")
         
         try:
+            await self._finish_screen_recording(self.current_session)
             # Process the recording
             if 'video_path' in self.current_session:
                 await self.process_coding_recording(self.current_session)
@@ -393,25 +511,50 @@ class MentorService:
             except Exception as e:
                 logger.error(f"Recording processor error: {e}")
     
-    def _get_running_processes(self):
-        """Get list of currently running processes."""
-        try:
-            import psutil
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    processes.append(proc.info['name'].lower())
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+    def _get_running_processes(self) -> List[str]:
+        """Get list of currently running processes.
+
+        Returns a snapshot shared across callers for ``_PROCESS_CACHE_TTL``
+        seconds; treat it as read-only.
+        """
+        return self._refresh_process_cache()[1]
+    
+    def _running_process_text(self) -> str:
+        """Process names of the shared snapshot joined by newlines, for one-pass regex scans."""
+        return self._refresh_process_cache()[2]
+    
+    def _refresh_process_cache(self) -> Tuple[float, List[str], str]:
+        now = time.monotonic()
+        cache = self._proc_cache
+        if cache[0] and now - cache[0] < _PROCESS_CACHE_TTL:
+            return cache
+        
+        processes = self._scan_processes()
+        self._proc_cache = (now, processes, '\n'.join(processes))
+        return self._proc_cache
+    
+    def _scan_processes(self) -> List[str]:
+        """Read the lowercased names of all running processes.
+
+        Tries ``/proc`` first, then psutil, and only spawns ``ps`` as a last resort.
+        """
+        processes = _scan_proc_linux()
+        if processes is not None:
             return processes
-        except ImportError:
-            # Fallback if psutil not available
-            import subprocess
-            try:
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-                return [line.lower() for line in result.stdout.split('\n')]
-            except:
-                return []
+        
+        try:
+            if PSUTIL_AVAILABLE:
+                processes = []
+                for proc in psutil.process_iter(['name']):
+                    try:
+                        processes.append(proc.info['name'].lower())
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+                return processes
+            
+            # Fallback if neither /proc nor psutil is available
+            result = subprocess.run(['ps', '-Ao', 'comm='], capture_output=True, text=True)
+            return [line.strip().lower() for line in result.stdout.splitlines()]
         except Exception as e:
             logger.error(f"Error getting processes: {e}")
             return []
@@ -434,6 +577,25 @@ class MentorService:
         """Stop the background service."""
         logger.info("🛑 Stopping AI Mentor Assistant background service")
         self.running = False
+        session = self.current_session
+        if session is not None:
+            observer = session.pop('file_observer', None)
+            if observer is not None:
+                observer.stop()
+        with self._lock:
+            cancels = list(self._cancel_events)
+            self._cancel_events.clear()
+            futures = list(self._futures)
+        for cancel in cancels:
+            cancel.set()
+        if self._pool is None:
+            return
+        # Workers poll their cancel event at least once a second; don't hang shutdown on a stuck device
+        _, pending = concurrent.futures.wait(futures, timeout=_STOP_JOIN_TIMEOUT)
+        if pending:
+            logger.warning(f"⚠️ {len(pending)} session worker(s) still running after {_STOP_JOIN_TIMEOUT:.0f}s; not waiting further")
+        self._pool.shutdown(wait=not pending)
+        self._pool = None
 
     async def _end_meeting_session(self):
         """End the current meeting session and trigger processing if applicable."""
@@ -441,6 +603,8 @@ class MentorService:
             if not self.current_session:
                 return
             session = self.current_session
+            if 'cancel' in session:
+                session['cancel'].set()
             # Process the recording if available
             if 'audio_path' in session:
                 await self.process_meeting_recording(session)
@@ -453,12 +617,87 @@ class MentorService:
             if not self.current_session:
                 return
             session = self.current_session
+            observer = session.pop('file_observer', None)
+            if observer is not None:
+                observer.stop()
+            await self._finish_screen_recording(session)
             if 'video_path' in session:
                 await self.process_coding_recording(session)
         finally:
             self.current_session = None
 
 
+def _scan_proc_linux() -> Optional[List[str]]:
+    """Lowercased process names from ``/proc/<pid>/comm``; None without procfs."""
+    processes = []
+    try:
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                        processes.append(f.read().decode('utf-8', 'replace').strip().lower())
+                except OSError:
+                    # Process exited between listing and reading
+                    continue
+    except OSError:
+        return None
+    return processes
+
+
+class _CodingActivityHandler(FileSystemEventHandler):
+    """Turns workspace file events into debounced private assistance prompts."""
+
+    # VCS metadata, dependency/build output and the app's own data directory
+    _IGNORED_PARTS = frozenset({
+        '.git', '.hg', '.svn', '__pycache__', 'node_modules', '.venv', 'venv', 'env',
+        '.tox', '.mypy_cache', '.pytest_cache', '.ruff_cache', '.idea', '.vscode',
+        'build', 'dist', 'target', '.next', 'data',
+    })
+    # Databases, journals and partial files this app (or an editor) writes while running
+    _IGNORED_SUFFIXES = ('.db', '.db-journal', '.db-wal', '.db-shm', '.sqlite', '.log', '.part', '.swp', '~')
+
+    def __init__(self, service: "MentorService", session_id: str, loop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self.service = service
+        self.session_id = session_id
+        self.loop = loop
+        self._last_prompt = 0.0
+        # App-owned directories configured outside ./data
+        self._ignored_roots = tuple(
+            os.path.join(os.path.abspath(d), '')
+            for d in (Config.RECORDINGS_DIR, Config.TEMP_DIR, Config.CHROMA_PERSIST_DIR, Config.CODE_ANALYSIS_CACHE_DIR)
+            if d
+        )
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ('created', 'modified'):
+            return
+        path = os.fsdecode(event.src_path)
+        if (self._IGNORED_PARTS.intersection(path.split(os.sep))
+                or path.endswith(self._IGNORED_SUFFIXES)
+                or os.path.abspath(path).startswith(self._ignored_roots)):
+            return
+        session = self.service.current_session
+        if not session or session.get('id') != self.session_id:
+            return
+        now = time.monotonic()
+        if now - self._last_prompt < _CODING_ASSIST_DEBOUNCE:
+            return
+        self._last_prompt = now
+
+        name = os.path.basename(path)
+        if event.event_type == 'created':
+            prompt = f"New file {name} detected. Need help with project structure?"
+        else:
+            prompt = f"{name} saved. Would you like code review suggestions?"
+        asyncio.run_coroutine_threadsafe(
+            self.service.ai_assistant.show_private_assistance(prompt, self.session_id),
+            self.loop,
+        )
+
+
 # Global service instance
 mentor_service = MentorService()
 
@@ -6,121 +6,819 @@ capabilities using sounddevice.
 """
 from __future__ import annotations
 
+import contextlib
 import logging
+import mmap
 import os
+import queue
+import shutil
+import signal
+import struct
+import subprocess
+import tempfile
 import time
 import threading
-from datetime import datetime
-from typing import Any, Tuple, Optional
-
-# Optional audio processing imports
-try:
-    import sounddevice as sd
-    import scipy.io.wavfile as wav
-    import numpy as np
-    AUDIO_AVAILABLE = True
-except ImportError:
-    AUDIO_AVAILABLE = False
-    # Mock modules for when audio libs not available
-    class MockSoundDevice:
-        def __init__(self): pass
-        def rec(self, *args, **kwargs): return []
-        def wait(self): pass
-        def stop(self, *args): pass
-        class InputStream:
-            def __init__(self, *args, **kwargs): pass
-            def start(self): pass
-            def stop(self): pass
-            def close(self): pass
-        InputStream = InputStream
-        @property
-        def default(self): return MockDevice()
-        
-    class MockDevice:
-        @property  
-        def device(self): return 0
-        @property
-        def channels(self): return 1
-        @property
-        def samplerate(self): return 44100
-        
-    class MockWav:
-        @staticmethod
-        def write(filename, rate, data): pass
-        
-    class MockNumpy:
-        @staticmethod
-        def zeros(*args, **kwargs): return []
-        @staticmethod
-        def concatenate(seq, axis=0): return []
-        float32 = float
-        int16 = int
-        
-    sd = MockSoundDevice()
-    wav = MockWav()
-    np = MockNumpy()
+import wave
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Set, Tuple, Optional
+
+# Audio libraries are imported on first use (see ``_load_audio_libs``): importing
+# sounddevice initialises PortAudio, which callers that only stream captions or
+# dispatch meetings should not pay for.
+sd: Any = None
+np: Any = None
+AUDIO_AVAILABLE: Optional[bool] = None  # None until the first AudioRecorder
+
+
+# Mock modules for when audio libs not available; only what AudioRecorder touches
+class MockSoundDevice:
+    class InputStream:
+        def __init__(self, *args, samplerate=44100, **kwargs): self._rate = samplerate
+        def read(self, frames):
+            time.sleep(frames / self._rate)  # pace the pump like a device would
+            return (), False
+        def start(self): pass
+        def stop(self): pass
+        def close(self): pass
+
+
+class MockNumpy:
+    int16 = int
+
+
+def _load_audio_libs() -> bool:
+    """Import sounddevice and numpy once, falling back to the mocks."""
+    global sd, np, AUDIO_AVAILABLE
+    if AUDIO_AVAILABLE is None:
+        try:
+            import sounddevice as _sd
+            import numpy as _np
+            sd, np, AUDIO_AVAILABLE = _sd, _np, True
+        except (ImportError, OSError):  # OSError: PortAudio library missing
+            sd, np, AUDIO_AVAILABLE = MockSoundDevice(), MockNumpy(), False
+    return AUDIO_AVAILABLE
+
 
 from .config import Config
 from .realtime import RealtimeSessionManager, get_session_manager
 
 logger = logging.getLogger(__name__)
 
+# AudioRecorder grows its buffer in preallocated blocks of this many seconds
+RECORDING_BLOCK_SECONDS = 60
+# Queued to the writer thread to request a checkpoint
+_CHECKPOINT = object()
+# Heap blocks an AudioRecorder keeps for its next recording
+_REUSE_BLOCKS = 2
+# User-space buffer of the streaming WAV writer
+_WRITER_BUFFER_BYTES = 1 << 20
+# Buffers passed to a single os.writev call (POSIX IOV_MAX is at least 1024)
+_IOV_MAX = 1024
+# Minimum spacing of the capture daemon's overflow warnings
+_OVERFLOW_REPORT_SECONDS = 5.0
+# Default for the most captions handed to a session's add_captions in one call
+_CAPTION_BATCH = 64
+# Recording formats ffmpeg encodes on the fly, by file extension. Opus is tuned
+# for speech: mono 16 kHz wideband at 24 kbit/s in VoIP mode, ~50x smaller than WAV
+_OPUS_VOICE_ARGS = ['-c:a', 'libopus', '-ac', '1', '-ar', '16000', '-b:a', '24k', '-application', 'voip']
+# ffmpeg stderr lines kept for error reports
+_FFMPEG_STDERR_LINES = 20
+_FFMPEG_CODECS = {'.flac': ['-c:a', 'flac'], '.opus': _OPUS_VOICE_ARGS, '.ogg': _OPUS_VOICE_ARGS}
+
+
+@lru_cache(maxsize=1)
+def _find_ffmpeg() -> Optional[str]:
+    """Locate ffmpeg on PATH once; the scan stats every PATH entry."""
+    return shutil.which('ffmpeg')
+
+
+def refresh_ffmpeg() -> Optional[str]:
+    """Forget the cached ffmpeg lookup (after PATH changes) and search again."""
+    _find_ffmpeg.cache_clear()
+    return _find_ffmpeg()
+
+
+def _encoder_command(path: str, sample_rate: int, channels: int, source: str = 'pipe:0') -> Optional[List[str]]:
+    """ffmpeg command encoding 16-bit PCM into ``path``, or None to write WAV."""
+    codec_args = _FFMPEG_CODECS.get(os.path.splitext(path)[1].lower())
+    ffmpeg = _find_ffmpeg() if codec_args else None
+    if not ffmpeg:
+        return None
+    cmd = [ffmpeg, '-hide_banner', '-loglevel', 'error', '-y']
+    if source == 'pipe:0':
+        cmd += ['-f', 's16le', '-ar', str(sample_rate), '-ac', str(channels)]
+    return cmd + ['-i', source] + codec_args + [path]
+
+
+def _tail_stderr(proc: subprocess.Popen) -> Tuple[Deque[str], threading.Thread]:
+    """Keep the last lines of ``proc``'s stderr, draining it so the pipe never fills."""
+    tail: Deque[str] = deque(maxlen=_FFMPEG_STDERR_LINES)
+
+    def pump():
+        for line in proc.stderr:
+            tail.append(line.decode('utf-8', 'replace').rstrip())
+
+    reader = threading.Thread(target=pump, name="ffmpeg-stderr", daemon=True)
+    reader.start()
+    return tail, reader
+
+
+def _recording_extension() -> str:
+    """File extension for new recordings: ``Config.RECORDING_FORMAT`` if it can be encoded."""
+    fmt = Config.RECORDING_FORMAT.lower().lstrip('.')
+    if '.' + fmt in _FFMPEG_CODECS and _find_ffmpeg():
+        return fmt
+    if fmt != 'wav':
+        logger.warning("⚠️ Cannot encode %s recordings (ffmpeg missing or unknown format), using WAV", fmt)
+    return 'wav'
+
+
+def _wav_header(sample_rate: int, channels: int, data_bytes: int) -> bytes:
+    """44-byte RIFF header for 16-bit PCM with ``data_bytes`` of samples."""
+    block_align = channels * 2
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_bytes, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b'data', data_bytes,
+    )
+
+
+def _write_pcm16_wav(path: str, sample_rate: int, channels: int, chunks: List[Any]) -> None:
+    """Write int16 sample arrays as one WAV file straight from their buffers."""
+    views = [memoryview(chunk).cast('B') for chunk in chunks]
+    views = [view for view in views if len(view)]
+    header = _wav_header(sample_rate, channels, sum(len(view) for view in views))
+    with open(path, 'wb', buffering=0) as fh:
+        if not hasattr(os, 'writev'):
+            fh.write(header)
+            for view in views:
+                fh.write(view)
+            return
+        # Scatter-gather: the kernel copies from the numpy buffers directly
+        pending = [memoryview(header)] + views
+        fd = fh.fileno()
+        while pending:
+            written = os.writev(fd, pending[:_IOV_MAX])
+            while written:
+                size = len(pending[0])
+                if written >= size:
+                    written -= size
+                    pending.pop(0)
+                else:
+                    pending[0] = pending[0][written:]
+                    written = 0
+
+
+def _gain_clip_loop(buf, mult):
+    """Scale int16 samples in place with hard clipping; compiled by numba when available."""
+    for i in range(buf.shape[0]):
+        v = buf[i] * mult
+        if v > 32767.0:
+            v = 32767.0
+        elif v < -32768.0:
+            v = -32768.0
+        buf[i] = v
+
+
+def _gain_clip_numpy(buf, mult):
+    """Vectorised fallback for :func:`_gain_clip_loop`."""
+    scaled = buf.astype(np.float32)
+    scaled *= mult
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    buf[...] = scaled
+
+
+_gain_clip: Any = None  # resolved on first use, numba is slow to import
+
+
+def _apply_gain(samples: Any, mult: float) -> None:
+    """Apply ``mult`` to a contiguous int16 sample array in place."""
+    global _gain_clip
+    if _gain_clip is None:
+        try:
+            from numba import njit
+            # One fused multiply+clip pass over the buffer, no temporaries
+            _gain_clip = njit(cache=True, fastmath=True)(_gain_clip_loop)
+        except ImportError:
+            _gain_clip = _gain_clip_numpy
+    _gain_clip(samples.reshape(-1), mult)
+
+
+class _SpoolFile:
+    """Sparse temp file in ``Config.TEMP_DIR`` that recording blocks are mapped onto.
+
+    The first 44 bytes are reserved for the WAV header and each block is an
+    ``mmap`` view of the next slice of the file, so long recordings live in the
+    page cache (and spill to disk under memory pressure) instead of the heap.
+    Finalizing writes the header in place and renames the file; the samples are
+    never copied again.
+    """
+
+    HEADER_BYTES = 44
+
+    def __init__(self, directory: str, block_frames: int, channels: int):
+        os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(prefix='recording_', suffix='.wav.part', dir=directory)
+        self._fd = fd
+        self._block_frames = block_frames
+        self._channels = channels
+        self._block_bytes = block_frames * channels * 2
+        self._maps: List[mmap.mmap] = []
+
+    def new_block(self) -> Any:
+        """Grow the file by one block and return it as an int16 array over the mapping."""
+        start = self.HEADER_BYTES + len(self._maps) * self._block_bytes
+        os.ftruncate(self._fd, start + self._block_bytes)  # sparse: no disk blocks yet
+        # Mappings must start on an allocation boundary; skip the slack with a view offset
+        aligned = start - start % mmap.ALLOCATIONGRANULARITY
+        mm = mmap.mmap(self._fd, start + self._block_bytes - aligned, offset=aligned)
+        self._maps.append(mm)
+        return np.frombuffer(mm, dtype=np.int16, count=self._block_frames * self._channels,
+                             offset=start - aligned).reshape(-1, self._channels)
+
+    def write_header(self, header: bytes) -> None:
+        """Write ``header`` over the reserved first bytes of the file."""
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, header)
+
+    def _unmap(self) -> None:
+        """Close every mapping; callers must have dropped all array views first.
+
+        Raises ``BufferError`` if a view is still alive. The maps that could not
+        be closed are kept, so the file must not be truncated under them.
+        """
+        live = []
+        for mm in self._maps:
+            try:
+                mm.close()
+            except BufferError:
+                live.append(mm)
+        self._maps = live
+        if live:
+            raise BufferError(f"{len(live)} recording block(s) still referenced; spool left at {self.path}")
+
+    def finalize(self, path: str, header: bytes, data_bytes: int) -> None:
+        """Write ``header``, cut the file to the recorded samples and move it to ``path``."""
+        # Truncating under a live mapping turns the next access through it into SIGBUS
+        try:
+            self._unmap()
+        except BufferError:
+            os.close(self._fd)
+            raise
+        self.write_header(header)
+        os.ftruncate(self._fd, self.HEADER_BYTES + data_bytes)
+        os.close(self._fd)
+        try:
+            os.replace(self.path, path)
+        except OSError:
+            # TEMP_DIR on another filesystem than the destination
+            shutil.move(self.path, path)
+
+    def discard(self) -> None:
+        """Drop the spool without producing a recording."""
+        try:
+            self._unmap()
+        finally:
+            os.close(self._fd)
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class _CaptureDaemon:
+    """Owns one input stream and fans each block out to every subscribed recorder.
+
+    The stream is opened in blocking mode and drained by a Python pump thread,
+    so PortAudio's real-time thread only fills its C ring buffer and never
+    waits on the GIL; a GC pause or a busy transcription thread delays the
+    pump, not the device.  Subscribers are kept in an immutable tuple that is
+    swapped under a lock, so the pump only reads a snapshot and never blocks.
+    """
+
+    def __init__(self, sample_rate: int, channels: int):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._subscribers: Tuple[Any, ...] = ()
+        self._lock = threading.Lock()
+        self._stream: Any = None
+        self._pump: Optional[threading.Thread] = None
+        self._running = False
+        self._ticks = 0  # completed fan-outs, lets unsubscribe wait out an in-flight block
+
+    def _pump_loop(self, stream) -> None:
+        read = stream.read
+        frames = Config.CHUNK_SIZE
+        overflows = 0
+        reported = time.monotonic()
+        while self._running:
+            try:
+                indata, overflowed = read(frames)
+            except Exception as e:
+                logger.error("Audio input stream failed: %s", e)
+                return
+            status = None
+            if overflowed:
+                status = "input overflow"
+                overflows += 1
+            for subscriber in self._subscribers:
+                subscriber(indata, len(indata), None, status)
+            self._ticks += 1
+            # Overflows come in bursts; report them here, throttled, not per block per recorder
+            if overflows and time.monotonic() - reported >= _OVERFLOW_REPORT_SECONDS:
+                logger.warning("⚠️ Audio input overflowed %d times; samples were dropped", overflows)
+                overflows = 0
+                reported = time.monotonic()
+        if overflows:
+            logger.warning("⚠️ Audio input overflowed %d times; samples were dropped", overflows)
+
+    def subscribe(self, callback) -> None:
+        with self._lock:
+            self._subscribers += (callback,)
+            if self._stream is None:
+                stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    # Fixed block size keeps the read rate predictable
+                    blocksize=Config.CHUNK_SIZE,
+                    # Blocking reads need headroom for pump hiccups
+                    latency='high',
+                    # PCM16 straight from the device: half the buffered bytes of float32
+                    # and the WAV is written without any conversion pass
+                    dtype=np.int16
+                )
+                stream.start()
+                self._stream = stream
+                self._running = True
+                self._pump = threading.Thread(
+                    target=self._pump_loop, args=(stream,), name="audio-capture", daemon=True
+                )
+                self._pump.start()
+
+    def unsubscribe(self, callback) -> None:
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not callback)
+            if not self._subscribers and self._stream is not None:
+                # The pump exits after the read in flight (at most one block period)
+                self._running = False
+                self._pump.join()
+                self._pump = None
+                self._stream.stop()
+                self._stream.close()
+                self._stream = None
+                return
+            ticks = self._ticks
+        # Others keep the stream running; wait until a fan-out that may still hold
+        # the old snapshot has finished (bounded by a couple of block periods)
+        deadline = time.monotonic() + 4 * Config.CHUNK_SIZE / self.sample_rate
+        while self._ticks == ticks and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+
+_CAPTURE_DAEMONS: Dict[Tuple[int, int], _CaptureDaemon] = {}
+_CAPTURE_DAEMONS_LOCK = threading.Lock()
+
+
+def _get_capture_daemon(sample_rate: int, channels: int) -> _CaptureDaemon:
+    """Return the shared capture daemon for this stream format."""
+    with _CAPTURE_DAEMONS_LOCK:
+        daemon = _CAPTURE_DAEMONS.get((sample_rate, channels))
+        if daemon is None:
+            daemon = _CAPTURE_DAEMONS[(sample_rate, channels)] = _CaptureDaemon(sample_rate, channels)
+        return daemon
+
 
 class AudioRecorder:
-    """Real-time audio recorder."""
+    """Real-time audio recorder.
+
+    Samples are written straight into preallocated int16 blocks of
+    ``RECORDING_BLOCK_SECONDS`` each, so the audio callback never allocates
+    per chunk.  When the output path is known up front, a writer thread
+    appends each filled slice to the WAV file and recycles finished blocks,
+    keeping memory bounded; otherwise the blocks are mapped onto a spool file
+    in ``Config.TEMP_DIR`` that becomes the WAV on stop.
+
+    Args:
+        max_duration_s: Expected recording length.  The blocks it needs are
+            reserved before the stream starts so the callback never allocates
+            (or maps) memory within that span; longer recordings still grow.
+    """
     
-    def __init__(self):
+    def __init__(self, max_duration_s: Optional[float] = None):
+        _load_audio_libs()
+        self.max_duration_s = max_duration_s
         self.recording = False
-        self.audio_data = []
         self.sample_rate = Config.SAMPLE_RATE
         self.channels = Config.CHANNELS
+        self._block_frames = self.sample_rate * RECORDING_BLOCK_SECONDS
+        self._blocks: List[Any] = []
+        self._block: Any = None
+        self._write = 0  # frames filled in the current block
+        self._free: Deque[Any] = deque()  # blocks the writer has finished with
+        self._spare: List[Any] = []  # heap blocks kept from the previous recording
+        self._recorded = 0  # frames captured by the current recording
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._stream_path: Optional[str] = None
+        self._spool: Optional[_SpoolFile] = None
+        self._writer_ok = False  # set by the writer thread once the file is complete
+        self._gain = 1.0
+        self._stop = threading.Event()
+        self._active: List[bool] = [False]  # recording flag boxed for the audio callback
+        self._daemon: Optional[_CaptureDaemon] = None
+        self._audio_callback: Any = None
+    
+    @property
+    def stop_event(self) -> threading.Event:
+        """Event that ends a capture when set, e.g. from a server's "end meeting" handler."""
+        return self._stop
+    
+    def stop(self) -> None:
+        """Ask whoever is blocked in :meth:`wait_until_stopped` to finish recording."""
+        self._stop.set()
+    
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """Block until :meth:`stop` is called or ``timeout`` elapses; True if stopped."""
+        if os.name != 'nt':
+            return self._stop.wait(timeout)
+        # Lock waits are not interruptible on Windows; wake periodically so Ctrl+C lands
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+            if remaining <= 0:
+                return self._stop.is_set()
+            if self._stop.wait(remaining):
+                return True
+    
+    def flush_partial(self) -> None:
+        """Checkpoint the recording so the file on disk is playable up to now.
+
+        Does not block: a streamed recording's writer thread flushes its
+        buffer and patches the WAV sizes (or flushes into ffmpeg) after the
+        audio queued so far; a spooled recording gets its header rewritten
+        for the frames captured.  The writer also checkpoints on its own every
+        ``Config.RECORDING_CHECKPOINT_SECONDS``.
+        """
+        if not self.recording:
+            return
+        if self._queue is not None:
+            self._queue.put(_CHECKPOINT)
+        elif self._spool is not None and self._recorded:
+            data_bytes = self._recorded * self.channels * 2
+            self._spool.write_header(_wav_header(self.sample_rate, self.channels, data_bytes))
+    
+    def _new_block(self, prefault: bool = False) -> Any:
+        if self._free:
+            block = self._free.popleft()  # already faulted in
+        elif self._spool is not None:
+            block = self._spool.new_block()
+        else:
+            block = np.empty((self._block_frames, self.channels), dtype=np.int16)
+            if prefault:
+                # Touch every page now so the first callbacks don't take page faults
+                block.fill(0)
+        if self._queue is None:
+            self._blocks.append(block)
+        self._block = block
+        self._write = 0
+        return block
+    
+    def _reserve_blocks(self) -> None:
+        """Queue the blocks ``max_duration_s`` calls for behind the current one."""
+        if not self.max_duration_s:
+            return
+        needed = -(-int(self.max_duration_s * self.sample_rate) // self._block_frames) - 1
+        if self._queue is not None:
+            needed = min(needed, 1)  # the writer recycles finished blocks
+        for _ in range(needed - len(self._free)):
+            if self._spool is not None:
+                # Sparse and lazily faulted: reserving a mapping costs no memory yet
+                self._free.append(self._spool.new_block())
+            else:
+                self._free.append(np.empty((self._block_frames, self.channels), dtype=np.int16))
+    
+    def _open_wav(self, target):
+        """Open a 16-bit WAV writer on a path or an open binary file."""
+        wf = wave.open(target, 'wb')
+        wf.setnchannels(self.channels)
+        wf.setsampwidth(2)
+        wf.setframerate(self.sample_rate)
+        return wf
+    
+    def _drain(self, first) -> Tuple[List[Tuple[Any, int, int]], bool, bool]:
+        """Collect everything queued after ``first``, merging adjacent slices of a block.
+
+        Returns the slices, whether the stop sentinel was seen and whether a
+        checkpoint was requested.
+        """
+        ranges: List[Tuple[Any, int, int]] = []
+        checkpoint = False
+        item = first
+        while True:
+            if item is None:
+                return ranges, True, checkpoint
+            if item is _CHECKPOINT:
+                checkpoint = True
+            else:
+                block, start, end = item
+                if ranges and ranges[-1][0] is block and ranges[-1][2] == start:
+                    ranges[-1] = (block, ranges[-1][1], end)
+                else:
+                    ranges.append(item)
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return ranges, False, checkpoint
+    
+    def _writer_loop(self, path: str) -> None:
+        """Append queued slices to ``path`` until the ``None`` sentinel arrives.
+
+        FLAC/Opus paths are piped through an ffmpeg subprocess that encodes while
+        recording; anything else is written as WAV.
+        """
+        proc = None
+        self._writer_ok = False
+        try:
+            with contextlib.ExitStack() as stack:
+                cmd = _encoder_command(path, self.sample_rate, self.channels)
+                if cmd:
+                    proc = subprocess.Popen(
+                        cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE, bufsize=_WRITER_BUFFER_BYTES,
+                    )
+                    stderr_tail, stderr_reader = _tail_stderr(proc)
+                    stack.enter_context(proc.stdin)
+                    write = proc.stdin.write
+                    # Push buffered PCM on to ffmpeg so the encoded file keeps up
+                    checkpoint = proc.stdin.flush
+                else:
+                    # A large user-space buffer turns many callback-sized slices into few write(2) calls
+                    fh = stack.enter_context(open(path, 'wb', buffering=_WRITER_BUFFER_BYTES))
+                    # The header is patched when the file is closed, and at each checkpoint
+                    write = stack.enter_context(self._open_wav(fh)).writeframesraw
+                    
+                    def checkpoint():
+                        # Make the file on disk a valid WAV of everything written so far
+                        if written:
+                            pos = fh.tell()
+                            fh.seek(4)
+                            fh.write(struct.pack('<I', 36 + written))
+                            fh.seek(40)
+                            fh.write(struct.pack('<I', written))
+                            fh.seek(pos)
+                            fh.flush()
+                done = False
+                gain = self._gain
+                frame_bytes = self.channels * 2
+                written = 0
+                interval = Config.RECORDING_CHECKPOINT_SECONDS
+                next_checkpoint = time.monotonic() + interval
+                while not done:
+                    ranges, done, wanted = self._drain(self._queue.get())
+                    for block, start, end in ranges:
+                        if gain != 1.0:
+                            # The callback is done with these frames; scale them in place
+                            _apply_gain(block[start:end], gain)
+                        write(block[start:end])
+                        written += (end - start) * frame_bytes
+                        if end == self._block_frames:
+                            self._free.append(block)
+                    if not done and (wanted or time.monotonic() >= next_checkpoint):
+                        checkpoint()
+                        next_checkpoint = time.monotonic() + interval
+            if proc is not None and proc.wait() != 0:
+                stderr_reader.join(1.0)
+                logger.error("ffmpeg exited with %s while encoding %s: %s",
+                             proc.returncode, path, " | ".join(stderr_tail))
+            else:
+                self._writer_ok = True
+        except Exception as e:
+            logger.error("Audio writer failed for %s: %s", path, e)
+            if proc is not None:
+                # ffmpeg going away mid-stream surfaces here as a broken pipe; say why
+                proc.kill()
+                proc.wait()
+                stderr_reader.join(1.0)
+                if stderr_tail:
+                    logger.error("ffmpeg output for %s: %s", path, " | ".join(stderr_tail))
         
-    def start_recording(self) -> None:
-        """Start recording audio."""
+    def start_recording(self, output_path: Optional[str] = None) -> None:
+        """Start recording audio, streaming it to ``output_path`` when given."""
         self.recording = True
-        self.audio_data = []
+        self._stop.clear()
+        self._blocks = []
+        self._free.clear()
+        self._queue = None
+        self._writer = None
+        self._stream_path = None
+        self._recorded = 0
+        self._gain = Config.GAIN_MULTIPLIER
+        if AUDIO_AVAILABLE:
+            if output_path:
+                self._stream_path = output_path
+                self._queue = queue.SimpleQueue()
+                self._writer = threading.Thread(
+                    target=self._writer_loop, args=(output_path,), name="audio-writer", daemon=True
+                )
+                self._writer.start()
+            else:
+                try:
+                    self._spool = _SpoolFile(Config.TEMP_DIR, self._block_frames, self.channels)
+                except (OSError, ValueError) as e:
+                    logger.warning("⚠️ Recording spool unavailable, buffering in memory: %s", e)
+            if self._spool is None:
+                # Heap blocks from the last recording go first; spool blocks are file-backed
+                self._free.extend(self._spare)
+                self._spare = []
+            self._new_block(prefault=True)
+            self._reserve_blocks()
+        
+        # Everything the callback touches is bound up front so the audio thread does
+        # no attribute lookups; the write position is mirrored to self._write per call.
+        # Stream status (overflows) is reported by the capture daemon, not per recorder
+        new_block = self._new_block
+        block_frames = self._block_frames
+        put = self._queue.put if self._queue is not None else None
+        active = self._active = [True]
+        block = self._block
+        write = self._write
         
         def audio_callback(indata, frames, time, status):
-            if status:
-                logger.warning(f"Audio recording status: {status}")
-            if self.recording:
-                self.audio_data.append(indata.copy())
+            nonlocal block, write
+            if not active[0]:
+                return
+            # Only copies into preallocated memory and enqueues; no file I/O here
+            offset = 0
+            while offset < frames:
+                if write == block_frames:
+                    block = new_block()
+                    write = 0
+                count = min(frames - offset, block_frames - write)
+                start = write
+                write += count
+                block[start:write] = indata[offset:offset + count]
+                offset += count
+                if put is not None:
+                    put((block, start, write))
+            self._write = write
+            self._recorded += frames
         
-        self.stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            callback=audio_callback,
-            dtype=np.float32
-        )
-        self.stream.start()
+        self._audio_callback = audio_callback
+        self._daemon = _get_capture_daemon(self.sample_rate, self.channels)
+        self._daemon.subscribe(audio_callback)
         logger.info("Audio recording started")
     
+    def _save_blocks(self, path: str) -> bool:
+        """Write the recorded blocks to ``path`` as WAV; False if nothing was recorded."""
+        if self._spool is not None:
+            spool, self._spool = self._spool, None
+            data_bytes = ((len(self._blocks) - 1) * self._block_frames + self._write) * self.channels * 2
+            # Drop the array views so the mappings can be closed
+            self._blocks = []
+            self._block = None
+            if not data_bytes:
+                spool.discard()
+                return False
+            spool.finalize(path, _wav_header(self.sample_rate, self.channels, data_bytes), data_bytes)
+            return True
+        if self._blocks and (len(self._blocks) > 1 or self._write):
+            # Header plus the blocks themselves, no intermediate copy
+            _write_pcm16_wav(
+                path, self.sample_rate, self.channels,
+                self._blocks[:-1] + [self._blocks[-1][:self._write]],
+            )
+            return True
+        return False
+    
     def stop_recording(self, output_path: str) -> str:
         """Stop recording and save to file."""
         if not self.recording:
             return output_path
             
         self.recording = False
-        self.stream.stop()
-        self.stream.close()
+        self._active[0] = False
+        self._daemon.unsubscribe(self._audio_callback)
+        self._audio_callback = None  # releases the block the callback closed over
+        if self._spool is not None:
+            self._free.clear()  # reserved mappings must be released before the spool is finalized
         
-        if self.audio_data:
-            # Combine all audio chunks
-            audio_array = np.concatenate(self.audio_data, axis=0)
-            
-            # Save as WAV file
-            wav.write(output_path, self.sample_rate, audio_array)
-            logger.info(f"Audio saved to {output_path}")
+        if self._writer is None and self._blocks and self._gain != 1.0:
+            # Streamed recordings are scaled by the writer; the rest in place before saving
+            self._apply_gain_to_blocks()
         
+        if self._writer is not None:
+            # Let the writer drain what the callback queued, then finalize the header
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            if not self._writer_ok:
+                logger.error("Audio recording %s is incomplete; see the writer error above", self._stream_path)
+            else:
+                if os.path.abspath(self._stream_path) != os.path.abspath(output_path):
+                    os.replace(self._stream_path, output_path)
+                logger.info("Audio saved to %s", output_path)
+        else:
+            # Blocks are saved as WAV; a FLAC/Opus target is encoded from that file
+            cmd = _encoder_command(output_path, self.sample_rate, self.channels, source=output_path + '.wav')
+            if not cmd:
+                if self._save_blocks(output_path):
+                    logger.info("Audio saved to %s", output_path)
+            elif self._save_blocks(output_path + '.wav'):
+                try:
+                    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                    logger.info("Audio saved to %s", output_path)
+                except subprocess.CalledProcessError as e:
+                    tail = e.stderr.decode('utf-8', 'replace').splitlines()[-_FFMPEG_STDERR_LINES:]
+                    logger.error("Failed to encode %s: %s: %s", output_path, e, " | ".join(tail))
+                except OSError as e:
+                    logger.error("Failed to encode %s: %s", output_path, e)
+                finally:
+                    with contextlib.suppress(OSError):
+                        os.remove(output_path + '.wav')
+        
+        self._keep_spare_blocks()
         return output_path
+    
+    def _apply_gain_to_blocks(self) -> None:
+        """Scale the recorded blocks in place.
+
+        Kept out of ``stop_recording`` so no loop variable there still holds a
+        spool view when the mappings are closed.
+        """
+        for block in self._blocks[:-1]:
+            _apply_gain(block, self._gain)
+        _apply_gain(self._blocks[-1][:self._write], self._gain)
+    
+    def _keep_spare_blocks(self) -> None:
+        """Hold on to a few heap blocks so the next recording starts without allocating."""
+        blocks = list(self._free) + self._blocks
+        if self._block is not None and not any(b is self._block for b in blocks):
+            blocks.append(self._block)
+        self._spare = (self._spare + blocks)[:_REUSE_BLOCKS]
+        self._free.clear()
+        self._blocks = []
+        self._block = None
+
+
+_ts_lock = threading.Lock()
+_ts_last = ["", 0]  # last stamp handed out and how many times
+
+
+def _ts() -> str:
+    """Filename timestamp, suffixed so captures started in the same second don't collide."""
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    with _ts_lock:
+        if stamp == _ts_last[0]:
+            _ts_last[1] += 1
+            return f"{stamp}_{_ts_last[1]}"
+        _ts_last[0], _ts_last[1] = stamp, 0
+    return stamp
+
 
+_ensured_dirs: Set[str] = set()
 
-def capture_meeting(meeting_id: str) -> Tuple[str, str]:
+
+def _capture_path(directory: str, filename: str) -> str:
+    """Join ``filename`` onto ``directory``, creating the directory on first use."""
+    if directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+    return os.path.join(directory, filename)
+
+
+_recorder_local = threading.local()
+
+
+def get_recorder() -> AudioRecorder:
+    """Return this thread's reusable recorder, keeping its buffers between captures."""
+    recorder = getattr(_recorder_local, 'recorder', None)
+    if recorder is None:
+        recorder = _recorder_local.recorder = AudioRecorder()
+    return recorder
+
+
+@contextlib.contextmanager
+def _stop_on_sigint(recorder: AudioRecorder):
+    """Route Ctrl+C to ``recorder.stop()`` so it ends the wait like any other stop."""
+    if threading.current_thread() is not threading.main_thread():
+        yield  # signal handlers can only be installed from the main thread
+        return
+    previous = signal.signal(signal.SIGINT, lambda signum, frame: recorder.stop())
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+def capture_meeting(meeting_id: str, recorder: Optional[AudioRecorder] = None) -> Tuple[str, str]:
     """Capture audio and video from a meeting.
 
     Args:
         meeting_id: Identifier for the meeting (could be a Zoom meeting ID,
             a calendar event ID or a link).
+        recorder: Optional recorder to use; calling its ``stop()`` ends the capture early.
 
     Returns:
         A tuple `(audio_path, video_path)` pointing to recorded files.
@@ -128,20 +826,23 @@ def capture_meeting(meeting_id: str) -> Tuple[str, str]:
     logger.info("Capturing meeting %s", meeting_id)
     
     # Create timestamped filenames
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    audio_path = os.path.join(Config.RECORDINGS_DIR, f"{meeting_id}_{timestamp}_audio.wav")
-    video_path = os.path.join(Config.RECORDINGS_DIR, f"{meeting_id}_{timestamp}_video.mp4")
+    timestamp = _ts()
+    audio_path = _capture_path(Config.RECORDINGS_DIR, f"{meeting_id}_{timestamp}_audio.{_recording_extension()}")
+    video_path = _capture_path(Config.RECORDINGS_DIR, f"{meeting_id}_{timestamp}_video.mp4")
     
     # For now, we'll just record audio
-    recorder = AudioRecorder()
+    if recorder is None:
+        recorder = get_recorder()
+        recorder.max_duration_s = None
     
     try:
-        recorder.start_recording()
+        recorder.start_recording(audio_path)
         logger.info("Recording in progress. Press Ctrl+C to stop...")
         
         # In a real implementation, this would be controlled by meeting events
         # For demo purposes, record for 10 seconds
-        time.sleep(10)
+        with _stop_on_sigint(recorder):
+            recorder.wait_until_stopped(10)
         
     except KeyboardInterrupt:
         logger.info("Recording interrupted by user")
@@ -154,33 +855,37 @@ def capture_meeting(meeting_id: str) -> Tuple[str, str]:
     return audio_path, video_path
 
 
-def capture_audio_only(meeting_id: str, duration: Optional[int] = None) -> str:
+def capture_audio_only(
+    meeting_id: str, duration: Optional[int] = None, recorder: Optional[AudioRecorder] = None
+) -> str:
     """Capture only audio from a meeting.
 
     Args:
         meeting_id: Identifier for the meeting.
         duration: Recording duration in seconds. If None, records until stopped.
+        recorder: Optional recorder to use; calling its ``stop()`` ends the capture early.
 
     Returns:
         Path to the recorded audio file.
     """
     logger.info("Capturing audio for meeting %s", meeting_id)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    audio_path = os.path.join(Config.RECORDINGS_DIR, f"{meeting_id}_{timestamp}_audio.wav")
+    timestamp = _ts()
+    audio_path = _capture_path(Config.RECORDINGS_DIR, f"{meeting_id}_{timestamp}_audio.{_recording_extension()}")
     
-    recorder = AudioRecorder()
+    if recorder is None:
+        recorder = get_recorder()
+        recorder.max_duration_s = duration
     
     try:
-        recorder.start_recording()
+        recorder.start_recording(audio_path)
         
         if duration:
-            logger.info(f"Recording for {duration} seconds...")
-            time.sleep(duration)
+            logger.info("Recording for %s seconds...", duration)
         else:
             logger.info("Recording in progress. Press Ctrl+C to stop...")
-            while True:
-                time.sleep(1)
+        with _stop_on_sigint(recorder):
+            recorder.wait_until_stopped(duration or None)
                 
     except KeyboardInterrupt:
         logger.info("Recording interrupted by user")
@@ -199,17 +904,18 @@ def capture_microphone_test(duration: int = 5) -> str:
     Returns:
         Path to the test recording file.
     """
-    logger.info(f"Testing microphone for {duration} seconds")
+    logger.info("Testing microphone for %s seconds", duration)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    test_path = os.path.join(Config.TEMP_DIR, f"mic_test_{timestamp}.wav")
+    timestamp = _ts()
+    test_path = _capture_path(Config.TEMP_DIR, f"mic_test_{timestamp}.wav")
     
-    recorder = AudioRecorder()
-    recorder.start_recording()
+    recorder = get_recorder()
+    recorder.max_duration_s = duration
+    recorder.start_recording(test_path)
     time.sleep(duration)
     recorder.stop_recording(test_path)
     
-    logger.info(f"Microphone test completed: {test_path}")
+    logger.info("Microphone test completed: %s", test_path)
     return test_path
 
 
@@ -234,28 +940,85 @@ class BaseCaptionClient:
         self.caption_file = caption_file
         self.manager = manager or get_session_manager()
 
-    def stream_captions(self, delay: float = 0.2) -> None:
-        """Stream captions from ``caption_file`` to the session manager."""
+    def stream_captions(self, delay: float = 0.2, batch_size: int = _CAPTION_BATCH) -> None:
+        """Stream captions from ``caption_file`` to the session manager.
+
+        Captions that are due together are handed to the session's
+        ``add_captions`` in groups of up to ``batch_size``.
+        """
         session = self.manager.get_session(self.session_id)
         if not session:
             raise ValueError(f"Session {self.session_id} not found")
 
         try:
-            with open(self.caption_file, "r", encoding="utf-8") as fh:
-                for idx, line in enumerate(fh, 1):
-                    text = line.strip()
-                    if not text:
-                        continue
-                    caption = {
-                        "id": f"{self.session_id}_{idx}",
-                        "text": text,
-                        "speaker": "unknown",
-                        "platform": self.platform,
-                    }
-                    session.add_caption(caption)
-                    time.sleep(delay)
+            fd = os.open(self.caption_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
         except FileNotFoundError:
             logger.error("Caption file %s not found", self.caption_file)
+            return
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return
+        finally:
+            os.close(fd)  # the mapping keeps its own handle
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            # Scanned front to back once: ask for aggressive readahead
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        add_caption = session.add_caption
+        add_captions = getattr(session, "add_captions", None)
+        pending: List[Dict[str, Any]] = []
+        id_prefix = f"{self.session_id}_"
+        platform = self.platform
+        sleep = time.sleep
+        monotonic = time.monotonic
+        find = mm.find
+        size = len(mm)
+        # Pace against absolute deadlines so per-caption work doesn't accumulate as drift
+        start = monotonic()
+        sent = 0
+        # Lines are located with a bytes-level newline search over the mapping; only
+        # non-blank lines are decoded, and the file is never read into memory at once
+        with mm:
+            pos = 0
+            idx = 0
+            while pos < size:
+                end = find(b"\n", pos)
+                if end < 0:
+                    end = size
+                raw = mm[pos:end]
+                pos = end + 1
+                idx += 1
+                if not raw.strip():
+                    continue
+                text = raw.decode("utf-8").strip()
+                if not text:
+                    continue
+                wait = start + sent * delay - monotonic()
+                if wait > 0:
+                    # Hand over everything already due before idling until the next one
+                    if pending:
+                        add_captions(pending)
+                        pending = []
+                    sleep(wait)
+                caption = {
+                    "id": f"{id_prefix}{idx}",
+                    "text": text,
+                    "speaker": "unknown",
+                    "platform": platform,
+                }
+                if add_captions is None:
+                    add_caption(caption)
+                else:
+                    # Captions due together (fast replay, or catching up) go in one bulk call
+                    pending.append(caption)
+                    if len(pending) >= batch_size:
+                        add_captions(pending)
+                        pending = []
+                sent += 1
+        if pending:
+            add_captions(pending)
+        logger.info("Streamed %d captions (%d lines) to session %s", sent, idx, self.session_id)
 
 
 class ZoomClient(BaseCaptionClient):
@@ -10,9 +10,10 @@ import time
 from typing import Optional
 
 from .config import Config
-from . import capture, transcription, summarization, screen_record, knowledge_base
-from backend.integrations.jira_manager import JiraManager
-from .integrations.jira_client import JiraClient
+
+# Feature modules are imported inside the commands that use them: capture loads
+# PortAudio, knowledge_base ChromaDB and screen_record OpenCV, none of which a
+# Jira or KB command should pay for at startup.
 
 
 def _confirm(prompt: str, auto_confirm: bool) -> bool:
@@ -25,6 +26,7 @@ def _confirm(prompt: str, auto_confirm: bool) -> bool:
 
 def cmd_record_audio(args) -> None:
     """Record audio command."""
+    from . import capture, summarization, transcription
     print(f"🎤 Recording audio for meeting: {args.meeting_id}")
     
     if args.duration:
@@ -54,6 +56,7 @@ def cmd_record_audio(args) -> None:
 
 def cmd_transcribe(args) -> None:
     """Transcribe audio file command."""
+    from . import summarization, transcription
     if not os.path.exists(args.audio_file):
         print(f"❌ Audio file not found: {args.audio_file}")
         return
@@ -80,6 +83,7 @@ def cmd_transcribe(args) -> None:
 
 def cmd_screen_record(args) -> None:
     """Screen recording command."""
+    from . import screen_record
     print(f"🖥️ Recording screen for session: {args.session_id}")
     
     if args.duration:
@@ -111,6 +115,7 @@ def cmd_screen_record(args) -> None:
 
 def cmd_screenshot(args) -> None:
     """Take screenshot command."""
+    from . import screen_record
     print("📸 Taking screenshot...")
     screenshot_path = screen_record.take_screenshot(args.filename)
     print(f"✅ Screenshot saved: {screenshot_path}")
@@ -123,6 +128,7 @@ def cmd_screenshot(args) -> None:
 
 def cmd_kb_ingest(args) -> None:
     """Knowledge base ingestion command."""
+    from . import knowledge_base
     if args.repository:
         print(f"📚 Ingesting code repository: {args.repository}")
         result = knowledge_base.ingest_code_repository(args.repository)
@@ -151,6 +157,7 @@ def cmd_kb_ingest(args) -> None:
 
 def cmd_kb_search(args) -> None:
     """Knowledge base search command."""
+    from . import knowledge_base
     print(f"🔍 Searching knowledge base: '{args.query}'")
     
     results = knowledge_base.query_knowledge_base(
@@ -179,6 +186,7 @@ def cmd_kb_search(args) -> None:
 
 def cmd_kb_stats(args) -> None:
     """Knowledge base statistics command."""
+    from . import knowledge_base
     print("📊 Knowledge Base Statistics:")
     stats = knowledge_base.get_knowledge_base_stats()
     
@@ -188,6 +196,7 @@ def cmd_kb_stats(args) -> None:
 
 def cmd_answer(args) -> None:
     """Answer question using knowledge base."""
+    from . import knowledge_base, summarization
     print(f"❓ Question: {args.question}")
     
     # Search knowledge base for context
@@ -206,6 +215,7 @@ def cmd_answer(args) -> None:
 
 def cmd_jira_comment(args) -> None:
     """Add comment to a JIRA issue."""
+    from backend.integrations.jira_manager import JiraManager
     if not _confirm(f"Add comment to {args.issue}?", args.yes):
         print("❌ Operation cancelled")
         return
@@ -220,6 +230,7 @@ def cmd_jira_comment(args) -> None:
 
 def cmd_jira_transition(args) -> None:
     """Transition a JIRA issue's status."""
+    from backend.integrations.jira_manager import JiraManager
     if not _confirm(
         f"Transition issue {args.issue} with {args.transition_id}?", args.yes
     ):
@@ -236,6 +247,7 @@ def cmd_jira_transition(args) -> None:
 
 def cmd_jira_poll(args) -> None:
     """Poll JIRA for assigned issues and update memory."""
+    from .integrations.jira_client import JiraClient
     client = JiraClient()
 
     def _callback(data):
@@ -10,14 +10,21 @@ This system:
 - Provides intelligent code recommendations
 """
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
 import os
+import sqlite3
 import subprocess
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple, TypeVar
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 
 # Git integration
@@ -34,10 +41,132 @@ try:
 except ImportError:
     GITHUB_API_AVAILABLE = False
 
+# HTTP caching with ETag revalidation for GitHub GETs
+try:
+    from cachecontrol import CacheControl
+    from cachecontrol.caches.file_cache import FileCache
+    CACHECONTROL_AVAILABLE = True
+except ImportError:
+    CACHECONTROL_AVAILABLE = False
+
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Bump when analyzer patterns or scoring change so stale cached analyses are ignored
+_ANALYSIS_CACHE_VERSION = 1
+
+# Disambiguates analyses stamped within the same second, across analyzer instances
+_ANALYSIS_SEQ = itertools.count(1)
+
+# Files in unrecognised languages above this size (logs, data dumps) are not scanned
+_UNKNOWN_LANGUAGE_MAX_BYTES = 1 << 20
+
+_T = TypeVar('_T')
+
+
+async def _run_blocking(fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a blocking call on the default executor (asyncio.to_thread needs Python 3.9)"""
+    return await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args, **kwargs))
+
+
+@lru_cache(maxsize=1)
+def _git_has_diff_merges() -> bool:
+    """True when the git CLI supports ``--diff-merges`` (git 2.31+)"""
+    try:
+        out = subprocess.run(['git', 'version'], capture_output=True, text=True).stdout
+    except OSError:
+        return False
+    match = re.search(r'(\d+)\.(\d+)', out)
+    return match is not None and (int(match.group(1)), int(match.group(2))) >= (2, 31)
+
+
+async def _run_git(repo_path: str, *args: str, stdin: Optional[bytes] = None) -> bytes:
+    """Run a git command against ``repo_path`` and return its stdout"""
+    proc = await asyncio.create_subprocess_exec(
+        'git', '-C', repo_path, *args,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate(stdin)
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode('utf-8', 'replace').strip())
+    return stdout
+
+
+async def _read_git_blobs(repo_path: str, shas: List[str]) -> List[Optional[bytes]]:
+    """Read object contents through one ``git cat-file --batch``; None for missing objects"""
+    if not shas:
+        return []
+    output = await _run_git(repo_path, 'cat-file', '--batch', stdin=''.join(f"{sha}\n" for sha in shas).encode())
+    blobs: List[Optional[bytes]] = []
+    pos = 0
+    for _ in shas:
+        # Each record is "<sha> <type> <size>\n<content>\n" or "<sha> missing\n"
+        end = output.index(b'\n', pos)
+        header = output[pos:end].split()
+        if len(header) != 3:
+            blobs.append(None)
+            pos = end + 1
+            continue
+        size = int(header[2])
+        blobs.append(output[end + 1:end + 1 + size])
+        pos = end + 1 + size + 1
+    return blobs
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the lowercased text every match of ``pattern`` starts with ('' if none)."""
+    if '|' in pattern:
+        return ''
+    literal = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                break  # character class such as \s or \w
+            unit, width = pattern[i + 1], 2
+        elif pattern[i] in '.^$*+?{}[]()':
+            break
+        else:
+            unit, width = pattern[i], 1
+        if pattern[i + width:i + width + 1] in ('*', '?', '{'):
+            break  # the unit is optional or repeated a variable number of times
+        literal.append(unit)
+        i += width
+    return ''.join(literal).lower()
+
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter
+_IGNORECASE_ASCII_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'K': 'k', 'ſ': 's'})
+
+
+# Pull requests with their files and reviews in one GraphQL round-trip
+_PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $n: Int!, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $n, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title body headRefName baseRefName createdAt state additions deletions
+        author { login }
+        files(first: 100) { nodes { path } }
+        reviews(first: 10) { nodes { author { login } state body submittedAt } }
+      }
+    }
+  }
+}
+"""
+_PULL_REQUEST_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None,
+}
+
+# Repositories whose commit-graph has been refreshed by this process
+_commit_graph_repos: Set[str] = set()
+_commit_graph_lock = threading.Lock()
+
 class CodeQuality(Enum):
     """Code quality levels"""
     EXCELLENT = "excellent"
@@ -117,30 +246,96 @@ class GitIntegration:
             try:
                 self.repo = git.Repo(repo_path)
                 logger.info(f"🔧 Git repository initialized: {repo_path}")
+                self._refresh_commit_graph()
             except Exception as e:
                 logger.error(f"❌ Git initialization failed: {e}")
         else:
             logger.warning("⚠️ Git library not available")
     
-    async def get_recent_commits(self, branch: str = "main", limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent commits from the repository"""
+    def _refresh_commit_graph(self):
+        """Write the commit-graph with changed-path Bloom filters in the background.
+
+        Path-limited history (``get_file_changes``) then skips tree diffs for
+        commits that cannot touch the path. Runs once per repository per
+        process; git reuses existing filters, so refreshes only hash new commits.
+        """
+        if not Config.GIT_COMMIT_GRAPH:
+            return
+        repo_dir = os.path.abspath(self.repo_path)
+        with _commit_graph_lock:
+            if repo_dir in _commit_graph_repos:
+                return
+            _commit_graph_repos.add(repo_dir)
+        
+        def write_graph():
+            result = subprocess.run(
+                ['git', '-C', repo_dir, 'commit-graph', 'write', '--reachable', '--changed-paths'],
+                capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                logger.debug(f"commit-graph write failed: {result.stderr.strip()}")
+        
+        threading.Thread(target=write_graph, name="commit-graph", daemon=True).start()
+    
+    async def get_recent_commits(self, branch: str = "main", limit: int = 10,
+                                 after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recent commits from the repository
+
+        Each commit carries a ``cursor``; pass the last one as ``after`` to get
+        the next page. The cursor pins the tip the first page was read from and
+        counts the commits already returned, so pages stay consistent across
+        merges and while the branch moves on.
+        """
         
         if not self.repo:
             return []
         
         try:
+            skip = 0
+            if after is not None:
+                match = re.fullmatch(r'([0-9a-fA-F]{40,64}):(\d+)', after)
+                if match is None:
+                    raise ValueError(f"invalid commit cursor: {after!r}")
+                branch, skip = match.group(1), int(match.group(2))
+            
+            # One `git log --numstat` for all commits instead of a diff per commit.
+            # Each record starts with \x1e and its header fields end with \x00.
+            # Skipped commits are only walked, not diffed. Merges are diffed against
+            # their first parent; git < 2.31 lacks --diff-merges, so there the walk
+            # itself follows first parents only.
+            merge_args = ['--diff-merges=first-parent'] if _git_has_diff_merges() else ['--first-parent', '-m']
+            stdout = await _run_git(
+                self.repo_path, 'log', f'--max-count={limit}', f'--skip={skip}',
+                '--numstat', '--no-renames', *merge_args,
+                '--format=%x1e%H%x00%an%x00%cI%x00%B%x00', branch, '--'
+            )
+            
             commits = []
-            for commit in self.repo.iter_commits(branch, max_count=limit):
-                commit_data = {
-                    'hash': commit.hexsha,
-                    'message': commit.message.strip(),
-                    'author': commit.author.name,
-                    'date': commit.committed_datetime.isoformat(),
-                    'files_changed': len(commit.stats.files),
-                    'insertions': commit.stats.total['insertions'],
-                    'deletions': commit.stats.total['deletions']
-                }
-                commits.append(commit_data)
+            tip = branch if after is not None else None
+            for record in stdout.decode('utf-8', 'replace').split('\x1e')[1:]:
+                commit_hash, author, date, message, numstat = record.split('\x00', 4)
+                files, insertions, deletions = 0, 0, 0
+                for line in numstat.splitlines():
+                    parts = line.split('\t', 2)
+                    if len(parts) != 3:
+                        continue
+                    files += 1
+                    # Binary files report "-" for both counts
+                    insertions += int(parts[0]) if parts[0] != '-' else 0
+                    deletions += int(parts[1]) if parts[1] != '-' else 0
+                if tip is None:
+                    # git log lists its starting commit first
+                    tip = commit_hash
+                commits.append({
+                    'hash': commit_hash,
+                    'message': message.strip(),
+                    'author': author,
+                    'date': date,
+                    'files_changed': files,
+                    'insertions': insertions,
+                    'deletions': deletions,
+                    'cursor': f"{tip}:{skip + len(commits) + 1}"
+                })
             
             logger.info(f"📊 Retrieved {len(commits)} recent commits")
             return commits
@@ -191,6 +386,20 @@ class GitIntegration:
             logger.error(f"❌ Failed to create branch: {e}")
             return False
     
+    async def read_blobs(self, shas: List[str]) -> List[Optional[bytes]]:
+        """Read blob contents straight from the object database, in order (None if missing)"""
+        
+        try:
+            return await _read_git_blobs(self.repo_path, shas)
+        except Exception as e:
+            logger.error(f"❌ Failed to read blobs: {e}")
+            return [None] * len(shas)
+    
+    async def read_blob(self, sha: str) -> Optional[bytes]:
+        """Read one blob without touching the working tree"""
+        
+        return (await self.read_blobs([sha]))[0]
+    
     async def commit_changes(self, message: str, files: Optional[List[str]] = None) -> Optional[str]:
         """Commit changes to the repository"""
         
@@ -219,18 +428,55 @@ class GitHubIntegration:
     GitHub API integration for PR management
     """
     
-    def __init__(self, token: str, repo_owner: str, repo_name: str):
+    def __init__(self, token: str, repo_owner: str, repo_name: str,
+                 base_url: Optional[str] = None, graphql_url: Optional[str] = None):
         self.token = token
         self.repo_owner = repo_owner
         self.repo_name = repo_name
-        self.base_url = "https://api.github.com"
+        self.base_url = (base_url or Config.GITHUB_API_URL).rstrip('/')
+        self.graphql_url = graphql_url or self._graphql_endpoint(self.base_url)
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.session = self._create_session() if GITHUB_API_AVAILABLE else None
         
         logger.info(f"🐙 GitHub integration initialized: {repo_owner}/{repo_name}")
     
+    @staticmethod
+    def _graphql_endpoint(base_url: str) -> str:
+        """GraphQL URL for a REST base URL.
+
+        GitHub Enterprise Server serves REST under ``https://host/api/v3`` and
+        GraphQL at ``https://host/api/graphql``; github.com uses ``/graphql``.
+        """
+        if base_url.endswith('/api/v3'):
+            return base_url[:-len('/v3')] + '/graphql'
+        return f"{base_url}/graphql"
+    
+    def _create_session(self) -> "requests.Session":
+        """Create a keep-alive session, caching GETs on disk when CacheControl is installed.
+
+        Cached responses are revalidated with If-None-Match / If-Modified-Since;
+        GitHub answers unchanged resources with 304, which does not count
+        against the rate limit. POSTs pass through the cache untouched.
+        Requests run in worker threads so concurrent calls overlap instead of
+        blocking the event loop; the session's connection pool is shared.
+        """
+        session = requests.Session()
+        cache_dir = Config.GITHUB_HTTP_CACHE_DIR
+        if CACHECONTROL_AVAILABLE and cache_dir:
+            try:
+                session = CacheControl(session, cache=FileCache(cache_dir))
+            except Exception as e:
+                logger.warning(f"⚠️ GitHub HTTP cache unavailable: {e}")
+        return session
+    
+    def close(self):
+        """Close pooled connections"""
+        if self.session is not None:
+            self.session.close()
+    
     async def create_pull_request(self, title: str, body: str, head: str, base: str = "main") -> Optional[Dict[str, Any]]:
         """Create a pull request"""
         
@@ -243,7 +489,7 @@ class GitHubIntegration:
                 "base": base
             }
             
-            response = requests.post(url, headers=self.headers, json=data)
+            response = await _run_blocking(self.session.post, url, headers=self.headers, json=data)
             
             if response.status_code == 201:
                 pr_data = response.json()
@@ -260,19 +506,89 @@ class GitHubIntegration:
     async def get_pull_requests(self, state: str = "open", limit: int = 10) -> List[Dict[str, Any]]:
         """Get pull requests"""
         
+        prs, _ = await self.get_pull_requests_page(state, limit)
+        return prs
+    
+    async def get_pull_requests_page(self, state: str = "open", limit: int = 10,
+                                     cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one page of pull requests and the cursor for the next page
+
+        The cursor is GitHub's ``Link: rel="next"`` URL, so following pages are
+        fetched directly rather than re-requesting from page 1.
+        """
+        
         try:
-            url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls"
-            params = {"state": state, "per_page": limit}
-            
-            response = requests.get(url, headers=self.headers, params=params)
+            if cursor is not None:
+                # Only follow cursors back to the API so the token never leaves it
+                if not cursor.startswith(f"{self.base_url}/"):
+                    raise ValueError(f"invalid pull request cursor: {cursor!r}")
+                response = await _run_blocking(self.session.get, cursor, headers=self.headers)
+            else:
+                url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls"
+                params = {"state": state, "per_page": limit}
+                response = await _run_blocking(self.session.get, url, headers=self.headers, params=params)
             
             if response.status_code == 200:
                 prs = response.json()
+                next_cursor = response.links.get('next', {}).get('url')
                 logger.info(f"📋 Retrieved {len(prs)} pull requests")
-                return prs
+                return prs, next_cursor
             
             logger.error(f"❌ Failed to get PRs: {response.text}")
-            return []
+            return [], None
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to get PRs: {e}")
+            return [], None
+    
+    async def get_pull_requests_full(self, state: str = "open", limit: int = 10) -> List[PullRequest]:
+        """Get pull requests with their changed files and reviews in one GraphQL request"""
+        
+        try:
+            variables = {
+                "owner": self.repo_owner,
+                "name": self.repo_name,
+                "n": limit,
+                "states": _PULL_REQUEST_STATES[state],
+            }
+            response = await _run_blocking(
+                self.session.post, self.graphql_url,
+                headers=self.headers, json={"query": _PULL_REQUESTS_QUERY, "variables": variables}
+            )
+            
+            payload = response.json() if response.status_code == 200 else {}
+            if not payload.get('data') or payload.get('errors'):
+                logger.error(f"❌ Failed to get PRs: {payload.get('errors') or response.text}")
+                return []
+            
+            prs = []
+            for node in payload['data']['repository']['pullRequests']['nodes']:
+                prs.append(PullRequest(
+                    pr_id=str(node['number']),
+                    title=node['title'],
+                    description=node['body'] or "",
+                    source_branch=node['headRefName'],
+                    target_branch=node['baseRefName'],
+                    author=(node['author'] or {}).get('login', ''),
+                    files_changed=[f['path'] for f in (node['files'] or {}).get('nodes', [])],
+                    lines_added=node['additions'],
+                    lines_removed=node['deletions'],
+                    status=node['state'].lower(),
+                    reviews=[
+                        {
+                            'author': (review['author'] or {}).get('login', ''),
+                            'state': review['state'],
+                            'body': review['body'],
+                            'submitted_at': review['submittedAt']
+                        }
+                        for review in node['reviews']['nodes']
+                    ],
+                    automated_analysis=None,
+                    created_at=node['createdAt']
+                ))
+            
+            logger.info(f"📋 Retrieved {len(prs)} pull requests with files and reviews")
+            return prs
             
         except Exception as e:
             logger.error(f"❌ Failed to get PRs: {e}")
@@ -288,7 +604,7 @@ class GitHubIntegration:
                 "event": event  # APPROVE, REQUEST_CHANGES, COMMENT
             }
             
-            response = requests.post(url, headers=self.headers, json=data)
+            response = await _run_blocking(self.session.post, url, headers=self.headers, json=data)
             
             if response.status_code == 200:
                 logger.info(f"✅ Submitted PR review: #{pr_number}")
@@ -300,13 +616,27 @@ class GitHubIntegration:
         except Exception as e:
             logger.error(f"❌ Failed to review PR: {e}")
             return False
+    
+    async def review_pull_requests(self, reviews: List[Tuple[int, str, str]]) -> List[bool]:
+        """Submit several ``(pr_number, body, event)`` reviews concurrently"""
+        
+        return list(await asyncio.gather(*(
+            self.review_pull_request(pr_number, body, event) for pr_number, body, event in reviews
+        )))
 
 class CodeAnalyzer:
     """
     Advanced code analyzer for quality and patterns
     """
+
+    security_patterns = {
+        'SQL Injection': [r'SELECT\s+.*\s+WHERE\s+.*\+', r'INSERT\s+.*\s+VALUES\s+.*\+'],
+        'XSS': [r'innerHTML\s*=\s*.*\+', r'document\.write\s*\('],
+        'Hardcoded Secrets': [r'password\s*=\s*[\'"][^\'"]+[\'"]', r'api_key\s*=\s*[\'"][^\'"]+[\'"]'],
+        'Unsafe Eval': [r'eval\s*\(', r'exec\s*\(']
+    }
     
-    def __init__(self):
+    def __init__(self, cache_size: Optional[int] = None, cache_dir: Optional[str] = None):
         self.language_patterns = {
             'python': {
                 'extensions': ['.py'],
@@ -320,6 +650,15 @@ class CodeAnalyzer:
                 'quality_indicators': {
                     'good': [r'def\s+test_', r'""".*"""', r'#\s+.*'],
                     'bad': [r'TODO:', r'FIXME:', r'XXX:', r'print\(']
+                },
+                'import_patterns': [
+                    r'import\s+([^\s,]+)',
+                    r'from\s+([^\s]+)\s+import'
+                ],
+                'performance_patterns': {
+                    'Nested Loops': [r'for\s+.*:\s*.*for\s+.*:'],
+                    'Inefficient String Concat': [r'\+\s*=\s*.*\+'],
+                    'Global Variables': [r'global\s+\w+']
                 }
             },
             'javascript': {
@@ -334,47 +673,278 @@ class CodeAnalyzer:
                 'quality_indicators': {
                     'good': [r'test\(', r'/\*\*.*\*/', r'//\s+.*'],
                     'bad': [r'TODO:', r'FIXME:', r'console\.log\(']
+                },
+                'import_patterns': [
+                    r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]',
+                    r'require\([\'"]([^\'"]+)[\'"]\)'
+                ],
+                'performance_patterns': {
+                    'Nested Loops': [r'for\s*\(.*\)\s*{.*for\s*\('],
+                    'DOM Queries in Loops': [r'for\s*\(.*document\.'],
+                    'Memory Leaks': [r'setInterval\s*\(', r'addEventListener\s*\(']
                 }
             }
         }
-        
+
+        # Compile every pattern once. Patterns stay separate rather than being
+        # joined into one alternation: each starts with a literal, which lets
+        # the regex engine skip ahead, and their matches may overlap.
+        self._compiled: Dict[str, Dict[str, Any]] = {}
+        for language, config in self.language_patterns.items():
+            indicators = config['quality_indicators']
+            self._compiled[language] = {
+                'complexity': [re.compile(p, re.IGNORECASE) for p in config['complexity_patterns']],
+                'good': [re.compile(p, re.IGNORECASE) for p in indicators['good']],
+                'bad': [
+                    (p, re.compile(p, re.IGNORECASE | re.MULTILINE), _literal_prefix(p))
+                    for p in indicators['bad']
+                ],
+                'deps': [re.compile(p) for p in config['import_patterns']],
+                'perf': {
+                    concern: [re.compile(p, re.IGNORECASE | re.DOTALL) for p in patterns]
+                    for concern, patterns in config['performance_patterns'].items()
+                },
+            }
+        self._compiled_security = {
+            concern: [(re.compile(p, re.IGNORECASE), _literal_prefix(p)) for p in patterns]
+            for concern, patterns in self.security_patterns.items()
+        }
+
+        # Two-tier result cache keyed by path and content digest: an in-memory
+        # LRU for watch mode and a SQLite table that survives between runs
+        self.cache_size = Config.CODE_ANALYSIS_CACHE_SIZE if cache_size is None else cache_size
+        self._mem_cache: "OrderedDict[str, CodeAnalysis]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._disk_cache = self._open_disk_cache(
+            Config.CODE_ANALYSIS_CACHE_DIR if cache_dir is None else cache_dir
+        )
+
         logger.info("🔍 Code Analyzer initialized")
+
+    def _open_disk_cache(self, cache_dir: str) -> Optional[sqlite3.Connection]:
+        """Open the on-disk analysis cache, keeping only the newest rows."""
+        if not cache_dir:
+            return None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(cache_dir, 'code_analysis.sqlite'), check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS analysis (key TEXT PRIMARY KEY, json TEXT, ts REAL)")
+            conn.execute(
+                "DELETE FROM analysis WHERE key NOT IN "
+                "(SELECT key FROM analysis ORDER BY ts DESC LIMIT ?)",
+                (Config.CODE_ANALYSIS_CACHE_ROWS,)
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Code analysis disk cache unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _cache_key(file_path: str, content: str) -> str:
+        """Key an analysis by absolute path and a digest of the file content."""
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=20).hexdigest()
+        return f"{_ANALYSIS_CACHE_VERSION}:{os.path.abspath(file_path)}:{digest}"
+
+    @staticmethod
+    def _new_analysis_id(now: datetime) -> str:
+        return f"analysis_{now:%Y%m%d_%H%M%S}_{next(_ANALYSIS_SEQ):04d}"
+
+    def _copy_analysis(self, analysis: CodeAnalysis, file_path: str, fresh: bool = False) -> CodeAnalysis:
+        """Copy an analysis for ``file_path`` so callers never share cached lists.
+
+        With ``fresh`` the copy is stamped as a new analysis (id and time), as
+        every cache hit is; the stored entry keeps the original stamp.
+        """
+        now = datetime.now()
+        return replace(
+            analysis,
+            analysis_id=self._new_analysis_id(now) if fresh else analysis.analysis_id,
+            analyzed_at=now.isoformat() if fresh else analysis.analyzed_at,
+            file_path=file_path,
+            issues=[dict(issue) for issue in analysis.issues],
+            suggestions=list(analysis.suggestions),
+            dependencies=list(analysis.dependencies),
+            security_concerns=list(analysis.security_concerns),
+            performance_concerns=list(analysis.performance_concerns)
+        )
+
+    def _cache_get(self, key: str, file_path: str) -> Optional[CodeAnalysis]:
+        """Return a copy of a cached analysis from memory, then disk, for ``file_path``."""
+        with self._cache_lock:
+            analysis = self._mem_cache.get(key)
+            if analysis is not None:
+                self._mem_cache.move_to_end(key)
+                return self._copy_analysis(analysis, file_path, fresh=True)
+            if self._disk_cache is None:
+                return None
+            row = self._disk_cache.execute("SELECT json FROM analysis WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        data['quality'] = CodeQuality(data['quality'])
+        analysis = CodeAnalysis(**data)
+        self._remember(key, analysis)
+        return self._copy_analysis(analysis, file_path, fresh=True)
+
+    def _cache_put(self, key: str, analysis: CodeAnalysis):
+        """Store a fresh analysis in both cache tiers."""
+        self._remember(key, self._copy_analysis(analysis, analysis.file_path))
+        if self._disk_cache is None:
+            return
+        data = asdict(analysis)
+        data['quality'] = analysis.quality.value
+        with self._cache_lock:
+            try:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO analysis (key, json, ts) VALUES (?, ?, ?)",
+                    (key, json.dumps(data), time.time())
+                )
+                self._disk_cache.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Failed to cache analysis: {e}")
+
+    def _remember(self, key: str, analysis: CodeAnalysis):
+        """Add an analysis to the bounded in-memory LRU."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._mem_cache[key] = analysis
+            self._mem_cache.move_to_end(key)
+            while len(self._mem_cache) > self.cache_size:
+                self._mem_cache.popitem(last=False)
     
     async def analyze_file(self, file_path: str) -> Optional[CodeAnalysis]:
         """Analyze a single code file"""
         
+        return await _run_blocking(self._analyze_sync, file_path)
+    
+    async def analyze_files(self, paths: List[str]) -> List[Optional[CodeAnalysis]]:
+        """Analyze several files concurrently, in the order given.
+
+        Reads and cache lookups overlap across worker threads; the regex scans
+        themselves hold the GIL, so unchanged (cached) files are where most of
+        the speedup on a repeated run comes from.
+        """
+        
+        return list(await asyncio.gather(*(
+            _run_blocking(self._analyze_sync, path) for path in paths
+        )))
+    
+    async def analyze_repo(self, repo_path: str = ".") -> List[CodeAnalysis]:
+        """Analyze every tracked source file in a git repository"""
+        
+        try:
+            # Tracked files from the index, without walking the working tree
+            stdout = await _run_git(repo_path, 'ls-files', '-z')
+        except Exception as e:
+            logger.error(f"❌ Failed to list repository files: {e}")
+            return []
+        
+        paths = [
+            os.path.join(repo_path, name)
+            for name in stdout.decode('utf-8', 'replace').split('\0')
+            if name and self._detect_language(name) != 'unknown'
+        ]
+        analyses = await self.analyze_files(paths)
+        return [analysis for analysis in analyses if analysis is not None]
+    
+    async def analyze_revision(self, repo_path: str = ".", rev: str = "HEAD") -> List[CodeAnalysis]:
+        """Analyze the source files of a commit straight from the object database.
+
+        Nothing is read from or written to a working tree, so this also works on
+        bare repositories and on revisions other than the checked-out one.
+        """
+        
+        try:
+            listing = await _run_git(repo_path, 'ls-tree', '-r', '-z', '--full-tree', rev, '--')
+            entries = []
+            for record in listing.decode('utf-8', 'replace').split('\0'):
+                # "<mode> <type> <sha>\t<path>"
+                meta, _, name = record.partition('\t')
+                fields = meta.split()
+                if len(fields) == 3 and fields[1] == 'blob' and self._detect_language(name) != 'unknown':
+                    entries.append((os.path.join(repo_path, name), fields[2]))
+            blobs = await _read_git_blobs(repo_path, [sha for _, sha in entries])
+        except Exception as e:
+            logger.error(f"❌ Failed to read revision {rev}: {e}")
+            return []
+        
+        analyses = await asyncio.gather(*(
+            _run_blocking(self._analyze_content, path, data)
+            for (path, _), data in zip(entries, blobs) if data is not None
+        ))
+        return [analysis for analysis in analyses if analysis is not None]
+    
+    def _analyze_sync(self, file_path: str) -> Optional[CodeAnalysis]:
+        """Blocking body of ``analyze_file``"""
+        
         if not os.path.exists(file_path):
             logger.warning(f"⚠️ File not found: {file_path}")
             return None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            language = self._detect_language(file_path)
+            if language == 'unknown' and os.path.getsize(file_path) > _UNKNOWN_LANGUAGE_MAX_BYTES:
+                logger.debug(f"Skipping large file in unknown language: {file_path}")
+                return None
             
-            # Detect language
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except Exception as e:
+            logger.error(f"❌ Failed to analyze {file_path}: {e}")
+            return None
+        
+        return self._analyze_content(file_path, raw)
+    
+    def _analyze_content(self, file_path: str, raw: bytes) -> Optional[CodeAnalysis]:
+        """Analyze file bytes read from disk or from a git blob"""
+        
+        try:
             language = self._detect_language(file_path)
+            if language == 'unknown' and len(raw) > _UNKNOWN_LANGUAGE_MAX_BYTES:
+                return None
+            
+            # Binary blobs (NUL in the first 4 KiB) are not source code
+            if b'\0' in raw[:4096]:
+                logger.debug(f"Skipping binary file: {file_path}")
+                return None
+            
+            # Same text as universal-newline mode, decoded once from the raw bytes
+            content = raw.decode('utf-8')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
-            # Count lines of code
+            # Unchanged files skip all pattern work
+            cache_key = self._cache_key(file_path, content)
+            cached = self._cache_get(cache_key, file_path)
+            if cached is not None:
+                logger.debug(f"📦 Cached analysis for {file_path}")
+                return cached
+            
+            # Count lines of code (split once; the helpers below reuse the lines)
             lines = content.split('\n')
+            line_count = len(lines)
             loc = len([line for line in lines if line.strip() and not line.strip().startswith('#')])
             
             # Calculate complexity
-            complexity = self._calculate_complexity(content, language)
+            complexity = self._calculate_complexity(content, language, line_count)
             
             # Identify issues
-            issues = self._identify_issues(content, language)
+            issues = self._identify_issues(content, language, lines)
             
             # Generate suggestions
-            suggestions = self._generate_suggestions(content, language, issues)
+            suggestions = self._generate_suggestions(content, language, issues, line_count)
             
             # Calculate maintainability
-            maintainability = self._calculate_maintainability(content, language, complexity, len(issues))
+            maintainability = self._calculate_maintainability(content, language, complexity, len(issues), line_count)
             
             # Determine overall quality
             quality = self._determine_quality(complexity, len(issues), maintainability)
             
+            now = datetime.now()
             analysis = CodeAnalysis(
-                analysis_id=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                analysis_id=self._new_analysis_id(now),
                 file_path=file_path,
                 language=language,
                 lines_of_code=loc,
@@ -387,9 +957,10 @@ class CodeAnalyzer:
                 security_concerns=self._identify_security_concerns(content, language),
                 performance_concerns=self._identify_performance_concerns(content, language),
                 maintainability_score=maintainability,
-                analyzed_at=datetime.now().isoformat()
+                analyzed_at=now.isoformat()
             )
             
+            self._cache_put(cache_key, analysis)
             logger.info(f"📊 Analyzed {file_path}: {quality.value} quality, {complexity:.1f} complexity")
             return analysis
             
@@ -408,33 +979,33 @@ class CodeAnalyzer:
         
         return 'unknown'
     
-    def _calculate_complexity(self, content: str, language: str) -> float:
+    def _calculate_complexity(self, content: str, language: str, line_count: Optional[int] = None) -> float:
         """Calculate cyclomatic complexity"""
         
         if language not in self.language_patterns:
             return 1.0
         
-        patterns = self.language_patterns[language]['complexity_patterns']
         complexity = 1  # Base complexity
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            complexity += len(matches)
+        for regex in self._compiled[language]['complexity']:
+            # Count matches without materializing the matched text
+            complexity += sum(1 for _ in regex.finditer(content))
         
         # Normalize by lines of code
-        lines = len(content.split('\n'))
+        lines = content.count('\n') + 1 if line_count is None else line_count
         return min(complexity / max(lines, 1) * 100, 20.0)  # Cap at 20
     
-    def _identify_issues(self, content: str, language: str) -> List[Dict[str, Any]]:
+    def _identify_issues(self, content: str, language: str,
+                         lines: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Identify code issues"""
         
         issues = []
-        lines = content.split('\n')
         
-        # Generic issues
-        for i, line in enumerate(lines, 1):
-            line_content = line.strip()
-            
+        # Generic issues: pick out flagged lines first, then build issues for those only
+        flagged = [
+            (i, line) for i, line in enumerate(content.split('\n') if lines is None else lines, 1)
+            if len(line) > 120 or 'TODO:' in line
+        ]
+        for i, line in flagged:
             # Long lines
             if len(line) > 120:
                 issues.append({
@@ -446,7 +1017,7 @@ class CodeAnalyzer:
                 })
             
             # TODO comments
-            if 'TODO:' in line_content:
+            if 'TODO:' in line:
                 issues.append({
                     'type': 'maintenance',
                     'severity': 'minor',
@@ -457,11 +1028,15 @@ class CodeAnalyzer:
         
         # Language-specific issues
         if language in self.language_patterns:
-            bad_patterns = self.language_patterns[language]['quality_indicators']['bad']
-            for pattern in bad_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
+            folded = self._fold_for_prefilter(content)
+            for pattern, regex, literal in self._compiled[language]['bad']:
+                if literal not in folded:
+                    continue
+                line_num, offset = 1, 0
+                for match in regex.finditer(content):
+                    # Matches arrive in order, so only count newlines since the last one
+                    line_num += content.count('\n', offset, match.start())
+                    offset = match.start()
                     issues.append({
                         'type': 'quality',
                         'severity': 'minor',
@@ -472,7 +1047,8 @@ class CodeAnalyzer:
         
         return issues
     
-    def _generate_suggestions(self, content: str, language: str, issues: List[Dict[str, Any]]) -> List[str]:
+    def _generate_suggestions(self, content: str, language: str, issues: List[Dict[str, Any]],
+                              line_count: Optional[int] = None) -> List[str]:
         """Generate improvement suggestions"""
         
         suggestions = []
@@ -482,7 +1058,7 @@ class CodeAnalyzer:
             suggestions.append("Consider refactoring this file - it has many issues")
         
         # Based on size
-        lines = len(content.split('\n'))
+        lines = content.count('\n') + 1 if line_count is None else line_count
         if lines > 500:
             suggestions.append("Consider breaking this large file into smaller modules")
         
@@ -500,10 +1076,11 @@ class CodeAnalyzer:
         
         return suggestions
     
-    def _calculate_maintainability(self, content: str, language: str, complexity: float, issue_count: int) -> float:
+    def _calculate_maintainability(self, content: str, language: str, complexity: float, issue_count: int,
+                                   line_count: Optional[int] = None) -> float:
         """Calculate maintainability score (0-100)"""
         
-        lines = len(content.split('\n'))
+        lines = content.count('\n') + 1 if line_count is None else line_count
         
         # Base score
         score = 100.0
@@ -520,10 +1097,8 @@ class CodeAnalyzer:
         
         # Bonus for good practices
         if language in self.language_patterns:
-            good_patterns = self.language_patterns[language]['quality_indicators']['good']
-            for pattern in good_patterns:
-                matches = len(re.findall(pattern, content, re.IGNORECASE))
-                score += matches * 2
+            for regex in self._compiled[language]['good']:
+                score += sum(1 for _ in regex.finditer(content)) * 2
         
         return max(0, min(100, score))
     
@@ -544,79 +1119,52 @@ class CodeAnalyzer:
     def _extract_dependencies(self, content: str, language: str) -> List[str]:
         """Extract dependencies from code"""
         
-        dependencies = []
-        
-        if language == 'python':
-            # Import statements
-            import_patterns = [
-                r'import\s+([^\s,]+)',
-                r'from\s+([^\s]+)\s+import'
-            ]
-            for pattern in import_patterns:
-                matches = re.findall(pattern, content)
-                dependencies.extend(matches)
+        dependencies = set()
         
-        elif language == 'javascript':
+        if language in self._compiled:
             # Import/require statements
-            import_patterns = [
-                r'import\s+.*\s+from\s+[\'"]([^\'"]+)[\'"]',
-                r'require\([\'"]([^\'"]+)[\'"]\)'
-            ]
-            for pattern in import_patterns:
-                matches = re.findall(pattern, content)
-                dependencies.extend(matches)
-        
-        return list(set(dependencies))  # Remove duplicates
+            for regex in self._compiled[language]['deps']:
+                dependencies.update(regex.findall(content))
+        
+        return list(dependencies)
     
     def _identify_security_concerns(self, content: str, language: str) -> List[str]:
         """Identify potential security concerns"""
         
-        concerns = []
-        
-        # Generic security patterns
-        security_patterns = {
-            'SQL Injection': [r'SELECT\s+.*\s+WHERE\s+.*\+', r'INSERT\s+.*\s+VALUES\s+.*\+'],
-            'XSS': [r'innerHTML\s*=\s*.*\+', r'document\.write\s*\('],
-            'Hardcoded Secrets': [r'password\s*=\s*[\'"][^\'"]+[\'"]', r'api_key\s*=\s*[\'"][^\'"]+[\'"]'],
-            'Unsafe Eval': [r'eval\s*\(', r'exec\s*\(']
-        }
-        
-        for concern_type, patterns in security_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    concerns.append(concern_type)
-                    break
-        
-        return concerns
+        # Generic security patterns; most files contain none of their literals
+        folded = self._fold_for_prefilter(content)
+        return [
+            concern_type
+            for concern_type, patterns in self._compiled_security.items()
+            if any(
+                literal in folded and regex.search(content)
+                for regex, literal in patterns
+            )
+        ]
+    
+    @staticmethod
+    def _fold_for_prefilter(content: str) -> str:
+        """Lowercase content so a substring test can rule out case-insensitive patterns.
+
+        A pattern's literal prefix missing from the folded text means the regex
+        cannot match. re also folds a few non-ASCII letters ('ı', 'K', ...) onto
+        ASCII ones, so those are mapped first to keep the test exact.
+        """
+        if content.isascii():
+            return content.lower()
+        return content.translate(_IGNORECASE_ASCII_FOLD).lower()
     
     def _identify_performance_concerns(self, content: str, language: str) -> List[str]:
         """Identify potential performance concerns"""
         
-        concerns = []
-        
-        # Generic performance patterns
-        if language == 'python':
-            perf_patterns = {
-                'Nested Loops': [r'for\s+.*:\s*.*for\s+.*:'],
-                'Inefficient String Concat': [r'\+\s*=\s*.*\+'],
-                'Global Variables': [r'global\s+\w+']
-            }
-        elif language == 'javascript':
-            perf_patterns = {
-                'Nested Loops': [r'for\s*\(.*\)\s*{.*for\s*\('],
-                'DOM Queries in Loops': [r'for\s*\(.*document\.'],
-                'Memory Leaks': [r'setInterval\s*\(', r'addEventListener\s*\(']
-            }
-        else:
-            perf_patterns = {}
-        
-        for concern_type, patterns in perf_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
-                    concerns.append(concern_type)
-                    break
+        if language not in self._compiled:
+            return []
         
-        return concerns
+        return [
+            concern_type
+            for concern_type, regexes in self._compiled[language]['perf'].items()
+            if any(regex.search(content) for regex in regexes)
+        ]
 
 class CodeGenerator:
     """
@@ -43,6 +43,8 @@ class CompanyInterviewKB:
         self.patterns = {}
         self.system_design_patterns = {}
         self.behavioral_frameworks = {}
+        # Bumped whenever patterns are added so cached answers can detect KB changes
+        self.version = 0
         self._initialize_knowledge_base()
     
     def _initialize_knowledge_base(self):
@@ -386,6 +388,7 @@ class CompanyInterviewKB:
         
         pattern_key = f"{pattern.company}_{pattern.question_type}"
         self.patterns[pattern_key] = pattern
+        self.version += 1
         
         # Add to vector knowledge base for retrieval
         content = f"Company: {pattern.company}\nType: {pattern.question_type}\nPattern: {pattern.pattern}\nQuestions: {'; '.join(pattern.example_questions)}"
@@ -30,6 +30,11 @@ class Config:
     AI_INTERACTION_MODE = os.getenv("AI_INTERACTION_MODE", "private")  # private, public, silent
     AI_RESPONSE_DELAY = int(os.getenv("AI_RESPONSE_DELAY", "3"))  # seconds before responding
     CONVERSATION_MEMORY_DAYS = int(os.getenv("CONVERSATION_MEMORY_DAYS", "30"))  # days to keep conversations
+    RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))  # cached AI responses (0 disables)
+    RESPONSE_CACHE_SEMANTIC = os.getenv("RESPONSE_CACHE_SEMANTIC", "true").lower() == "true"
+    RESPONSE_CACHE_SIMILARITY = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.95"))  # cosine threshold
+    RESPONSE_CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR", "")  # set to persist answers on disk (off by default)
+    RESPONSE_CACHE_ROWS = int(os.getenv("RESPONSE_CACHE_ROWS", "5000"))  # disk rows kept between runs
 
     # Session mode determines default behaviors
     SESSION_MODE = os.getenv("SESSION_MODE", "general")  # general, interview
@@ -54,6 +59,7 @@ class Config:
     AUDIO_CHUNK_DURATION = int(os.getenv("AUDIO_CHUNK_DURATION", "5"))  # seconds per chunk
     SCREEN_ANALYSIS_INTERVAL = int(os.getenv("SCREEN_ANALYSIS_INTERVAL", "30"))  # seconds
     AI_ASSISTANCE_THRESHOLD = float(os.getenv("AI_ASSISTANCE_THRESHOLD", "0.7"))  # confidence threshold
+    CODING_WORKSPACE_DIR = os.getenv("CODING_WORKSPACE_DIR", "")  # watched recursively during coding sessions; empty disables
 
     # Question boundary detector settings
     QUESTION_SILENCE_MS_MIN = int(os.getenv("QUESTION_SILENCE_MS_MIN", "700"))
@@ -62,8 +68,12 @@ class Config:
     
     # Audio recording settings
     SAMPLE_RATE = int(os.getenv("SAMPLE_RATE", "44100"))
+    TRANSCRIBE_SAMPLE_RATE = int(os.getenv("TRANSCRIBE_SAMPLE_RATE", "16000"))  # live audio fed to ASR
     CHANNELS = int(os.getenv("CHANNELS", "1"))
     CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1024"))
+    GAIN_MULTIPLIER = float(os.getenv("GAIN_MULTIPLIER", "1.0"))  # applied to recorded PCM, hard-clipped
+    RECORDING_FORMAT = os.getenv("RECORDING_FORMAT", "wav")  # wav, or flac/opus (speech-tuned) encoded live by ffmpeg
+    RECORDING_CHECKPOINT_SECONDS = float(os.getenv("RECORDING_CHECKPOINT_SECONDS", "30"))  # streamed files made playable
 
     # Screen recording settings
     SCREEN_FPS = int(os.getenv("SCREEN_FPS", "10"))
@@ -78,6 +88,12 @@ class Config:
     # File storage settings
     RECORDINGS_DIR = os.getenv("RECORDINGS_DIR", "./data/recordings")
     TEMP_DIR = os.getenv("TEMP_DIR", "/tmp/mentor_app")
+    CODE_ANALYSIS_CACHE_DIR = os.getenv("CODE_ANALYSIS_CACHE_DIR", "./data/cache")  # empty disables the disk tier
+    CODE_ANALYSIS_CACHE_SIZE = int(os.getenv("CODE_ANALYSIS_CACHE_SIZE", "256"))  # in-memory analyses (0 disables)
+    CODE_ANALYSIS_CACHE_ROWS = int(os.getenv("CODE_ANALYSIS_CACHE_ROWS", "5000"))  # disk rows kept between runs
+    GIT_COMMIT_GRAPH = os.getenv("GIT_COMMIT_GRAPH", "true").lower() == "true"  # Bloom filters for file history
+    GITHUB_API_URL = os.getenv("GITHUB_API", "https://api.github.com")  # https://host/api/v3 for GitHub Enterprise
+    GITHUB_HTTP_CACHE_DIR = os.getenv("GITHUB_HTTP_CACHE_DIR", "./data/cache/github_http")  # empty disables
     
     @classmethod
     def validate(cls, require_api_key=True):
@@ -38,6 +38,8 @@ class ProfileManager:
         
         # Initialize empty profile
         self.profile_data = self.load_profile()
+        # Bumped on every successful save so callers can cheaply detect profile changes
+        self.version = 0
         
     def load_profile(self) -> Dict[str, Any]:
         """Load existing profile or create empty one"""
@@ -94,6 +96,7 @@ class ProfileManager:
             
             with open(self.profile_file, 'w', encoding='utf-8') as f:
                 json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            self.version += 1
             
             logger.info("✅ Profile saved successfully")
             return True
@@ -27,8 +27,25 @@ except ImportError:
     DiarizationService = None  # type: ignore[assignment]
     MemoryService = None  # type: ignore[assignment]
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+
+def _dumps(value: Any) -> str:
+    """Serialize a client message, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
+
 class RealtimeSessionManager:
     """
     Manages real-time AI sessions with the complete intelligence loop:
@@ -158,13 +175,22 @@ class RealtimeSession:
 
     def add_caption(self, caption_data: Dict):
         """Add a new caption to the buffer"""
-        self.last_activity = datetime.now()
+        self.add_captions([caption_data])
+
+    def add_captions(self, captions: List[Dict]):
+        """Add several captions at once, updating the buffer a single time"""
+        if not captions:
+            return
+        now = datetime.now()
+        self.last_activity = now
         
         # Add timestamp if not present
-        if 'timestamp' not in caption_data:
-            caption_data['timestamp'] = datetime.now().isoformat()
+        stamp = now.isoformat()
+        for caption_data in captions:
+            if 'timestamp' not in caption_data:
+                caption_data['timestamp'] = stamp
         
-        self.caption_buffer.append(caption_data)
+        self.caption_buffer.extend(captions)
         
         # Keep buffer at reasonable size
         if len(self.caption_buffer) > 100:
@@ -172,15 +198,23 @@ class RealtimeSession:
         
         # Store in memory if available
         if self.memory:
-            self.memory.add_meeting_entry(
-                self.session_id,
-                caption_data.get('text', ''),
-                {
-                    'speaker': caption_data.get('speaker', 'unknown'),
-                    'timestamp': caption_data['timestamp'],
-                    'meeting_type': self.meeting_type
-                }
-            )
+            entries = [
+                (
+                    caption_data.get('text', ''),
+                    {
+                        'speaker': caption_data.get('speaker', 'unknown'),
+                        'timestamp': caption_data['timestamp'],
+                        'meeting_type': self.meeting_type
+                    }
+                )
+                for caption_data in captions
+            ]
+            if len(entries) > 1 and hasattr(self.memory, 'add_meeting_entries'):
+                # One commit per store for the whole batch
+                self.memory.add_meeting_entries(self.session_id, entries)
+            else:
+                for text, metadata in entries:
+                    self.memory.add_meeting_entry(self.session_id, text, metadata)
 
     def _detect_question_boundary(self, captions: List[Dict], speakers: Dict) -> Optional[str]:
         """Detect when a complete question has been asked"""
@@ -307,10 +341,11 @@ class RealtimeSession:
             'data': qa_entry
         }
         
-        # Send to all client queues
+        # Encode once and send to all client queues
+        payload = _dumps(message)
         for client_id, client_queue in self.client_queues.items():
             try:
-                client_queue.put(json.dumps(message))
+                client_queue.put(payload)
             except Exception as e:
                 log.error(f"Failed to send to client {client_id}: {e}")
 
@@ -322,9 +357,10 @@ class RealtimeSession:
             'data': data,
         }
 
+        payload = _dumps(message)
         for client_id, client_queue in self.client_queues.items():
             try:
-                client_queue.put(json.dumps(message))
+                client_queue.put(payload)
             except Exception as e:
                 log.error(f"Failed to send to client {client_id}: {e}")
 
@@ -350,9 +386,10 @@ class RealtimeSession:
     def cleanup(self):
         """Clean up session resources"""
         # Close all client queues
+        payload = _dumps({'type': 'session_ended'})
         for client_queue in self.client_queues.values():
             try:
-                client_queue.put(json.dumps({'type': 'session_ended'}))
+                client_queue.put(payload)
             except:
                 pass
         self.client_queues.clear()
@@ -0,0 +1,182 @@
+"""Two-tier cache for generated AI responses.
+
+The exact tier maps a digest of the request inputs to the response in a
+bounded LRU.  The optional semantic tier keeps the question embedding next to
+each entry so paraphrased questions within the same scope (interview level,
+company, resume) can reuse an earlier answer when cosine similarity is high.
+An optional SQLite file keeps entries across restarts; the newest rows are
+loaded back into the LRU when the cache is opened.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Thread-safe LRU of responses with an embedding-similarity fallback."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        similarity_threshold: float = 0.95,
+        cache_dir: Optional[str] = None,
+        max_rows: int = 5000,
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.max_rows = max_rows
+        self._entries: "OrderedDict[bytes, Tuple[str, Optional[bytes], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._disk = self._open_disk(cache_dir) if cache_dir and max_entries > 0 else None
+
+    def _open_disk(self, cache_dir: str) -> Optional[sqlite3.Connection]:
+        """Open the on-disk tier, trim it to ``max_rows`` and warm the LRU from it."""
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(cache_dir, "responses.sqlite"), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, response TEXT, scope BLOB, embedding BLOB, ts REAL)"
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY ts DESC LIMIT ?)",
+                (self.max_rows,)
+            )
+            conn.commit()
+            rows = conn.execute(
+                "SELECT key, response, scope, embedding FROM responses ORDER BY ts DESC LIMIT ?",
+                (self.max_entries,)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Response disk cache unavailable: {e}")
+            return None
+        for key, response, scope, blob in reversed(rows):
+            vector = np.frombuffer(blob, dtype=np.float32) if blob is not None and NUMPY_AVAILABLE else None
+            self._entries[key] = (response, scope, vector)
+        return conn
+
+    @staticmethod
+    def make_key(*parts: Any) -> bytes:
+        """Build a compact digest from the request inputs."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(str(part).encode("utf-8", "replace"))
+            digest.update(b"\x1f")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached response for an exact key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT response, scope, embedding FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    vector = np.frombuffer(row[2], dtype=np.float32) if row[2] is not None and NUMPY_AVAILABLE else None
+                    entry = (row[0], row[1], vector)
+                    self._store(key, entry)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def has_embeddings(self, scope: bytes) -> bool:
+        """Return True when ``scope`` has entries a semantic lookup could match."""
+        if not NUMPY_AVAILABLE:
+            return False
+        with self._lock:
+            return any(entry[1] == scope and entry[2] is not None for entry in self._entries.values())
+
+    def get_similar(self, embedding: Optional[Sequence[float]], scope: bytes) -> Optional[str]:
+        """Return the closest cached response in ``scope`` above the similarity threshold."""
+        if embedding is None or not NUMPY_AVAILABLE:
+            return None
+
+        query = self._normalize(embedding)
+        with self._lock:
+            candidates = [
+                (key, entry) for key, entry in self._entries.items()
+                if entry[1] == scope and entry[2] is not None
+            ]
+            if not candidates:
+                return None
+
+            matrix = np.stack([entry[2] for _, entry in candidates])
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if float(scores[best]) < self.similarity_threshold:
+                return None
+
+            key, entry = candidates[best]
+            self._entries.move_to_end(key)
+            self.hits += 1
+            logger.debug("Semantic cache hit (similarity %.3f)", float(scores[best]))
+            return entry[0]
+
+    def put(
+        self,
+        key: bytes,
+        response: str,
+        embedding: Optional[Sequence[float]] = None,
+        scope: Optional[bytes] = None,
+    ) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        vector = self._normalize(embedding) if embedding is not None and NUMPY_AVAILABLE else None
+        with self._lock:
+            self._store(key, (response, scope, vector))
+            if self._disk is None:
+                return
+            try:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, scope, embedding, ts) VALUES (?, ?, ?, ?, ?)",
+                    (key, response, scope, vector.tobytes() if vector is not None else None, time.time())
+                )
+                self._disk.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Failed to persist cached response: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached response from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM responses")
+                self._disk.commit()
+
+    def _store(self, key: bytes, entry: Tuple[str, Optional[bytes], Any]) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
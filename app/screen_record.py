@@ -357,12 +357,14 @@ def get_recording_path(session_id: str) -> Optional[str]:
         return None
 
 
-def record_screen(session_id: str, duration: Optional[int] = None) -> str:
+def record_screen(session_id: str, duration: Optional[int] = None,
+                  stop_event: Optional[threading.Event] = None) -> str:
     """Record the screen during a session.
 
     Args:
         session_id: Identifier for the session (e.g. meeting ID or timestamp).
         duration: Recording duration in seconds. If None, records until stopped.
+        stop_event: Ends the recording early when set (from another thread).
 
     Returns:
         Path to the recorded screen video file.
@@ -378,13 +380,15 @@ def record_screen(session_id: str, duration: Optional[int] = None) -> str:
         os.makedirs(Config.RECORDINGS_DIR, exist_ok=True)
         recorder.start_recording(video_path)
         
+        if stop_event is None:
+            stop_event = threading.Event()
         if duration:
             logger.info(f"Recording screen for {duration} seconds...")
-            time.sleep(duration)
+            stop_event.wait(duration)
         else:
             logger.info("Recording screen. Press Ctrl+C to stop...")
-            while True:
-                time.sleep(1)
+            while not stop_event.wait(1):
+                pass
                 
     except KeyboardInterrupt:
         logger.info("Screen recording interrupted by user")
@@ -7,13 +7,35 @@ about the content.
 from __future__ import annotations
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional
 
 from openai import OpenAI
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Transcripts streamed as lines are summarized in windows of about this many characters
+SUMMARY_WINDOW_CHARS = 12000
+
+
+def _iter_windows(lines: Iterable[str], max_chars: int = SUMMARY_WINDOW_CHARS) -> Iterator[str]:
+    """Group transcript lines into newline-joined windows of at most ``max_chars``.
+
+    Only one window is held in memory at a time; a single line longer than
+    ``max_chars`` becomes its own window.
+    """
+    window: List[str] = []
+    size = 0
+    for line in lines:
+        if window and size + len(line) + 1 > max_chars:
+            yield "\n".join(window)
+            window = []
+            size = 0
+        window.append(line)
+        size += len(line) + 1
+    if window:
+        yield "\n".join(window)
+
 
 class SummarizationService:
     """Service for text summarization and Q&A using OpenAI GPT."""
@@ -50,6 +72,31 @@ class SummarizationService:
             logger.error(f"Summary generation failed: {str(e)}")
             return f"Summary generation failed: {str(e)}"
     
+    def summarize_lines(
+        self,
+        lines: Iterable[str],
+        summary_type: str = "meeting",
+        window_chars: int = SUMMARY_WINDOW_CHARS,
+    ) -> str:
+        """Summarize a transcript supplied as an iterable of lines.
+
+        Lines are consumed window by window instead of being joined into one
+        string. A transcript that fits in one window gets a single summary;
+        longer ones are summarized per window and the partial summaries are
+        then combined (map-reduce).
+        """
+        partials: List[str] = []
+        for window in _iter_windows(lines, window_chars):
+            logger.debug("Summarizing transcript window %d", len(partials) + 1)
+            partials.append(self.generate_summary(window, summary_type))
+        
+        if not partials:
+            return ""
+        if len(partials) == 1:
+            return partials[0]
+        
+        return self.generate_summary("\n\n".join(partials), summary_type)
+    
     def extract_action_items(self, text: str) -> List[str]:
         """Extract action items from text.
         
@@ -210,7 +257,8 @@ def summarize_transcript(transcript: Dict[str, Any]) -> str:
 
     Args:
         transcript: A dictionary with a "text" field containing the full
-            transcription and optionally a list of segments.
+            transcription (or an iterable of transcript lines, which is
+            summarized window by window) and optionally a list of segments.
 
     Returns:
         A human-readable summary of the meeting.
@@ -218,12 +266,17 @@ def summarize_transcript(transcript: Dict[str, Any]) -> str:
     logger.info("Summarizing transcript")
     
     text = transcript.get("text", "")
-    if not text or text.strip() == "":
+    if not text or (isinstance(text, str) and not text.strip()):
         return "No transcript text available to summarize."
     
     try:
         service = SummarizationService()
-        summary = service.generate_summary(text, "meeting")
+        if isinstance(text, (str, bytes, Mapping)) or not isinstance(text, Iterable):
+            summary = service.generate_summary(str(text), "meeting")
+        else:
+            summary = service.summarize_lines(text, "meeting")
+            if not summary:
+                return "No transcript text available to summarize."
         logger.debug("Summary generated: %s", summary[:100] + "...")
         return summary
         
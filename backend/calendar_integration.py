@@ -28,6 +28,16 @@ MEETING_PLATFORM_PATTERNS = [
     "bluejeans.com",
 ]
 
+# Platform aliases (casefolded) -> client that can mint a meeting link
+MEETING_LINK_CLIENTS = {
+    "zoom": ZoomClient,
+    "google": GoogleMeetClient,
+    "google_meet": GoogleMeetClient,
+    "meet": GoogleMeetClient,
+    "teams": TeamsClient,
+    "microsoft_teams": TeamsClient,
+}
+
 @dataclass
 class CalendarEvent:
     """Represents a calendar event with meeting context"""
@@ -587,13 +597,9 @@ class CalendarIntegration:
         return event
 
     def _create_meeting_link(self, platform: str) -> str:
-        platform = platform.lower()
-        if platform in ("zoom",):
-            return ZoomClient.generate_meeting_link()
-        if platform in ("google", "google_meet", "meet"):
-            return GoogleMeetClient.generate_meeting_link()
-        if platform in ("teams", "microsoft_teams"):
-            return TeamsClient.generate_meeting_link()
+        client = MEETING_LINK_CLIENTS.get(platform.casefold())
+        if client is not None:
+            return client.generate_meeting_link()
         return f"https://meet.example.com/{uuid.uuid4().hex}"
     
     
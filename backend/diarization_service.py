@@ -117,12 +117,11 @@ class DiarizationService:
         return None
 
     def _load_audio(self, audio_path: str) -> Tuple[np.ndarray, int]:
-        """Load mono audio as float32 numpy array."""
+        """Load mono audio as an int16 PCM numpy array (no copy of the frames)."""
         with wave.open(audio_path, "rb") as wf:
             sr = wf.getframerate()
             pcm = wf.readframes(wf.getnframes())
-        audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
-        return audio, sr
+        return np.frombuffer(pcm, dtype=np.int16), sr
 
     def _detect_voice_segments(
         self, audio: np.ndarray, sr: int, frame_ms: int = 30, energy_thresh: float = 0.0005
@@ -152,13 +151,12 @@ class DiarizationService:
             segments.append((start, len(audio) / sr))
         return segments
 
-    def _save_wav(self, path: str, audio: np.ndarray, sr: int) -> None:
-        pcm = (audio * 32767).astype("<i2")
+    def _save_wav(self, path: str, pcm: np.ndarray, sr: int) -> None:
         with wave.open(path, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(sr)
-            wf.writeframes(pcm.tobytes())
+            wf.writeframes(pcm.astype("<i2", copy=False).tobytes())
 
     def process_audio_file(self, audio_path: str) -> List[Dict[str, Any]]:
         """
@@ -167,11 +165,14 @@ class DiarizationService:
         :return: list of {speaker, text, start, end}
         """
         log.info(f"[DiarizationService] Processing {audio_path} on {self.device}...")
-        audio, sr = self._load_audio(audio_path)
+        pcm, sr = self._load_audio(audio_path)
+        # Float samples are only needed for the energy VAD; segments are cut from the PCM
+        audio = pcm.astype(np.float32) / 32768.0
         voice_segments = self._detect_voice_segments(audio, sr)
+        del audio
         results: List[Dict[str, Any]] = []
         for i, (start, end) in enumerate(voice_segments):
-            segment_audio = audio[int(start * sr) : int(end * sr)]
+            segment_audio = pcm[int(start * sr) : int(end * sr)]
             text = ""
             if self.model is not None and len(segment_audio) > 0:
                 with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
@@ -9,12 +9,26 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     chromadb = None  # type: ignore[assignment]
     Settings = None  # type: ignore[assignment]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import logging
 
 log = logging.getLogger(__name__)
 
+
+def _dumps(value: Any) -> str:
+    """Serialize a memory record, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
+
 class MemoryService:
     """
     Persistent memory for meetings, tasks, and user/project context.
@@ -165,6 +179,40 @@ class MemoryService:
         if persist:
             self._save_summary(meeting_id, text, metadata)
 
+    def add_meeting_entries(
+        self,
+        meeting_id: str,
+        entries: List[Tuple[str, Optional[Dict]]],
+        persist: bool = True,
+    ):
+        """Add several ``(text, metadata)`` meeting entries with one write per store."""
+        if not entries:
+            return
+        stamp = datetime.now().isoformat()
+        if self.client:
+            self.meeting_collection.add(
+                documents=[text for text, _ in entries],
+                metadatas=[metadata or {} for _, metadata in entries],
+                ids=[f"meeting_{meeting_id}_{stamp}_{i}" for i in range(len(entries))]
+            )
+        else:
+            # Fallback to SQLite: one transaction for the batch
+            self.conn.executemany(
+                "INSERT INTO memory (category, timestamp, data) VALUES (?, ?, ?)",
+                [
+                    ("meeting", stamp, _dumps({"meeting_id": meeting_id, "text": text, **(metadata or {})}))
+                    for text, metadata in entries
+                ],
+            )
+            self.conn.commit()
+
+        if persist:
+            self.doc_conn.executemany(
+                "INSERT INTO summaries (meeting_id, summary, metadata, created_at) VALUES (?, ?, ?, ?)",
+                [(meeting_id, text, _dumps(metadata or {}), stamp) for text, metadata in entries],
+            )
+            self.doc_conn.commit()
+
     def search_meeting_context(self, query: str, n_results: int = 3):
         """Search for relevant meeting context"""
         if self.client:
@@ -0,0 +1,54 @@
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.capture import BaseCaptionClient
+from app.realtime import RealtimeSession
+from backend.memory_service import MemoryService
+
+
+def test_streamed_captions_are_batched_into_memory(tmp_path, monkeypatch):
+    monkeypatch.setenv("MENTOR_DB_PATH", str(tmp_path / "memory.db"))
+    monkeypatch.setenv("DOCUMENTATION_DB_PATH", str(tmp_path / "docs.db"))
+    memory = MemoryService()
+    if memory.client is not None:
+        memory.client = None  # exercise the SQLite path even when chromadb is installed
+        memory.conn = sqlite3.connect(str(tmp_path / "memory.db"))
+        memory._init_fallback_db()
+
+    session = RealtimeSession("meeting-1", memory=memory, meeting_type="standup")
+    batches = []
+    add_captions = session.add_captions
+    monkeypatch.setattr(session, "add_captions", lambda captions: (batches.append(len(captions)), add_captions(captions)))
+    client_queue = session.add_client_queue("overlay")
+    manager = SimpleNamespace(get_session=lambda session_id: session if session_id == "meeting-1" else None)
+
+    captions = tmp_path / "captions.txt"
+    captions.write_text("first line\n\n  \nsecond line\nthird line\nfourth line\nfifth line", encoding="utf-8")
+    BaseCaptionClient("meeting-1", str(captions), manager=manager).stream_captions(delay=0, batch_size=2)
+
+    # Blank lines are skipped; everything was due at once, so only the batch size splits it
+    assert batches == [2, 2, 1]
+    assert [c["text"] for c in session.caption_buffer] == [
+        "first line", "second line", "third line", "fourth line", "fifth line"
+    ]
+    assert [c["id"] for c in session.caption_buffer][:2] == ["meeting-1_1", "meeting-1_4"]
+
+    # Captions are stored, not pushed: connected clients only hear about answers
+    assert client_queue.empty()
+
+    rows = memory.conn.execute("SELECT category, data FROM memory ORDER BY id").fetchall()
+    assert [row[0] for row in rows] == ["meeting"] * 5
+    first = json.loads(rows[0][1])
+    assert first["meeting_id"] == "meeting-1" and first["text"] == "first line"
+    assert first["meeting_type"] == "standup" and first["speaker"] == "unknown"
+
+    summaries = memory.doc_conn.execute("SELECT meeting_id, summary FROM summaries ORDER BY id").fetchall()
+    assert summaries == [("meeting-1", text) for text in
+                         ["first line", "second line", "third line", "fourth line", "fifth line"]]
@@ -0,0 +1,165 @@
+import os
+import sys
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+np = pytest.importorskip("numpy")
+
+from app import capture
+from app.config import Config
+
+
+class FakeSoundDevice:
+    """Stands in for sounddevice: a blocking stream that yields a constant tone."""
+
+    class InputStream:
+        def __init__(self, samplerate, channels, blocksize, dtype, **kwargs):
+            self.rate, self.channels, self.blocksize = samplerate, channels, blocksize
+
+        def read(self, frames):
+            time.sleep(frames / self.rate / 4)
+            return np.full((frames, self.channels), 100, dtype=np.int16), False
+
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+        def close(self):
+            pass
+
+
+@pytest.fixture
+def fake_audio(monkeypatch, tmp_path):
+    monkeypatch.setattr(capture, "sd", FakeSoundDevice())
+    monkeypatch.setattr(capture, "np", np)
+    monkeypatch.setattr(capture, "AUDIO_AVAILABLE", True)
+    monkeypatch.setattr(capture, "_CAPTURE_DAEMONS", {})
+    monkeypatch.setattr(Config, "SAMPLE_RATE", 8000)
+    monkeypatch.setattr(Config, "CHANNELS", 1)
+    monkeypatch.setattr(Config, "CHUNK_SIZE", 400)
+    monkeypatch.setattr(Config, "TEMP_DIR", str(tmp_path / "spool"))
+    monkeypatch.setattr(Config, "GAIN_MULTIPLIER", 1.0)
+    return tmp_path
+
+
+def _record(recorder, seconds, **kwargs):
+    recorder.start_recording(**kwargs)
+    time.sleep(seconds)
+
+
+def _read_wav(path):
+    with wave.open(str(path), "rb") as wf:
+        frames = wf.readframes(wf.getnframes())
+        return wf.getframerate(), wf.getnchannels(), np.frombuffer(frames, dtype=np.int16)
+
+
+def test_spooled_recording_with_gain_is_finalized(fake_audio, monkeypatch):
+    monkeypatch.setattr(Config, "GAIN_MULTIPLIER", 2.0)
+    recorder = capture.AudioRecorder()
+    _record(recorder, 0.2)
+    spool_path = recorder._spool.path
+    out = fake_audio / "spooled.wav"
+    recorder.stop_recording(str(out))
+
+    rate, channels, samples = _read_wav(out)
+    assert (rate, channels) == (8000, 1)
+    assert len(samples) > 0 and len(samples) % 400 == 0
+    assert set(samples.tolist()) == {200}
+    # The spool became the recording: cut to the samples, no leftover part file
+    assert out.stat().st_size == 44 + 2 * len(samples)
+    assert not Path(spool_path).exists()
+
+
+def test_spool_refuses_to_finalize_under_a_live_view(fake_audio, tmp_path):
+    spool = capture._SpoolFile(str(tmp_path), block_frames=1024, channels=1)
+    view = spool.new_block()
+    with pytest.raises(BufferError):
+        spool.finalize(str(tmp_path / "out.wav"), b"\0" * 44, 0)
+    # Nothing was truncated under the mapping, so the view is still usable
+    view[:] = 1
+    assert int(view.sum()) == 1024
+
+
+def test_streamed_recording_checkpoints_and_finalizes(fake_audio):
+    out = fake_audio / "streamed.wav"
+    recorder = capture.AudioRecorder()
+    _record(recorder, 0.2, output_path=str(out))
+
+    # A checkpoint makes the partial file a valid WAV without stopping
+    recorder.flush_partial()
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        time.sleep(0.02)
+        if out.stat().st_size > 44 and _read_wav(out)[2].size:
+            break
+    assert _read_wav(out)[2].size > 0
+
+    recorder.stop_recording(str(out))
+    rate, channels, samples = _read_wav(out)
+    assert (rate, channels) == (8000, 1)
+    assert len(samples) % 400 == 0 and set(samples.tolist()) == {100}
+    assert out.stat().st_size == 44 + 2 * len(samples)
+
+
+def test_recorders_share_one_capture_stream(fake_audio):
+    first, second = capture.AudioRecorder(), capture.AudioRecorder()
+    first.start_recording(output_path=str(fake_audio / "a.wav"))
+    second.start_recording(output_path=str(fake_audio / "b.wav"))
+    daemon = capture._get_capture_daemon(8000, 1)
+    assert len(daemon._subscribers) == 2
+    time.sleep(0.1)
+
+    first.stop_recording(str(fake_audio / "a.wav"))
+    assert daemon._stream is not None and len(daemon._subscribers) == 1
+    time.sleep(0.1)
+    second.stop_recording(str(fake_audio / "b.wav"))
+    assert daemon._stream is None and daemon._pump is None
+
+    # The second recorder kept capturing after the first one left
+    assert len(_read_wav(fake_audio / "b.wav")[2]) > len(_read_wav(fake_audio / "a.wav")[2]) > 0
+
+
+def test_spool_discard_removes_the_file(fake_audio, tmp_path):
+    spool = capture._SpoolFile(str(tmp_path), block_frames=1024, channels=1)
+    spool.new_block()
+    spool.discard()
+    assert not Path(spool.path).exists()
+
+
+def test_encoded_target_falls_back_to_wav_without_ffmpeg(fake_audio, monkeypatch):
+    monkeypatch.setattr(capture, "_find_ffmpeg", lambda: None)
+    monkeypatch.setattr(Config, "RECORDING_FORMAT", "opus")
+    assert capture._recording_extension() == "wav"
+
+    out = fake_audio / "meeting.opus"
+    recorder = capture.AudioRecorder()
+    _record(recorder, 0.1)
+    recorder.stop_recording(str(out))
+    # No encoder: the samples are still saved, as WAV, at the requested path
+    assert len(_read_wav(out)[2]) > 0
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake ffmpeg is a shell script")
+def test_ffmpeg_failure_reports_its_stderr(fake_audio, monkeypatch, caplog):
+    ffmpeg = fake_audio / "ffmpeg"
+    ffmpeg.write_text("#!/bin/sh\ncat > /dev/null\necho 'Unknown encoder libopus' >&2\nexit 1\n")
+    ffmpeg.chmod(0o755)
+    monkeypatch.setattr(capture, "_find_ffmpeg", lambda: str(ffmpeg))
+
+    out = fake_audio / "meeting.opus"
+    recorder = capture.AudioRecorder()
+    _record(recorder, 0.1, output_path=str(out))
+    with caplog.at_level("ERROR", logger=capture.logger.name):
+        recorder.stop_recording(str(out))
+
+    assert not recorder._writer_ok
+    assert "Unknown encoder libopus" in caplog.text
@@ -0,0 +1,55 @@
+import asyncio
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.code_intelligence import CodeAnalyzer, CodeQuality
+
+
+def test_unchanged_files_are_served_from_cache(tmp_path, monkeypatch):
+    source = tmp_path / "sample.py"
+    source.write_text("def test_x():\n    # TODO: cover more\n    print('x')\n", encoding="utf-8")
+    cache_dir = str(tmp_path / "cache")
+
+    first = asyncio.run(CodeAnalyzer(cache_dir=cache_dir).analyze_file(str(source)))
+    assert first is not None
+
+    # A fresh analyzer reads the disk tier and never re-runs the patterns
+    analyzer = CodeAnalyzer(cache_dir=cache_dir)
+    def fail(*args):
+        raise AssertionError("patterns re-ran on a cache hit")
+
+    monkeypatch.setattr(analyzer, "_calculate_complexity", fail)
+    cached = asyncio.run(analyzer.analyze_file(str(source)))
+    # Same findings, but each hit is stamped as its own analysis
+    assert replace(cached, analysis_id=first.analysis_id, analyzed_at=first.analyzed_at) == first
+    assert cached.analysis_id != first.analysis_id
+    assert isinstance(cached.quality, CodeQuality)
+
+    # Editing the file invalidates the entry
+    monkeypatch.undo()
+    source.write_text("x = 1\n", encoding="utf-8")
+    changed = asyncio.run(analyzer.analyze_file(str(source)))
+    assert changed.issues == []
+    assert changed != first
+
+
+def test_cache_hits_are_independent_copies(tmp_path, monkeypatch):
+    source = tmp_path / "sample.py"
+    source.write_text("def test_x():\n    # TODO: cover more\n    print('x')\n", encoding="utf-8")
+    analyzer = CodeAnalyzer(cache_dir="")
+
+    first = asyncio.run(analyzer.analyze_file(str(source)))
+    first.issues.clear()
+    first.suggestions.append("mutated by caller")
+
+    monkeypatch.chdir(tmp_path)
+    again = asyncio.run(analyzer.analyze_file("sample.py"))
+    assert again.file_path == "sample.py"
+    assert again.analysis_id != first.analysis_id
+    assert again.issues
+    assert "mutated by caller" not in again.suggestions
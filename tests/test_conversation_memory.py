@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+ai_assistant = pytest.importorskip("app.ai_assistant")
+
+
+def _entry(content):
+    return ai_assistant.ConversationEntry(
+        timestamp="2024-01-01T00:00:00",
+        meeting_id="m1",
+        speaker="alice",
+        content=content,
+        type="speech",
+        context={},
+        sentiment="neutral",
+        importance=5,
+    )
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_rescore_session_scores_every_entry(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(ai_assistant, "NUMPY_AVAILABLE", use_numpy)
+
+    memory = ai_assistant.ConversationMemory.__new__(ai_assistant.ConversationMemory)
+    memory.sessions, memory.active_session, memory.kb = {}, None, None
+    memory.start_session("m1", {})
+    for content in (
+        "Great work, I love this design",
+        "This is a terrible problem and I'm confused",
+        "Decision: the deadline is critical, add an action item",
+        "Good point but there is an issue",
+    ):
+        memory.sessions["m1"].conversations.append(_entry(content))
+
+    stats = memory.rescore_session("m1")
+
+    entries = memory.sessions["m1"].conversations
+    assert [e.sentiment for e in entries] == ["positive", "negative", "neutral", "neutral"]
+    assert [e.importance for e in entries] == [5, 5, 10, 5]
+    assert all(type(e.importance) is int for e in entries)
+    assert stats == {
+        "entries": 4,
+        "sentiment": {"negative": 1, "neutral": 2, "positive": 1},
+        "average_importance": 6.25,
+    }
+    assert memory.rescore_session("missing") == {}
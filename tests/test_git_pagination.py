@@ -0,0 +1,82 @@
+import asyncio
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app import code_intelligence
+from app.code_intelligence import GitIntegration
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def merged_repo(tmp_path):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    pytest.importorskip("git")
+    _git(tmp_path, "init", "-q", "-b", "main")
+    for i in range(3):
+        _git(tmp_path, "commit", "-q", "--allow-empty", "-m", f"main {i}")
+    _git(tmp_path, "checkout", "-q", "-b", "feature", "HEAD~2")
+    for i in range(3):
+        _git(tmp_path, "commit", "-q", "--allow-empty", "-m", f"feature {i}")
+    _git(tmp_path, "checkout", "-q", "main")
+    _git(tmp_path, "merge", "-q", "--no-ff", "-m", "merge feature", "feature")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "after merge")
+    return tmp_path
+
+
+def test_pages_cover_history_with_merges(merged_repo):
+    git = GitIntegration(str(merged_repo))
+    full = asyncio.run(git.get_recent_commits("main", limit=100))
+    assert len(full) == 8
+
+    paged, after = [], None
+    while True:
+        page = asyncio.run(git.get_recent_commits("main", limit=2, after=after))
+        if not page:
+            break
+        paged.extend(page)
+        after = page[-1]["cursor"]
+
+    assert [c["hash"] for c in paged] == [c["hash"] for c in full]
+
+    # The cursor pins the original tip, so new commits do not shift later pages
+    _git(merged_repo, "commit", "-q", "--allow-empty", "-m", "new work")
+    second = asyncio.run(git.get_recent_commits("main", limit=2, after=full[1]["cursor"]))
+    assert [c["hash"] for c in second] == [c["hash"] for c in full[2:4]]
+
+
+def test_rejects_malformed_cursor(merged_repo):
+    git = GitIntegration(str(merged_repo))
+    assert asyncio.run(git.get_recent_commits("main", after="--all")) == []
+
+
+def test_old_git_pages_first_parent_history(merged_repo, monkeypatch):
+    monkeypatch.setattr(code_intelligence, "_git_has_diff_merges", lambda: False)
+    git = GitIntegration(str(merged_repo))
+    full = asyncio.run(git.get_recent_commits("main", limit=100))
+    assert [c["message"] for c in full] == ["after merge", "merge feature", "main 2", "main 1", "main 0"]
+
+    page = asyncio.run(git.get_recent_commits("main", limit=2, after=full[1]["cursor"]))
+    assert [c["hash"] for c in page] == [c["hash"] for c in full[2:4]]
+
+
+def test_non_repository_is_not_queried(tmp_path, monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("git ran outside a repository")
+
+    monkeypatch.setattr(code_intelligence, "_run_git", fail)
+    assert asyncio.run(GitIntegration(str(tmp_path)).get_recent_commits()) == []
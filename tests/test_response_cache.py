@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.response_cache import ResponseCache
+
+
+def test_exact_hits_and_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    first = ResponseCache.make_key("IC6", "Meta", "Design a cache")
+    second = ResponseCache.make_key("IC6", "Meta", "Design a queue")
+    third = ResponseCache.make_key("IC6", "Meta", "Design a feed")
+
+    cache.put(first, "cache answer")
+    cache.put(second, "queue answer")
+    assert cache.get(first) == "cache answer"
+
+    cache.put(third, "feed answer")
+    assert cache.get(second) is None
+    assert cache.get(first) == "cache answer"
+    assert cache.get(third) == "feed answer"
+    assert len(cache) == 2
+
+
+def test_semantic_lookup_is_scoped_and_thresholded():
+    pytest.importorskip("numpy")
+    cache = ResponseCache(similarity_threshold=0.95)
+    scope = ResponseCache.make_key("IC6", "Meta", "resume")
+    other_scope = ResponseCache.make_key("E5", "Google", "resume")
+
+    cache.put(ResponseCache.make_key(scope, "q1"), "answer", embedding=[1.0, 0.0, 0.0], scope=scope)
+
+    assert cache.get_similar([0.99, 0.05, 0.0], scope) == "answer"
+    assert cache.get_similar([0.99, 0.05, 0.0], other_scope) is None
+    assert cache.get_similar([0.0, 1.0, 0.0], scope) is None
+    assert cache.get_similar(None, scope) is None
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    pytest.importorskip("numpy")
+    scope = ResponseCache.make_key("IC6", "Meta", "resume")
+    key = ResponseCache.make_key(scope, "design a cache")
+    ResponseCache(cache_dir=str(tmp_path)).put(key, "answer", embedding=[1.0, 0.0], scope=scope)
+
+    reopened = ResponseCache(cache_dir=str(tmp_path))
+    assert reopened.get(key) == "answer"
+    assert reopened.has_embeddings(scope)
+    assert reopened.get_similar([0.99, 0.05], scope) == "answer"
+
+    # Rows evicted from the in-memory LRU are still read back from disk
+    small = ResponseCache(max_entries=1, cache_dir=str(tmp_path))
+    small.put(ResponseCache.make_key(scope, "other"), "other answer")
+    assert small.get(key) == "answer"
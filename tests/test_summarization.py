@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app import summarization
+from app.summarization import SummarizationService, _iter_windows, summarize_transcript
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(summarization.Config, "OPENAI_API_KEY", "test-key")
+    svc = SummarizationService()
+    calls = []
+
+    def fake_summary(text, summary_type="meeting"):
+        calls.append(text)
+        return f"summary {len(calls)}"
+
+    monkeypatch.setattr(svc, "generate_summary", fake_summary)
+    svc.calls = calls
+    return svc
+
+
+def test_windows_break_before_overflowing_line():
+    # Each line costs its length plus the joining newline
+    lines = ["aaaa", "bbbb", "cccc", "dddd"]
+    assert list(_iter_windows(lines, max_chars=10)) == ["aaaa\nbbbb", "cccc\ndddd"]
+    assert list(_iter_windows(lines, max_chars=9)) == ["aaaa", "bbbb", "cccc", "dddd"]
+    # A line longer than the window still becomes a window of its own
+    assert list(_iter_windows(["x" * 20, "y"], max_chars=10)) == ["x" * 20, "y"]
+    assert list(_iter_windows([], max_chars=10)) == []
+
+
+def test_single_window_is_summarized_once(service):
+    assert service.summarize_lines(["alice: hi", "bob: hello"], window_chars=100) == "summary 1"
+    assert service.calls == ["alice: hi\nbob: hello"]
+
+
+def test_multiple_windows_are_reduced(service):
+    lines = (f"line {i}" for i in range(6))  # any iterable, consumed once
+    assert service.summarize_lines(lines, window_chars=14) == "summary 4"
+    assert service.calls[:3] == ["line 0\nline 1", "line 2\nline 3", "line 4\nline 5"]
+    assert service.calls[3] == "summary 1\n\nsummary 2\n\nsummary 3"
+
+
+def test_empty_input_makes_no_requests(service):
+    assert service.summarize_lines(iter(())) == ""
+    assert service.calls == []
+
+
+def test_transcript_guard_and_line_iterables(service, monkeypatch):
+    monkeypatch.setattr(summarization, "SummarizationService", lambda: service)
+    for empty in (None, "", "   ", []):
+        assert summarize_transcript({"text": empty}) == "No transcript text available to summarize."
+    assert summarize_transcript({"text": iter(["a: one", "b: two"])}) == "summary 1"
+    assert service.calls == ["a: one\nb: two"]